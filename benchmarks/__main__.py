@@ -0,0 +1,66 @@
+import argparse
+import datetime
+import json
+import pathlib
+import platform
+import subprocess
+
+from benchmarks import suite
+
+RESULTS_DIRECTORY = pathlib.Path(__file__).parent / 'results'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run jsonapi-requests benchmarks.')
+    parser.add_argument('--resources', type=int, default=1000, help='primary resources in generated documents')
+    parser.add_argument('--include-depth', type=int, default=1, help='levels of included resources')
+    parser.add_argument('--fan-out', type=int, default=2, help='related resources per to-many relationship')
+    parser.add_argument('--requests', type=int, default=200, help='requests in throughput benchmarks')
+    parser.add_argument('--repeat', type=int, default=5, help='runs of every benchmark, best one is kept')
+    parser.add_argument('--name', help='name of stored results, current commit by default')
+    parser.add_argument('--compare', help='name of stored results to compare with')
+    arguments = parser.parse_args()
+    results = {
+        'commit': get_commit(),
+        'date': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'parameters': {
+            'resources': arguments.resources,
+            'include_depth': arguments.include_depth,
+            'fan_out': arguments.fan_out,
+            'requests': arguments.requests,
+        },
+        'benchmarks': suite.run_all(
+            arguments.resources, arguments.include_depth, arguments.fan_out, arguments.requests, arguments.repeat),
+    }
+    RESULTS_DIRECTORY.mkdir(exist_ok=True)
+    path = RESULTS_DIRECTORY / '{}.json'.format(arguments.name or results['commit'])
+    path.write_text(json.dumps(results, indent=2) + '\n')
+    baseline = load(arguments.compare) if arguments.compare else None
+    print_results(results, baseline)
+    print('Results stored in {}'.format(path))
+
+
+def get_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, check=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def load(name):
+    return json.loads((RESULTS_DIRECTORY / '{}.json'.format(name)).read_text())
+
+
+def print_results(results, baseline=None):
+    for name, result in results['benchmarks'].items():
+        line = '{:<32}{:>14.2f} {}'.format(name, result['value'], result['unit'])
+        if baseline is not None and name in baseline['benchmarks']:
+            previous = baseline['benchmarks'][name]['value']
+            line += '  ({:+.1f}% vs {})'.format((result['value'] - previous) / previous * 100, baseline['commit'])
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+def make_document(resources, include_depth=1, fan_out=2):
+    return {
+        'data': [make_resource(0, index, include_depth, fan_out, resources) for index in range(resources)],
+        'included': [
+            make_resource(level, index, include_depth, fan_out, resources)
+            for level in range(1, include_depth + 1)
+            for index in range(resources)
+        ],
+        'meta': {'total': resources},
+    }
+
+
+def make_resource(level, index, include_depth, fan_out, resources):
+    resource = {
+        'type': get_type(level),
+        'id': str(index),
+        'attributes': {
+            'name': 'resource {} of level {}'.format(index, level),
+            'position': index,
+            'tags': ['level-{}'.format(level), 'even' if index % 2 == 0 else 'odd'],
+            'details': {'created': '2024-01-01T00:00:00Z', 'active': index % 3 != 0},
+        },
+        'links': {'self': '/{}/{}'.format(get_type(level), index)},
+    }
+    if level < include_depth:
+        resource['relationships'] = {
+            'children': {
+                'data': [
+                    {'type': get_type(level + 1), 'id': str((index * fan_out + offset) % resources)}
+                    for offset in range(fan_out)
+                ],
+            },
+            'parent': {'data': {'type': get_type(level + 1), 'id': str(index)}},
+        }
+    return resource
+
+
+def get_type(level):
+    return 'resource{}'.format(level)
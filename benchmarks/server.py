@@ -0,0 +1,50 @@
+import http.server
+import json
+import threading
+
+from urllib import parse
+
+
+class StubServer:
+    def __init__(self, documents):
+        self.documents = {path.strip('/'): json.dumps(document).encode() for path, document in documents.items()}
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), self.make_handler())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.server.server_address
+        return 'http://{}:{}/'.format(host, port)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def make_handler(self):
+        documents = self.documents
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                body = documents.get(parse.urlsplit(self.path).path.strip('/'))
+                if body is None:
+                    self.send_response(404)
+                    body = b'{"errors": [{"status": "404"}]}'
+                else:
+                    self.send_response(200)
+                self.send_header('Content-Type', 'application/vnd.api+json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
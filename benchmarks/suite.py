@@ -0,0 +1,145 @@
+import gc
+import json
+import time
+import tracemalloc
+
+from benchmarks import dataset
+from benchmarks import server
+from jsonapi_requests import base
+from jsonapi_requests import data
+from jsonapi_requests import orm
+
+SMALL_DOCUMENT = {'data': {'type': 'resource0', 'id': '1', 'attributes': {'name': 'small'}}}
+
+
+def run_all(resources=1000, include_depth=1, fan_out=2, requests=200, repeat=5):
+    document = dataset.make_document(resources, include_depth, fan_out)
+    total_resources = resources * (include_depth + 1)
+    results = {}
+    with server.StubServer({'small': SMALL_DOCUMENT, 'collection': document}) as stub_server:
+        results['request_throughput'] = {
+            'value': requests / best_of(repeat, request_sequentially, stub_server.url, requests),
+            'unit': 'requests/s',
+        }
+        results['concurrent_request_throughput'] = {
+            'value': requests / best_of(repeat, request_concurrently, stub_server.url, requests),
+            'unit': 'requests/s',
+        }
+        results['collection_request'] = {
+            'value': best_of(repeat, request_collection, stub_server.url) / total_resources * 1e6,
+            'unit': 'us/resource',
+        }
+    results['parse'] = {
+        'value': best_of(repeat, parse, document) / total_resources * 1e6,
+        'unit': 'us/resource',
+    }
+    content = parse(document)
+    results['orm_hydration'] = {
+        'value': best_of(repeat, hydrate, content, include_depth) / total_resources * 1e6,
+        'unit': 'us/resource',
+    }
+    objects = hydrate(content, include_depth)
+    results['relationship_traversal'] = {
+        'value': best_of(repeat, traverse, objects, include_depth) / total_resources * 1e6,
+        'unit': 'us/resource',
+    }
+    results['memory'] = {
+        'value': measure_memory(dataset.make_document(10000, include_depth, fan_out), include_depth),
+        'unit': 'bytes/10k resources',
+    }
+    results['record_memory'] = {
+        'value': measure_record_memory(dataset.make_document(10000, include_depth, fan_out)),
+        'unit': 'bytes/resource',
+    }
+    return results
+
+
+def best_of(repeat, function, *args):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def request_sequentially(url, requests):
+    with base.Api.config({'API_ROOT': url, 'APPEND_SLASH': False}) as api:
+        endpoint = api.endpoint('small')
+        for _ in range(requests):
+            endpoint.get()
+
+
+def request_concurrently(url, requests):
+    with base.Api.config({'API_ROOT': url, 'APPEND_SLASH': False}) as api:
+        api.endpoint('small').get_many([{} for _ in range(requests)])
+
+
+def request_collection(url):
+    with base.Api.config({'API_ROOT': url, 'APPEND_SLASH': False, 'TIMEOUT': 30}) as api:
+        api.endpoint('collection').get().content
+
+
+def parse(document):
+    content = data.JsonApiResponse.from_data(document)
+    list(content.data)
+    list(content.included)
+    return content
+
+
+def make_models(include_depth):
+    orm_api = orm.OrmApi(base.Api.config({'API_ROOT': 'http://benchmark'}))
+    models = []
+    for level in range(include_depth + 1):
+        attributes = {
+            'Meta': type('Meta', (), {'type': dataset.get_type(level), 'api': orm_api}),
+            'name': orm.AttributeField('name'),
+        }
+        if level < include_depth:
+            attributes['children'] = orm.RelationField('children')
+            attributes['parent'] = orm.RelationField('parent')
+        models.append(type('Resource{}'.format(level), (orm.ApiModel,), attributes))
+    return models
+
+
+def hydrate(content, include_depth):
+    return make_models(include_depth)[0].from_response_content(content)
+
+
+def traverse(objects, include_depth):
+    for level in range(include_depth):
+        next_objects = []
+        for object in objects:
+            object.name
+            object.parent.name
+            next_objects.extend(object.children)
+        objects = next_objects
+
+
+def measure_memory(document, include_depth):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        objects = hydrate(parse(document), include_depth)
+        gc.collect()
+        used = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    del objects
+    return used / (len(document['data']) + len(document['included'])) * 10000
+
+
+def measure_record_memory(document):
+    encoded = json.dumps(document)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        content = parse(json.loads(encoded))
+        gc.collect()
+        used = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    del content
+    return used / (len(document['data']) + len(document['included']))
@@ -0,0 +1,204 @@
+import asyncio
+import time
+
+import httpx
+import tenacity
+
+from jsonapi_requests import base
+from jsonapi_requests import configuration
+from jsonapi_requests import data
+from jsonapi_requests import deadlines
+from jsonapi_requests import events
+from jsonapi_requests import request_factory
+
+
+class AsyncApi(base.Api):
+    # noinspection PyMissingConstructor
+    def __init__(self, config: configuration.Configuration):
+        self.requests = AsyncApiRequestFactory(config)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def __enter__(self):
+        raise TypeError('Use "async with" with AsyncApi.')
+
+    async def close(self):
+        await self.requests.close()
+
+    def endpoint(self, path, use_cache=True):
+        return AsyncEndpoint(path, self.requests, use_cache=use_cache)
+
+    async def gather(self, paths, **kwargs):
+        return await self.requests.gather(request_factory.Call(path, 'GET', kwargs) for path in paths)
+
+
+class AsyncEndpoint(base.Endpoint):
+    async def get(self, **kwargs):
+        return await self.requests.get(self.path, **kwargs)
+
+    async def get_many(self, params_list, **kwargs):
+        return await self.requests.gather(
+            request_factory.Call(self.path, 'GET', dict(kwargs, params=params)) for params in params_list)
+
+    async def post(self, **kwargs):
+        return await self.requests.post(self.path, **kwargs)
+
+    async def delete(self, **kwargs):
+        return await self.requests.delete(self.path, **kwargs)
+
+    async def put(self, **kwargs):
+        return await self.requests.put(self.path, **kwargs)
+
+    async def patch(self, **kwargs):
+        return await self.requests.patch(self.path, **kwargs)
+
+
+UNSUPPORTED_SETTINGS = [
+    'TRANSPORT', 'VALIDATOR_CACHE_SIZE', 'CACHE', 'COALESCE_REQUESTS', 'HEDGE_DELAY', 'CONCURRENCY_LIMIT',
+]
+
+
+class AsyncApiRequestFactory(request_factory.ApiRequestFactory):
+    # noinspection PyMissingConstructor
+    def __init__(self, config: configuration.Configuration):
+        for setting in UNSUPPORTED_SETTINGS:
+            if getattr(config, setting) not in (None, False, 0):
+                raise ValueError('{} setting is not supported by AsyncApi.'.format(setting))
+        self.config = config
+        self.session = self._create_session()
+        self._setup_resilience()
+
+    async def __aenter__(self):
+        if self.config.PRECONNECT:
+            await self.preconnect()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def __enter__(self):
+        raise TypeError('Use "async with" with AsyncApiRequestFactory.')
+
+    async def close(self):
+        await self.session.aclose()
+
+    async def preconnect(self):
+        connections = min(int(self.config.PRECONNECT), self.config.POOL_MAXSIZE)
+        await asyncio.gather(*(self._open_connection() for _ in range(connections)))
+
+    async def _open_connection(self):
+        options = self._httpx_options(self.default_options)
+        try:
+            await self.session.head(self.config.API_ROOT, **options)
+        except httpx.TransportError:
+            pass
+
+    def _create_session(self):
+        limits = httpx.Limits(
+            max_connections=self.config.POOL_CONNECTIONS * self.config.POOL_MAXSIZE,
+            max_keepalive_connections=self.config.POOL_MAXSIZE if self.config.KEEP_ALIVE else 0,
+        )
+        return httpx.AsyncClient(verify=self.config.VALIDATE_SSL, limits=limits)
+
+    async def gather(self, calls):
+        semaphore = asyncio.Semaphore(self.config.MAX_WORKERS or self.config.POOL_MAXSIZE)
+        return await asyncio.gather(
+            *(self._request_with_semaphore(semaphore, call) for call in calls),
+            return_exceptions=True,
+        )
+
+    async def _request_with_semaphore(self, semaphore, call):
+        async with semaphore:
+            return await self.request(call.api_path, call.method, **call.kwargs)
+
+    def stream(self, api_path, **kwargs):
+        raise TypeError('Streaming is not supported by AsyncApi, use get() instead.')
+
+    def fetch_all(self, api_path, **kwargs):
+        raise TypeError('Fetching all pages is not supported by AsyncApi, use get_many() instead.')
+
+    def fetch_pages(self, api_path, **kwargs):
+        raise TypeError('Fetching all pages is not supported by AsyncApi, use get_many() instead.')
+
+    def iter_pages(self, api_path, **kwargs):
+        raise TypeError('Page iteration is not supported by AsyncApi, follow links of get() responses instead.')
+
+    async def request(self, api_path, method, *, object: data.JsonApiObject = None, use_cache=True, deadline=None,
+                      priority=None, **kwargs):
+        url = self._build_absolute_url(api_path)
+        if self.retry_budget is not None:
+            self.retry_budget.record_request()
+        if object is not None:
+            assert 'json' not in kwargs and 'content' not in kwargs
+            kwargs['content'] = self.config.JSON_CODEC.dumps({'data': object.as_data()})
+        with deadlines.deadline(self.config.DEADLINE if deadline is None else deadline):
+            if not events.listeners:
+                return await self.retrying(self._request, url, method, **kwargs)
+            with events.request(method, api_path, request_factory.get_body_size(kwargs.get('content'))):
+                start = time.perf_counter()
+                try:
+                    api_response = await self.retrying(self._request, url, method, **kwargs)
+                except request_factory.ApiRequestError as e:
+                    request_factory.emit_request_end(start, e)
+                    raise
+                events.emit(events.REQUEST_END, time.perf_counter() - start, status_code=api_response.status_code)
+                return api_response
+
+    @property
+    def retrying(self):
+        if self._retrying is None:
+            self._retrying = tenacity.AsyncRetrying(**self.retrying_options)
+        return self._retrying
+
+    async def _request(self, absolute_url, method, **kwargs):
+        options = self.default_options
+        options.update(kwargs)
+        options = self._httpx_options(options)
+        self._apply_deadline(options)
+        with self._circuit_breaker(absolute_url):
+            response = await self._transport_request(method, absolute_url, options)
+            return self._parse_response(response)
+
+    async def _transport_request(self, method, absolute_url, options):
+        start = None
+        if events.listeners:
+            events.emit(events.REQUEST_START)
+            start = time.perf_counter()
+        options = dict(options, timeout=get_httpx_timeout(options.get('timeout')))
+        try:
+            async with self.session.stream(method, absolute_url, **options) as response:
+                if start is not None:
+                    first_byte = time.perf_counter() - start
+                    events.emit(events.FIRST_BYTE, first_byte, status_code=response.status_code)
+                await response.aread()
+        except httpx.TransportError:
+            if request_factory.is_deadline_exceeded():
+                error_class = request_factory.ApiDeadlineExceededError
+            else:
+                error_class = request_factory.ApiConnectionError
+            if events.listeners:
+                events.emit(events.ERROR, error=error_class.__name__)
+            raise error_class
+        if start is not None:
+            events.emit(
+                events.BODY_READ, time.perf_counter() - start - first_byte, size=len(response.content))
+        return response
+
+    def _httpx_options(self, options):
+        options = dict(options)
+        if self.config.AUTH and 'auth' not in options:
+            options['auth'] = self.config.AUTH
+        if self.timeout and 'timeout' not in options:
+            options['timeout'] = self.timeout
+        return options
+
+
+def get_httpx_timeout(timeout):
+    if isinstance(timeout, tuple):
+        connect_timeout, read_timeout = timeout
+        return httpx.Timeout(read_timeout, connect=connect_timeout)
+    return timeout
@@ -18,18 +18,52 @@ class Api:
     def __init__(self, config: configuration.Configuration):
         self.requests = request_factory.ApiRequestFactory(config)
 
-    def endpoint(self, path):
-        return Endpoint(path, self.requests)
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.requests.close()
+
+    def endpoint(self, path, use_cache=True):
+        return Endpoint(path, self.requests, use_cache=use_cache)
+
+    def gather(self, paths, **kwargs):
+        return self.requests.gather(request_factory.Call(path, 'GET', kwargs) for path in paths)
 
 
 class Endpoint:
-    def __init__(self, path, requests):
+    def __init__(self, path, requests, use_cache=True):
         self.path = path
         self.requests = requests
+        self.use_cache = use_cache
 
     def get(self, **kwargs):
+        kwargs.setdefault('use_cache', self.use_cache)
         return self.requests.get(self.path, **kwargs)
 
+    def get_many(self, params_list, **kwargs):
+        kwargs.setdefault('use_cache', self.use_cache)
+        return self.requests.gather(
+            request_factory.Call(self.path, 'GET', dict(kwargs, params=params)) for params in params_list)
+
+    def fetch_all(self, **kwargs):
+        kwargs.setdefault('use_cache', self.use_cache)
+        return self.requests.fetch_all(self.path, **kwargs)
+
+    def fetch_pages(self, **kwargs):
+        kwargs.setdefault('use_cache', self.use_cache)
+        return self.requests.fetch_pages(self.path, **kwargs)
+
+    def iter_pages(self, **kwargs):
+        kwargs.setdefault('use_cache', self.use_cache)
+        return self.requests.iter_pages(self.path, **kwargs)
+
+    def stream(self, **kwargs):
+        return self.requests.stream(self.path, **kwargs)
+
     def post(self, **kwargs):
         return self.requests.post(self.path, **kwargs)
 
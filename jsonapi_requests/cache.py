@@ -0,0 +1,272 @@
+import collections
+import email.utils
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from urllib import parse
+
+Validators = collections.namedtuple('Validators', ['etag', 'last_modified', 'status_code', 'payload'])
+
+
+def make_key(absolute_url, params=None, identity=None):
+    if params:
+        query = tuple(sorted(parse.parse_qsl(parse.urlencode(params, doseq=True))))
+    else:
+        query = ()
+    if identity is None:
+        return absolute_url, query
+    return absolute_url, query, identity
+
+
+class LRUCache:
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.entries = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            try:
+                self.entries.move_to_end(key)
+            except KeyError:
+                return None
+            else:
+                return self.entries[key]
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class ValidatorCache:
+    def __init__(self, max_size):
+        self.validators = LRUCache(max_size)
+        self.hits = 0
+        self.misses = 0
+
+    def get_conditional_headers(self, key):
+        validators = self.validators.get(key)
+        headers = {}
+        if validators is not None:
+            if validators.etag:
+                headers['If-None-Match'] = validators.etag
+            if validators.last_modified:
+                headers['If-Modified-Since'] = validators.last_modified
+        return headers
+
+    def get_not_modified(self, key):
+        validators = self.validators.get(key)
+        if validators is None:
+            return None
+        self.hits += 1
+        return validators._replace(payload=json.loads(validators.payload))
+
+    def store(self, key, headers, status_code, payload):
+        self.misses += 1
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if etag or last_modified:
+            self.validators.set(key, Validators(etag, last_modified, status_code, json.dumps(payload)))
+        else:
+            self.validators.delete(key)
+
+
+CacheEntry = collections.namedtuple('CacheEntry', ['status_code', 'payload', 'headers', 'expires', 'stale_until'])
+
+
+def get_auth_identity(options):
+    auth = options.get('auth')
+    if auth is not None and not isinstance(auth, tuple):
+        raise UncacheableRequest
+    headers = options.get('headers') or {}
+    authorization = next((value for key, value in headers.items() if key.lower() == 'authorization'), None)
+    if auth is None and authorization is None:
+        return None
+    return hashlib.sha256(repr((auth, authorization)).encode()).hexdigest()
+
+
+def get_freshness(headers, now):
+    cache_control = parse_cache_control(headers.get('Cache-Control', ''))
+    if 'no-store' in cache_control or 'no-cache' in cache_control:
+        return None
+    if 'max-age' in cache_control:
+        try:
+            expires = now + int(cache_control['max-age']) - int(headers.get('Age', 0))
+        except ValueError:
+            return None
+    elif headers.get('Expires'):
+        try:
+            expires = email.utils.parsedate_to_datetime(headers['Expires']).timestamp()
+        except (TypeError, ValueError):
+            return None
+    else:
+        return None
+    try:
+        stale_while_revalidate = int(cache_control.get('stale-while-revalidate', 0))
+    except ValueError:
+        stale_while_revalidate = 0
+    return expires, expires + stale_while_revalidate
+
+
+def parse_cache_control(value):
+    directives = {}
+    for directive in value.split(','):
+        name, _, argument = directive.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip('"')
+    return directives
+
+
+class ResponseCache:
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.revalidating = set()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        entry = self.backend.get(key)
+        now = time.time()
+        if entry is None or entry.stale_until <= now:
+            self.misses += 1
+            return None, False
+        elif entry.expires <= now:
+            self.stale_hits += 1
+            return entry, True
+        else:
+            self.hits += 1
+            return entry, False
+
+    def store(self, key, status_code, payload, headers):
+        freshness = get_freshness(headers, time.time()) if status_code == 200 else None
+        if freshness is None:
+            self.backend.delete(key)
+        else:
+            expires, stale_until = freshness
+            self.backend.set(key, CacheEntry(status_code, payload, dict(headers), expires, stale_until))
+
+    def start_revalidation(self, key):
+        with self.lock:
+            if key in self.revalidating:
+                return False
+            self.revalidating.add(key)
+            return True
+
+    def finish_revalidation(self, key):
+        with self.lock:
+            self.revalidating.discard(key)
+
+
+class MemoryBackend:
+    """Cache kept in the memory of one process.
+
+    Payloads are stored encoded and decoded on every hit, so responses served from the cache can be modified
+    without affecting the cached entry.
+    """
+
+    def __init__(self, max_size=1000):
+        self.entries = LRUCache(max_size)
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        return entry._replace(payload=json.loads(entry.payload), headers=dict(entry.headers))
+
+    def set(self, key, entry):
+        self.entries.set(key, entry._replace(payload=json.dumps(entry.payload)))
+
+    def delete(self, key):
+        self.entries.delete(key)
+
+
+class SqliteBackend:
+    """Cache shared between processes on one machine.
+
+    Each process opens its own connection on first use, so the backend can be created before forking.
+    Database errors, e.g. a lock held for longer than the timeout, are treated as cache misses.
+    """
+
+    def __init__(self, path, max_size=10000):
+        self.path = path
+        self.max_size = max_size
+        self.lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+
+    @property
+    def connection(self):
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self.path, timeout=10, check_same_thread=False, isolation_level=None)
+            self._pid = os.getpid()
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, entry TEXT, stale_until REAL)')
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS responses_stale_until ON responses (stale_until)')
+        return self._connection
+
+    def get(self, key):
+        try:
+            with self.lock:
+                row = self.connection.execute(
+                    'SELECT entry FROM responses WHERE key = ?', (self.dump_key(key),)).fetchone()
+        except sqlite3.OperationalError:
+            return None
+        if row is None:
+            return None
+        return CacheEntry(**json.loads(row[0]))
+
+    def set(self, key, entry):
+        try:
+            with self.lock:
+                self.connection.execute(
+                    'REPLACE INTO responses (key, entry, stale_until) VALUES (?, ?, ?)',
+                    (self.dump_key(key), json.dumps(entry._asdict()), entry.stale_until),
+                )
+                count, = self.connection.execute('SELECT COUNT(*) FROM responses').fetchone()
+                if count > self.max_size:
+                    self.connection.execute(
+                        'DELETE FROM responses WHERE key IN '
+                        '(SELECT key FROM responses ORDER BY stale_until LIMIT ?)',
+                        (count - self.max_size,),
+                    )
+        except sqlite3.OperationalError:
+            pass
+
+    def delete(self, key):
+        try:
+            with self.lock:
+                self.connection.execute('DELETE FROM responses WHERE key = ?', (self.dump_key(key),))
+        except sqlite3.OperationalError:
+            pass
+
+    def close(self):
+        with self.lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+    @staticmethod
+    def dump_key(key):
+        return json.dumps(key)
+
+
+class UncacheableRequest(Exception):
+    pass
@@ -0,0 +1,36 @@
+import threading
+
+from concurrent import futures
+
+
+class SingleFlight:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}
+        self.collapsed = 0
+
+    def do(self, key, function, *args, **kwargs):
+        with self.lock:
+            call = self.calls.get(key)
+            if call is not None:
+                self.collapsed += 1
+                is_leader = False
+            else:
+                call = self.calls[key] = futures.Future()
+                is_leader = True
+        if not is_leader:
+            return call.result(), True
+        try:
+            result = function(*args, **kwargs)
+        except BaseException as e:
+            self._finish(key)
+            call.set_exception(e)
+            raise
+        else:
+            self._finish(key)
+            call.set_result(result)
+            return result, False
+
+    def _finish(self, key):
+        with self.lock:
+            del self.calls[key]
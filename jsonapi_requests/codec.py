@@ -0,0 +1,44 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JsonCodec:
+    def loads(self, content):
+        return json.loads(content)
+
+    def dumps(self, data):
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+class OrjsonCodec(JsonCodec):
+    def loads(self, content):
+        return orjson.loads(content)
+
+    def dumps(self, data):
+        return orjson.dumps(data)
+
+
+class UjsonCodec(JsonCodec):
+    def loads(self, content):
+        return ujson.loads(content)
+
+    def dumps(self, data):
+        return ujson.dumps(data, ensure_ascii=False).encode()
+
+
+def get_fastest_codec():
+    if orjson is not None:
+        return OrjsonCodec()
+    elif ujson is not None:
+        return UjsonCodec()
+    else:
+        return JsonCodec()
@@ -1,8 +1,19 @@
 from collections import namedtuple
 
+from jsonapi_requests import codec
+
 Configuration = namedtuple(
     'Configuration',
-    ['API_ROOT', 'AUTH', 'VALIDATE_SSL', 'TIMEOUT', 'APPEND_SLASH', 'RETRIES'],
+    [
+        'API_ROOT', 'AUTH', 'VALIDATE_SSL', 'TIMEOUT', 'APPEND_SLASH', 'RETRIES',
+        'POOL_CONNECTIONS', 'POOL_MAXSIZE', 'KEEP_ALIVE', 'PRECONNECT', 'TRANSPORT',
+        'MAX_WORKERS', 'VALIDATOR_CACHE_SIZE', 'CACHE', 'COALESCE_REQUESTS',
+        'RETRY_BACKOFF', 'RETRY_BACKOFF_MAX', 'RETRY_BUDGET', 'RETRY_BUDGET_MIN_RETRIES',
+        'CIRCUIT_BREAKER_THRESHOLD', 'CIRCUIT_BREAKER_TIMEOUT', 'JSON_CODEC',
+        'PREFETCH_PAGES', 'CONNECT_TIMEOUT', 'READ_TIMEOUT', 'DEADLINE',
+        'HEDGE_DELAY', 'HEDGE_MAX_RATIO', 'CONCURRENCY_LIMIT', 'CONCURRENCY_LIMIT_ADAPTIVE',
+        'VIEW_MODE', 'INTERNING',
+    ],
 )
 
 
@@ -18,6 +29,32 @@ class Factory:
             TIMEOUT=self.TIMEOUT,
             APPEND_SLASH=self.APPEND_SLASH,
             RETRIES=self.RETRIES,
+            POOL_CONNECTIONS=self.POOL_CONNECTIONS,
+            POOL_MAXSIZE=self.POOL_MAXSIZE,
+            KEEP_ALIVE=self.KEEP_ALIVE,
+            PRECONNECT=self.PRECONNECT,
+            TRANSPORT=self.TRANSPORT,
+            MAX_WORKERS=self.MAX_WORKERS,
+            VALIDATOR_CACHE_SIZE=self.VALIDATOR_CACHE_SIZE,
+            CACHE=self.CACHE,
+            COALESCE_REQUESTS=self.COALESCE_REQUESTS,
+            RETRY_BACKOFF=self.RETRY_BACKOFF,
+            RETRY_BACKOFF_MAX=self.RETRY_BACKOFF_MAX,
+            RETRY_BUDGET=self.RETRY_BUDGET,
+            RETRY_BUDGET_MIN_RETRIES=self.RETRY_BUDGET_MIN_RETRIES,
+            CIRCUIT_BREAKER_THRESHOLD=self.CIRCUIT_BREAKER_THRESHOLD,
+            CIRCUIT_BREAKER_TIMEOUT=self.CIRCUIT_BREAKER_TIMEOUT,
+            JSON_CODEC=self.JSON_CODEC,
+            PREFETCH_PAGES=self.PREFETCH_PAGES,
+            CONNECT_TIMEOUT=self.CONNECT_TIMEOUT,
+            READ_TIMEOUT=self.READ_TIMEOUT,
+            DEADLINE=self.DEADLINE,
+            HEDGE_DELAY=self.HEDGE_DELAY,
+            HEDGE_MAX_RATIO=self.HEDGE_MAX_RATIO,
+            CONCURRENCY_LIMIT=self.CONCURRENCY_LIMIT,
+            CONCURRENCY_LIMIT_ADAPTIVE=self.CONCURRENCY_LIMIT_ADAPTIVE,
+            VIEW_MODE=self.VIEW_MODE,
+            INTERNING=self.INTERNING,
         )
 
     @property
@@ -46,3 +83,107 @@ class Factory:
     @property
     def RETRIES(self):
         return self._config_dict.get('RETRIES', 3)
+
+    @property
+    def POOL_CONNECTIONS(self):
+        return self._config_dict.get('POOL_CONNECTIONS', 10)
+
+    @property
+    def POOL_MAXSIZE(self):
+        return self._config_dict.get('POOL_MAXSIZE', 10)
+
+    @property
+    def KEEP_ALIVE(self):
+        return self._config_dict.get('KEEP_ALIVE', True)
+
+    @property
+    def PRECONNECT(self):
+        return self._config_dict.get('PRECONNECT', False)
+
+    @property
+    def TRANSPORT(self):
+        return self._config_dict.get('TRANSPORT', None)
+
+    @property
+    def MAX_WORKERS(self):
+        return self._config_dict.get('MAX_WORKERS', None)
+
+    @property
+    def VALIDATOR_CACHE_SIZE(self):
+        return self._config_dict.get('VALIDATOR_CACHE_SIZE', 0)
+
+    @property
+    def CACHE(self):
+        return self._config_dict.get('CACHE', None)
+
+    @property
+    def COALESCE_REQUESTS(self):
+        return self._config_dict.get('COALESCE_REQUESTS', False)
+
+    @property
+    def RETRY_BACKOFF(self):
+        return self._config_dict.get('RETRY_BACKOFF', 0)
+
+    @property
+    def RETRY_BACKOFF_MAX(self):
+        return self._config_dict.get('RETRY_BACKOFF_MAX', 10)
+
+    @property
+    def RETRY_BUDGET(self):
+        return self._config_dict.get('RETRY_BUDGET', None)
+
+    @property
+    def RETRY_BUDGET_MIN_RETRIES(self):
+        return self._config_dict.get('RETRY_BUDGET_MIN_RETRIES', 10)
+
+    @property
+    def CIRCUIT_BREAKER_THRESHOLD(self):
+        return self._config_dict.get('CIRCUIT_BREAKER_THRESHOLD', None)
+
+    @property
+    def CIRCUIT_BREAKER_TIMEOUT(self):
+        return self._config_dict.get('CIRCUIT_BREAKER_TIMEOUT', 30)
+
+    @property
+    def JSON_CODEC(self):
+        return self._config_dict.get('JSON_CODEC', None) or codec.JsonCodec()
+
+    @property
+    def PREFETCH_PAGES(self):
+        return self._config_dict.get('PREFETCH_PAGES', 1)
+
+    @property
+    def CONNECT_TIMEOUT(self):
+        return self._config_dict.get('CONNECT_TIMEOUT', None)
+
+    @property
+    def READ_TIMEOUT(self):
+        return self._config_dict.get('READ_TIMEOUT', None)
+
+    @property
+    def DEADLINE(self):
+        return self._config_dict.get('DEADLINE', None)
+
+    @property
+    def HEDGE_DELAY(self):
+        return self._config_dict.get('HEDGE_DELAY', None)
+
+    @property
+    def HEDGE_MAX_RATIO(self):
+        return self._config_dict.get('HEDGE_MAX_RATIO', 0.05)
+
+    @property
+    def CONCURRENCY_LIMIT(self):
+        return self._config_dict.get('CONCURRENCY_LIMIT', None)
+
+    @property
+    def CONCURRENCY_LIMIT_ADAPTIVE(self):
+        return self._config_dict.get('CONCURRENCY_LIMIT_ADAPTIVE', False)
+
+    @property
+    def VIEW_MODE(self):
+        return self._config_dict.get('VIEW_MODE', False)
+
+    @property
+    def INTERNING(self):
+        return self._config_dict.get('INTERNING', False)
@@ -1,5 +1,14 @@
+import collections.abc
+import contextlib
+import contextvars
+import operator
+
+current_interner = contextvars.ContextVar('jsonapi_requests_interner', default=None)
+
+
 def make_collection(collection_type, element_type, allow_empty_data=False):
     class DynamicCollection(collection_type):
+        __slots__ = ()
         type = element_type
         allow_empty = allow_empty_data
 
@@ -14,6 +23,8 @@ def as_data(value):
 
 
 class AbstractValue:
+    __slots__ = ()
+
     @classmethod
     def from_data(cls, data):
         raise NotImplementedError
@@ -34,8 +45,14 @@ class AbstractValue:
     def allow_as_data(cls, data):
         return bool(data)
 
+    @classmethod
+    def can_load(cls, data):
+        return True
+
 
 class Scalar(AbstractValue):
+    __slots__ = ('data',)
+
     def __init__(self, data):
         self.data = data
 
@@ -48,6 +65,7 @@ class Scalar(AbstractValue):
 
 
 class AbstractCollectionValue(AbstractValue):
+    __slots__ = ()
     type = Scalar
     allow_empty = False
 
@@ -57,32 +75,215 @@ class AbstractCollectionValue(AbstractValue):
 
 
 class List(AbstractCollectionValue, list):
+    __slots__ = ()
+
     @classmethod
     def from_data(cls, data):
         if data is None:
             return cls()
         if not hasattr(data, '__iter__'):
             raise CantLoadData
-        return cls([cls.type.from_data(element) for element in data])
+        if cls.type is Scalar:
+            return cls(data)
+        load = cls.type.from_data
+        return cls([load(element) for element in data])
+
+    @classmethod
+    def can_load(cls, data):
+        return data is None or hasattr(data, '__iter__')
 
     def as_data(self):
         return [as_data(element) for element in self]
 
 
+class LazyList(List):
+    __slots__ = ('interner',)
+
+    def __init__(self, iterable=(), interner=None):
+        super().__init__(iterable)
+        self.interner = interner
+
+    @classmethod
+    def from_data(cls, data):
+        if data is None:
+            return cls()
+        if not cls.can_load(data):
+            raise CantLoadData
+        return cls(data, current_interner.get())
+
+    @classmethod
+    def can_load(cls, data):
+        return data is None or (hasattr(data, '__iter__') and not hasattr(data, 'items') and not isinstance(data, str))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        value = list.__getitem__(self, index)
+        if not isinstance(value, self.type):
+            value = load_with_interner(self.type, value, self.interner)
+            list.__setitem__(self, index, value)
+        return value
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __reversed__(self):
+        for index in reversed(range(len(self))):
+            yield self[index]
+
+    def __contains__(self, value):
+        return any(element == value for element in self)
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __mul__(self, count):
+        return list(self) * count
+
+    __rmul__ = __mul__
+
+    def __imul__(self, count):
+        self[:] = list(self) * count
+        return self
+
+    def index(self, value, *args):
+        return list(self).index(value, *args)
+
+    def count(self, value):
+        return list(self).count(value)
+
+    def pop(self, index=-1):
+        value = self[index]
+        list.pop(self, index)
+        return value
+
+    def copy(self):
+        return type(self)(self)
+
+    def sort(self, **kwargs):
+        self[:] = sorted(self, **kwargs)
+
+
 class Dictionary(AbstractCollectionValue, dict):
+    __slots__ = ()
+
     @classmethod
     def from_data(cls, data):
         if data is None:
             return cls()
         if not hasattr(data, 'items'):
             raise CantLoadData
-        return cls({key: cls.type.from_data(element) for key, element in data.items()})
+        if cls.type is Scalar:
+            return cls(data)
+        load = cls.type.from_data
+        return cls({key: load(element) for key, element in data.items()})
+
+    @classmethod
+    def can_load(cls, data):
+        return data is None or hasattr(data, 'items')
 
     def as_data(self):
         return {key: as_data(element) for key, element in self.items()}
 
 
+class DictionaryView(AbstractCollectionValue, collections.abc.MutableMapping):
+    """Dictionary wrapping a decoded payload dict without copying it.
+
+    Elements of non-scalar type are parsed when accessed. The wrapped dict is copied before it is
+    first modified, so the payload stays untouched and can be shared with cached responses.
+    """
+
+    __slots__ = ('data', 'is_copy', 'interner')
+
+    def __init__(self, data=None, interner=None):
+        self.data = {} if data is None else data
+        self.is_copy = data is None
+        self.interner = interner
+
+    @classmethod
+    def from_data(cls, data):
+        if data is None:
+            return cls()
+        if not hasattr(data, 'items'):
+            raise CantLoadData
+        return cls(data, current_interner.get())
+
+    @classmethod
+    def can_load(cls, data):
+        return data is None or hasattr(data, 'items')
+
+    def __getitem__(self, key):
+        value = self.data[key]
+        if self.type is not Scalar and not isinstance(value, self.type):
+            value = load_with_interner(self.type, value, self.interner)
+            self._get_own_data()[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        self._get_own_data()[key] = value
+
+    def __delitem__(self, key):
+        del self._get_own_data()[key]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def _get_own_data(self):
+        if not self.is_copy:
+            self.data = dict(self.data)
+            self.is_copy = True
+        return self.data
+
+    def copy(self):
+        view = type(self)(dict(self.data), self.interner)
+        view.is_copy = True
+        return view
+
+    def as_data(self):
+        if self.type is Scalar:
+            return dict(self.data)
+        return {
+            key: as_data(value if isinstance(value, self.type) else self.type.from_data(value))
+            for key, value in self.data.items()
+        }
+
+
+class DefaultCollection:
+    """Collection attribute kept in ``slot`` which stores ``None`` instead of an empty collection.
+
+    The collection is allocated on first access, so records loaded without the member do not hold
+    an empty collection each.
+    """
+
+    def __init__(self, slot, type=Dictionary):
+        self.slot = slot
+        self.type = type
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = getattr(instance, self.slot)
+        if value is None:
+            value = self.type()
+            setattr(instance, self.slot, value)
+        return value
+
+    def __set__(self, instance, value):
+        setattr(instance, self.slot, value)
+
+
 class Record(AbstractValue):
+    __slots__ = ()
     schema = {}
 
     def __init__(self, **kwargs):
@@ -91,7 +292,7 @@ class Record(AbstractValue):
 
     def __bool__(self):
         return any(
-            getattr(self, field) for field in self.get_schema()
+            read(self) for field, read in get_compiled(type(self), '_readers', compile_readers)
         )
 
     @classmethod
@@ -100,26 +301,78 @@ class Record(AbstractValue):
 
     @classmethod
     def from_data(cls, data):
+        return get_compiled(cls, '_load', compile_loader)(data)
+
+    def as_data(self):
+        return get_compiled(type(self), '_dump', compile_dumper)(self)
+
+    @classmethod
+    def can_load(cls, data):
+        return data is None or hasattr(data, 'get')
+
+
+def get_compiled(record_class, name, compile):
+    try:
+        return record_class.__dict__[name]
+    except KeyError:
+        compiled = compile(record_class)
+        setattr(record_class, name, compiled)
+        return compiled
+
+
+def compile_readers(record_class):
+    readers = []
+    for field in record_class.get_schema():
+        attribute = getattr(record_class, field, None)
+        if isinstance(attribute, DefaultCollection):
+            readers.append((field, operator.attrgetter(attribute.slot)))
+        else:
+            readers.append((field, operator.attrgetter(field)))
+    return readers
+
+
+def compile_loader(record_class):
+    field_loaders = [
+        (field, None if field_class is Scalar else field_class.from_data)
+        for field, field_class in record_class.get_schema().items()
+    ]
+
+    def load(data):
         if data is None:
             data = {}
-        if not hasattr(data, 'get'):
+        elif type(data) is not dict and not hasattr(data, 'get'):
             raise CantLoadData
         fields = {}
-        for field, field_class in cls.get_schema().items():
-            field_data = data.get(field)
-            fields[field] = field_class.from_data(field_data)
-        return cls(**fields)
+        for field, load_field in field_loaders:
+            value = data.get(field)
+            fields[field] = value if load_field is None else load_field(value)
+        return record_class(**fields)
 
-    def as_data(self):
+    return load
+
+
+def compile_dumper(record_class):
+    schema = record_class.get_schema()
+    field_dumpers = [
+        (field, read, schema[field].allow_as_data)
+        for field, read in get_compiled(record_class, '_readers', compile_readers)
+    ]
+
+    def dump(record):
         data = {}
-        for field, type in self.get_schema().items():
-            value = as_data(getattr(self, field))
-            if type.allow_as_data(value):
+        for field, read, allow_as_data in field_dumpers:
+            value = read(record)
+            if hasattr(value, 'as_data'):
+                value = value.as_data()
+            if allow_as_data(value):
                 data[field] = value
         return data
 
+    return dump
+
 
 class ResourceIdentifier(Record):
+    __slots__ = ('type', 'id')
     schema = {
         'type': Scalar,
         'id': Scalar,
@@ -130,6 +383,87 @@ class ResourceIdentifier(Record):
         self.type = type
         self.id = id
 
+    @classmethod
+    def from_data(cls, data):
+        interner = current_interner.get()
+        if interner is None or type(data) is not dict or cls.get_schema() is not ResourceIdentifier.schema:
+            return super().from_data(data)
+        return interner.get_identifier(cls, data.get('type'), data.get('id'))
+
+
+class SharedIdentifier:
+    """Mixin making a resource identifier read-only once its fields are set."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        if hasattr(self, name):
+            raise AttributeError('Shared {} can not be modified, replace it instead.'.format(type(self).__name__))
+        super().__setattr__(name, value)
+
+
+def compile_shared_class(identifier_class):
+    return type(identifier_class.__name__, (SharedIdentifier, identifier_class), {'__slots__': ()})
+
+
+class Interner:
+    """Shares type strings and resource identifiers between records parsed from one document.
+
+    Shared identifiers are read-only, replace them instead of modifying them in place.
+    """
+
+    __slots__ = ('types', 'identifiers')
+
+    def __init__(self):
+        self.types = {}
+        self.identifiers = {}
+
+    def get_type(self, type):
+        if type.__class__ is not str:
+            return type
+        return self.types.setdefault(type, type)
+
+    def get_identifier(self, identifier_class, type, id):
+        try:
+            identifiers = self.identifiers[identifier_class, type]
+        except KeyError:
+            identifiers = self.identifiers[identifier_class, self.get_type(type)] = {}
+        except TypeError:
+            return identifier_class(type=type, id=id)
+        try:
+            return identifiers[id]
+        except KeyError:
+            shared_class = get_compiled(identifier_class, '_shared_class', compile_shared_class)
+            identifier = identifiers[id] = shared_class(type=self.get_type(type), id=id)
+            return identifier
+        except TypeError:
+            return identifier_class(type=type, id=id)
+
+
+def load_with_interner(value_class, data, interner):
+    if interner is None:
+        return value_class.from_data(data)
+    token = current_interner.set(interner)
+    try:
+        return value_class.from_data(data)
+    finally:
+        current_interner.reset(token)
+
+
+@contextlib.contextmanager
+def interning(interner=None):
+    """Share types and identifiers of records parsed in this context, using ``interner`` or a new one.
+
+    Nested contexts without an explicit ``interner`` keep the current one.
+    """
+    if interner is None:
+        interner = current_interner.get() or Interner()
+    token = current_interner.set(interner)
+    try:
+        yield interner
+    finally:
+        current_interner.reset(token)
+
 
 class SchemaAlternativeWrapper:
     def __init__(self, *types):
@@ -142,24 +476,20 @@ class SchemaAlternativeWrapper:
         return self.get_type(data).allow_as_data(data)
 
     def get_type(self, data):
-        exception = None
         for type in self.types:
-            try:
-                type.from_data(data)
-            except CantLoadData as e:
-                exception = e
-            else:
+            if type.can_load(data):
                 return type
-        if exception:
-            raise exception
+        raise CantLoadData
 
 
 class Relationship(Record):
+    __slots__ = ('data', '_links')
     schema = {
         'data': SchemaAlternativeWrapper(
             ResourceIdentifier, make_collection(List, ResourceIdentifier, allow_empty_data=True)),
         'links': Dictionary,
     }
+    links = DefaultCollection('_links')
 
     # noinspection PyMissingConstructor
     def __init__(self, *, data=None, links=None):
@@ -167,10 +497,11 @@ class Relationship(Record):
             self.data = ResourceIdentifier()
         else:
             self.data = data
-        self.links = links or Dictionary()
+        self._links = links or None
 
 
 class JsonApiObject(Record):
+    __slots__ = ('type', 'id', '_attributes', '_relationships', '_links')
     schema = {
         'type': Scalar,
         'id': Scalar,
@@ -178,24 +509,37 @@ class JsonApiObject(Record):
         'relationships': make_collection(Dictionary, Relationship),
         'links': Dictionary,
     }
+    attributes = DefaultCollection('_attributes')
+    relationships = DefaultCollection('_relationships')
+    links = DefaultCollection('_links')
 
     # noinspection PyMissingConstructor
     def __init__(self, *, type=None, id=None, attributes=None, relationships=None, links=None):
         self.type = type
         self.id = id
-        self.attributes = attributes or Dictionary()
-        self.relationships = relationships or Dictionary()
-        self.links = links or Dictionary()
+        self._attributes = attributes or None
+        self._relationships = relationships or None
+        self._links = links or None
+
+    @classmethod
+    def from_data(cls, data):
+        record = super().from_data(data)
+        interner = current_interner.get()
+        if interner is not None and record.type is not None:
+            record.type = interner.get_type(record.type)
+        return record
 
 
 class JsonApiResponse(Record):
+    __slots__ = ('data', 'errors', 'meta', 'jsonapi', 'links', 'included')
     schema = {
-        'data': SchemaAlternativeWrapper(JsonApiObject, make_collection(List, JsonApiObject, allow_empty_data=True)),
+        'data': SchemaAlternativeWrapper(
+            JsonApiObject, make_collection(LazyList, JsonApiObject, allow_empty_data=True)),
         'errors': List,
         'meta': Scalar,
         'jsonapi': Scalar,
         'links': Dictionary,
-        'included': make_collection(List, JsonApiObject),
+        'included': make_collection(LazyList, JsonApiObject),
     }
 
     # noinspection PyMissingConstructor
@@ -211,5 +555,33 @@ class JsonApiResponse(Record):
         self.included = included or List()
 
 
+class JsonApiObjectView(JsonApiObject):
+    """JsonApiObject whose ``attributes``, ``relationships`` and ``links`` wrap the payload dicts."""
+
+    __slots__ = ()
+    schema = {
+        'type': Scalar,
+        'id': Scalar,
+        'attributes': DictionaryView,
+        'relationships': make_collection(DictionaryView, Relationship),
+        'links': DictionaryView,
+    }
+
+
+class JsonApiResponseView(JsonApiResponse):
+    """JsonApiResponse parsing resources into ``JsonApiObjectView``."""
+
+    __slots__ = ()
+    schema = {
+        'data': SchemaAlternativeWrapper(
+            JsonApiObjectView, make_collection(LazyList, JsonApiObjectView, allow_empty_data=True)),
+        'errors': List,
+        'meta': Scalar,
+        'jsonapi': Scalar,
+        'links': DictionaryView,
+        'included': make_collection(LazyList, JsonApiObjectView),
+    }
+
+
 class CantLoadData(Exception):
     pass
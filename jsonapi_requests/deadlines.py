@@ -0,0 +1,39 @@
+import contextlib
+import contextvars
+import time
+
+current_deadline = contextvars.ContextVar('jsonapi_requests_deadline', default=None)
+
+
+@contextlib.contextmanager
+def deadline(timeout):
+    if timeout is None:
+        yield
+        return
+    new_deadline = time.monotonic() + timeout
+    previous_deadline = current_deadline.get()
+    if previous_deadline is not None:
+        new_deadline = min(new_deadline, previous_deadline)
+    token = current_deadline.set(new_deadline)
+    try:
+        yield
+    finally:
+        current_deadline.reset(token)
+
+
+def get_remaining():
+    deadline_at = current_deadline.get()
+    if deadline_at is None:
+        return None
+    return deadline_at - time.monotonic()
+
+
+def clamp_timeout(timeout, remaining):
+    if remaining is None:
+        return timeout
+    elif timeout is None:
+        return remaining
+    elif isinstance(timeout, tuple):
+        return tuple(clamp_timeout(part, remaining) for part in timeout)
+    else:
+        return min(timeout, remaining)
@@ -0,0 +1,95 @@
+import collections
+import contextlib
+import contextvars
+import re
+
+from urllib import parse
+
+REQUEST_START = 'request_start'
+FIRST_BYTE = 'first_byte'
+BODY_READ = 'body_read'
+DECODE = 'decode'
+PARSE = 'parse'
+HYDRATE = 'hydrate'
+POPULATE = 'populate'
+REQUEST_END = 'request_end'
+ERROR = 'error'
+CACHE_HIT = 'cache_hit'
+CACHE_MISS = 'cache_miss'
+STUB_REFRESH = 'stub_refresh'
+
+ID_SEGMENT = re.compile(r'^(\d+|[0-9a-fA-F-]{32,36})$')
+
+Event = collections.namedtuple(
+    'Event',
+    ['phase', 'method', 'path', 'status_code', 'retries', 'size', 'request_size', 'duration', 'error'],
+    defaults=[None],
+)
+
+listeners = []
+current_request = contextvars.ContextVar('jsonapi_requests_current_request', default=None)
+
+
+def add_listener(listener):
+    listeners.append(listener)
+
+
+def remove_listener(listener):
+    listeners.remove(listener)
+
+
+class RequestInfo:
+    def __init__(self, method, path, request_size=None):
+        self.method = method
+        self.path = get_path_template(path)
+        self.status_code = None
+        self.retries = 0
+        self.size = None
+        self.request_size = request_size
+
+
+@contextlib.contextmanager
+def request(method, path, request_size=None):
+    with resumed(RequestInfo(method, path, request_size)) as request_info:
+        yield request_info
+
+
+@contextlib.contextmanager
+def resumed(request_info):
+    token = current_request.set(request_info)
+    try:
+        yield request_info
+    finally:
+        current_request.reset(token)
+
+
+def before_attempt(retry_state):
+    request_info = current_request.get()
+    if request_info is not None:
+        request_info.retries = retry_state.attempt_number - 1
+
+
+def emit(phase, duration=None, error=None, **changes):
+    request_info = current_request.get() or RequestInfo(None, None)
+    for name, value in changes.items():
+        setattr(request_info, name, value)
+    event = Event(
+        phase=phase,
+        method=request_info.method,
+        path=request_info.path,
+        status_code=request_info.status_code,
+        retries=request_info.retries,
+        size=request_info.size,
+        request_size=request_info.request_size,
+        duration=duration,
+        error=error,
+    )
+    for listener in list(listeners):
+        listener(event)
+
+
+def get_path_template(path):
+    if path is None:
+        return None
+    segments = parse.urlsplit(path).path.split('/')
+    return '/'.join('{id}' if ID_SEGMENT.match(segment) else segment for segment in segments)
@@ -0,0 +1,109 @@
+import collections
+import contextvars
+import threading
+import time
+
+from concurrent import futures
+
+from jsonapi_requests import resilience
+
+
+class Hedging:
+    def __init__(self, delay, max_ratio, max_workers):
+        if isinstance(delay, str):
+            self.fixed_delay = None
+            self.latencies = LatencyTracker(parse_percentile(delay))
+        else:
+            self.fixed_delay = delay
+            self.latencies = None
+        self.budget = resilience.RetryBudget(max_ratio, 0)
+        self.executor = futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='jsonapi-requests-hedge')
+        self.primary_executor = futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='jsonapi-requests-primary')
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    @property
+    def delay(self):
+        if self.latencies is not None:
+            return self.latencies.get()
+        return self.fixed_delay
+
+    def run(self, function, *args, **kwargs):
+        self.budget.record_request()
+        delay = self.delay
+        if delay is None:
+            return self._timed(function, args, kwargs)
+        started = threading.Event()
+        primary = self.primary_executor.submit(
+            contextvars.copy_context().run, self._run_primary, started, function, args, kwargs)
+        # time spent waiting for a free worker does not count against the delay
+        started.wait()
+        done, _ = futures.wait([primary], timeout=delay)
+        if done or not self.budget.acquire_retry():
+            return primary.result()
+        self.hedged += 1
+        hedge = self._submit(function, args, kwargs)
+        return self._get_first_result(primary, hedge)
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+        self.primary_executor.shutdown(wait=False)
+
+    def _submit(self, function, args, kwargs):
+        return self.executor.submit(contextvars.copy_context().run, self._timed, function, args, kwargs)
+
+    def _run_primary(self, started, function, args, kwargs):
+        started.set()
+        return self._timed(function, args, kwargs)
+
+    def _timed(self, function, args, kwargs):
+        start = time.monotonic()
+        result = function(*args, **kwargs)
+        if self.latencies is not None:
+            self.latencies.add(time.monotonic() - start)
+        return result
+
+    def _get_first_result(self, primary, hedge):
+        pending = {primary, hedge}
+        while True:
+            done, pending = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+            for attempt in done:
+                if attempt.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    if attempt is hedge:
+                        self.hedge_wins += 1
+                    return attempt.result()
+            if not pending:
+                raise primary.exception()
+
+
+class LatencyTracker:
+    min_samples = 20
+
+    def __init__(self, percentile, size=1000):
+        self.percentile = percentile
+        self.samples = collections.deque(maxlen=size)
+        self.lock = threading.Lock()
+
+    def add(self, latency):
+        with self.lock:
+            self.samples.append(latency)
+
+    def get(self):
+        with self.lock:
+            samples = sorted(self.samples)
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(int(len(samples) * self.percentile / 100), len(samples) - 1)]
+
+
+def parse_percentile(value):
+    try:
+        percentile = float(value[1:]) if value[:1].lower() == 'p' else None
+    except ValueError:
+        percentile = None
+    if percentile is None or not 0 < percentile < 100:
+        raise ValueError('Hedge delay should be number of seconds or percentile like "p95", got {!r}.'.format(value))
+    return percentile
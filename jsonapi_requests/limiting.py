@@ -0,0 +1,131 @@
+import collections
+import contextlib
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+
+HIGH = 0
+NORMAL = 10
+LOW = 20
+
+current_priority = contextvars.ContextVar('jsonapi_requests_priority', default=NORMAL)
+
+
+@contextlib.contextmanager
+def priority(value):
+    if value is None:
+        yield
+        return
+    token = current_priority.set(value)
+    try:
+        yield
+    finally:
+        current_priority.reset(token)
+
+
+LimiterStats = collections.namedtuple(
+    'LimiterStats', ['limit', 'in_flight', 'queued', 'waits', 'total_wait_time', 'max_wait_time'])
+
+
+class Limiter:
+    def __init__(self, limit):
+        self.limit = limit
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.waiters = []
+        self.counter = itertools.count()
+        self.waits = 0
+        self.total_wait_time = 0
+        self.max_wait_time = 0
+
+    @property
+    def current_limit(self):
+        return max(int(self.limit), 1)
+
+    def acquire(self, priority=NORMAL, timeout=None):
+        with self.lock:
+            if self.in_flight < self.current_limit and not self.waiters:
+                self.in_flight += 1
+                return True
+            waiter = [priority, next(self.counter), threading.Event()]
+            heapq.heappush(self.waiters, waiter)
+        start = time.monotonic()
+        acquired = waiter[2].wait(None if timeout is None else max(timeout, 0))
+        with self.lock:
+            if not acquired and waiter[2].is_set():
+                acquired = True
+            elif not acquired:
+                self.waiters.remove(waiter)
+                heapq.heapify(self.waiters)
+            wait_time = time.monotonic() - start
+            self.waits += 1
+            self.total_wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+        return acquired
+
+    def release(self, latency=None, overloaded=False):
+        with self.lock:
+            self.in_flight -= 1
+            if latency is not None:
+                self.adapt(latency, overloaded)
+            while self.waiters and self.in_flight < self.current_limit:
+                waiter = heapq.heappop(self.waiters)
+                self.in_flight += 1
+                waiter[2].set()
+
+    def adapt(self, latency, overloaded):
+        pass
+
+    @property
+    def stats(self):
+        with self.lock:
+            return LimiterStats(
+                limit=self.current_limit,
+                in_flight=self.in_flight,
+                queued=len(self.waiters),
+                waits=self.waits,
+                total_wait_time=self.total_wait_time,
+                max_wait_time=self.max_wait_time,
+            )
+
+
+class AimdLimiter(Limiter):
+    backoff_ratio = 0.5
+    latency_tolerance = 2
+    smoothing = 0.05
+
+    def __init__(self, max_limit):
+        super().__init__(max_limit)
+        self.max_limit = max_limit
+        self.average_latency = None
+
+    def adapt(self, latency, overloaded):
+        if self.average_latency is None:
+            self.average_latency = latency
+        is_slow = latency > self.latency_tolerance * self.average_latency
+        self.average_latency += self.smoothing * (latency - self.average_latency)
+        if overloaded or is_slow:
+            self.limit = max(self.limit * self.backoff_ratio, 1)
+        else:
+            self.limit = min(self.limit + 1 / self.limit, self.max_limit)
+
+
+class Limiters:
+    def __init__(self, limit, adaptive=False):
+        self.limit = limit
+        self.adaptive = adaptive
+        self.lock = threading.Lock()
+        self.limiters = {}
+
+    def get(self, host):
+        with self.lock:
+            if host not in self.limiters:
+                self.limiters[host] = AimdLimiter(self.limit) if self.adaptive else Limiter(self.limit)
+            return self.limiters[host]
+
+    def stats(self):
+        with self.lock:
+            limiters = dict(self.limiters)
+        return {host: limiter.stats for host, limiter in limiters.items()}
@@ -0,0 +1,191 @@
+import bisect
+import threading
+
+from jsonapi_requests import events
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class Counter:
+    type = 'counter'
+
+    def __init__(self, name, documentation, label_names):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.values = {}
+
+    def inc(self, labels, amount=1):
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def snapshot(self):
+        return [
+            {'labels': dict(zip(self.label_names, labels)), 'value': value}
+            for labels, value in sorted(self.values.items(), key=sort_key)
+        ]
+
+    def samples(self):
+        for labels, value in sorted(self.values.items(), key=sort_key):
+            yield self.name, dict(zip(self.label_names, labels)), value
+
+
+class Histogram:
+    type = 'histogram'
+
+    def __init__(self, name, documentation, label_names, buckets):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = tuple(buckets)
+        self.values = {}
+
+    def observe(self, labels, value):
+        if labels not in self.values:
+            self.values[labels] = HistogramValue(len(self.buckets))
+        self.values[labels].observe(bisect.bisect_left(self.buckets, value), value)
+
+    def snapshot(self):
+        return [
+            {
+                'labels': dict(zip(self.label_names, labels)),
+                'buckets': dict(zip(self.buckets, value.cumulative_counts())),
+                'count': value.count,
+                'sum': value.sum,
+            }
+            for labels, value in sorted(self.values.items(), key=sort_key)
+        ]
+
+    def samples(self):
+        for labels, value in sorted(self.values.items(), key=sort_key):
+            label_dict = dict(zip(self.label_names, labels))
+            for bucket, count in zip(self.buckets, value.cumulative_counts()):
+                yield self.name + '_bucket', dict(label_dict, le=format_value(bucket)), count
+            yield self.name + '_bucket', dict(label_dict, le='+Inf'), value.count
+            yield self.name + '_sum', label_dict, value.sum
+            yield self.name + '_count', label_dict, value.count
+
+
+class HistogramValue:
+    def __init__(self, buckets):
+        self.counts = [0] * buckets
+        self.count = 0
+        self.sum = 0
+
+    def observe(self, bucket_index, value):
+        if bucket_index < len(self.counts):
+            self.counts[bucket_index] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self):
+        total = 0
+        for count in self.counts:
+            total += count
+            yield total
+
+
+class Registry:
+    def __init__(self, buckets=DEFAULT_BUCKETS, prefix='jsonapi_requests_'):
+        self.lock = threading.Lock()
+        self.requests = Counter(
+            prefix + 'requests_total', 'Requests by endpoint and status.', ('method', 'path', 'status'))
+        self.request_duration = Histogram(
+            prefix + 'request_duration_seconds', 'Request duration including retries.',
+            ('method', 'path', 'status'), buckets)
+        self.retries = Counter(prefix + 'retries_total', 'Retried attempts.', ('method', 'path'))
+        self.errors = Counter(prefix + 'errors_total', 'Failed attempts by error.', ('method', 'path', 'error'))
+        self.received_bytes = Counter(prefix + 'received_bytes_total', 'Response body bytes.', ('method', 'path'))
+        self.sent_bytes = Counter(prefix + 'sent_bytes_total', 'Request body bytes.', ('method', 'path'))
+        self.cache_hits = Counter(prefix + 'cache_hits_total', 'Responses served from cache.', ('path',))
+        self.cache_misses = Counter(prefix + 'cache_misses_total', 'Responses not found in cache.', ('path',))
+        self.stub_refreshes = Counter(
+            prefix + 'stub_refreshes_total', 'ORM stubs loaded on attribute access.', ('path',))
+        self.handlers = {
+            events.REQUEST_START: self._on_request_start,
+            events.BODY_READ: self._on_body_read,
+            events.ERROR: self._on_error,
+            events.REQUEST_END: self._on_request_end,
+            events.CACHE_HIT: self._on_cache_hit,
+            events.CACHE_MISS: self._on_cache_miss,
+            events.STUB_REFRESH: self._on_stub_refresh,
+        }
+
+    @property
+    def metrics(self):
+        return [
+            self.requests, self.request_duration, self.retries, self.errors, self.received_bytes, self.sent_bytes,
+            self.cache_hits, self.cache_misses, self.stub_refreshes,
+        ]
+
+    def __call__(self, event):
+        handler = self.handlers.get(event.phase)
+        if handler is not None:
+            with self.lock:
+                handler(event)
+
+    def install(self):
+        events.add_listener(self)
+
+    def uninstall(self):
+        events.remove_listener(self)
+
+    def _on_request_start(self, event):
+        if event.retries == 0 and event.request_size:
+            self.sent_bytes.inc((event.method, event.path), event.request_size)
+
+    def _on_body_read(self, event):
+        if event.size:
+            self.received_bytes.inc((event.method, event.path), event.size)
+
+    def _on_error(self, event):
+        self.errors.inc((event.method, event.path, event.error))
+
+    def _on_request_end(self, event):
+        labels = (event.method, event.path, str(event.status_code or event.error))
+        self.requests.inc(labels)
+        self.request_duration.observe(labels, event.duration)
+        if event.retries:
+            self.retries.inc((event.method, event.path), event.retries)
+
+    def _on_cache_hit(self, event):
+        self.cache_hits.inc((event.path,))
+
+    def _on_cache_miss(self, event):
+        self.cache_misses.inc((event.path,))
+
+    def _on_stub_refresh(self, event):
+        self.stub_refreshes.inc((event.path,))
+
+    def snapshot(self):
+        with self.lock:
+            return {metric.name: metric.snapshot() for metric in self.metrics}
+
+    def to_prometheus(self):
+        lines = []
+        with self.lock:
+            for metric in self.metrics:
+                lines.append('# HELP {} {}'.format(metric.name, metric.documentation))
+                lines.append('# TYPE {} {}'.format(metric.name, metric.type))
+                for name, labels, value in metric.samples():
+                    lines.append('{}{} {}'.format(name, format_labels(labels), format_value(value)))
+        return '\n'.join(lines) + '\n'
+
+
+def format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join('{}="{}"'.format(name, escape(value)) for name, value in labels.items()) + '}'
+
+
+def escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def format_value(value):
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def sort_key(item):
+    return tuple(str(label) for label in item[0])
@@ -11,5 +11,14 @@ class OrmApi:
     def config(cls, *args, **kwargs):
         return cls(base.Api.config(*args, **kwargs))
 
-    def endpoint(self, path):
-        return self.api.endpoint(path)
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.api.close()
+
+    def endpoint(self, path, **kwargs):
+        return self.api.endpoint(path, **kwargs)
@@ -1,14 +1,20 @@
+import time
+
 from jsonapi_requests import data
+from jsonapi_requests import events
+from jsonapi_requests import pagination
 from jsonapi_requests import request_factory
 from jsonapi_requests.orm import fields as orm_fields
+from jsonapi_requests.orm import query_log
 from jsonapi_requests.orm import repositories
 
 
 class JsonApiObjectStub:
     is_stub = True
 
-    def __init__(self, id):
+    def __init__(self, id, relation=None):
         self.id = id
+        self.relation = relation
 
 
 class ApiModelMetaclass(type):
@@ -68,40 +74,105 @@ class Options:
         self.path = path
 
 
+NO_CHANGES = frozenset()
+
+
 class ApiModel(metaclass=ApiModelMetaclass):
-    def __init__(self, raw_object=None):
+    def __init__(self, raw_object=None, *, loaded=False):
         self.raw_object = raw_object or data.JsonApiObject(type=self._options.type)
         self.relationship_cache = {}
+        if loaded or raw_object is None:
+            self.clear_changes()
+        else:
+            self.changed_attributes = frozenset(raw_object.attributes)
+            self.changed_relationships = frozenset(raw_object.relationships)
 
     @classmethod
     def endpoint_path(cls):
         return cls._options.path or cls._options.type
 
     @classmethod
-    def from_id(cls, id):
+    def from_id(cls, id, *, relation=None):
         validate_id_required(id)
-        return cls(raw_object=JsonApiObjectStub(id))
+        return cls(raw_object=JsonApiObjectStub(id, relation), loaded=True)
 
     @classmethod
     def get_list(cls, **kwargs):
+        query_log.record('GET', cls.endpoint_path(), cls)
         response = cls._options.api.endpoint(cls.endpoint_path()).get(**kwargs)
-        return cls.from_response_content(response.content)
+        with events.resumed(response.request_info):
+            return cls.from_response_content(response.content)
+
+    @classmethod
+    def fetch_all(cls, **kwargs):
+        pages = cls._options.api.endpoint(cls.endpoint_path()).fetch_pages(**kwargs)
+        for _ in pages:
+            query_log.record('GET', cls.endpoint_path(), cls)
+        with events.resumed(pages[0].request_info):
+            return cls.from_response_content(pagination.merge(pages))
+
+    @classmethod
+    def iter_all(cls, **kwargs):
+        for response in cls._options.api.endpoint(cls.endpoint_path()).iter_pages(**kwargs):
+            query_log.record('GET', cls.endpoint_path(), cls)
+            with events.resumed(response.request_info):
+                objects = cls.from_response_content(response.content)
+            yield from objects
+
+    @classmethod
+    def stream_list(cls, **kwargs):
+        query_log.record('GET', cls.endpoint_path(), cls)
+        streaming_response = cls._options.api.endpoint(cls.endpoint_path()).stream(**kwargs)
+        # included resources usually follow data, objects are kept until they are read to link relations
+        is_included_requested = 'include' in (kwargs.get('params') or {})
+        repository = None
+        pending = []
+        for raw_object in streaming_response:
+            assert raw_object.type == cls._options.type
+            if is_included_requested and not streaming_response.is_included_read:
+                pending.append(raw_object)
+                continue
+            if repository is None:
+                repository = cls._get_included_repository(streaming_response)
+            yield cls._from_streamed_object(raw_object, repository)
+        if pending:
+            repository = cls._get_included_repository(streaming_response)
+            for raw_object in pending:
+                yield cls._from_streamed_object(raw_object, repository)
+
+    @classmethod
+    def _get_included_repository(cls, streaming_response):
+        repository = repositories.Repository(cls._options.api.type_registry)
+        repository.update_from_api_response(data.JsonApiResponse(included=streaming_response.included))
+        return repository
+
+    @classmethod
+    def _from_streamed_object(cls, raw_object, repository):
+        new = cls(raw_object=raw_object, loaded=True)
+        new.set_related_fields(repository)
+        return new
 
     @classmethod
     def from_response_content(cls, jsonapi_response):
+        start = time.perf_counter() if events.listeners else None
         repository = repositories.Repository(cls._options.api.type_registry)
         if isinstance(jsonapi_response.data, (list, tuple)):
             result = []
             for object in jsonapi_response.data:
                 assert object.type == cls._options.type
-                new = cls(raw_object=object)
+                new = cls(raw_object=object, loaded=True)
                 result.append(new)
                 repository.add(new)
         else:
             assert jsonapi_response.data.type == cls._options.type
-            result = cls(raw_object=jsonapi_response.data)
+            result = cls(raw_object=jsonapi_response.data, loaded=True)
             repository.add(result)
+        if start is not None:
+            hydrated = time.perf_counter()
+            events.emit(events.HYDRATE, hydrated - start)
         repository.update_from_api_response(jsonapi_response)
+        if start is not None:
+            events.emit(events.POPULATE, time.perf_counter() - hydrated)
         return result
 
     @classmethod
@@ -121,6 +192,29 @@ class ApiModel(metaclass=ApiModelMetaclass):
         else:
             return self._options.type
 
+    @property
+    def is_changed(self):
+        return bool(self.changed_attributes or self.changed_relationships)
+
+    def clear_changes(self):
+        self.changed_attributes = self.changed_relationships = NO_CHANGES
+
+    def load_raw_object(self, raw_object):
+        self.raw_object = raw_object
+        self.clear_changes()
+
+    def get_changed_object(self):
+        attributes = self.raw_object.attributes
+        relationships = self.raw_object.relationships
+        return data.JsonApiObject(
+            type=self.type,
+            id=self.id,
+            attributes=data.Dictionary(
+                (name, attributes[name]) for name in attributes if name in self.changed_attributes),
+            relationships=data.Dictionary(
+                (name, relationships[name]) for name in relationships if name in self.changed_relationships),
+        )
+
     @property
     def is_stub(self):
         return getattr(self.raw_object, 'is_stub', False)
@@ -138,7 +232,7 @@ class ApiModel(metaclass=ApiModelMetaclass):
             return getattr(self.raw_object, item)
         except AttributeError:
             if self.is_stub:
-                self.refresh()
+                self.load_stub()
                 return getattr(self.raw_object, item)
             else:
                 raise
@@ -146,15 +240,34 @@ class ApiModel(metaclass=ApiModelMetaclass):
     def as_identifier(self):
         return data.ResourceIdentifier(type=self.type, id=self.id)
 
-    def refresh(self):
+    def refresh(self, **kwargs):
         validate_id_required(self.id)
-        api_response = self.endpoint.get()
-        jsonapi_response = api_response.content
+        query_log.record('GET', self.endpoint.path, type(self))
+        self._load(**kwargs)
+
+    def load_stub(self):
+        validate_id_required(self.id)
+        query_log.record('GET', self.endpoint.path, type(self), self.raw_object.relation, is_stub_refresh=True)
+        api_response = self._load()
+        if events.listeners:
+            with events.resumed(api_response.request_info):
+                events.emit(events.STUB_REFRESH)
+
+    def _load(self, **kwargs):
+        api_response = self.endpoint.get(**kwargs)
+        with events.resumed(api_response.request_info):
+            self.update_from_response_content(api_response.content)
+        return api_response
+
+    def update_from_response_content(self, jsonapi_response):
         assert jsonapi_response.data.type == self.type
         assert jsonapi_response.data.id == self.id
         repository = repositories.Repository(self._options.api.type_registry)
         repository.add(self)
+        start = time.perf_counter() if events.listeners else None
         repository.update_from_api_response(jsonapi_response)
+        if start is not None:
+            events.emit(events.POPULATE, time.perf_counter() - start)
 
     def save(self):
         if not self.id:
@@ -163,16 +276,29 @@ class ApiModel(metaclass=ApiModelMetaclass):
             self.update()
 
     def create(self):
+        query_log.record('POST', self.endpoint_path(), type(self))
         api_response = self._options.api.endpoint(self.endpoint_path()).post(object=self.raw_object)
+        self.clear_changes()
+        self.update_from_create_response(api_response)
+
+    def update_from_create_response(self, api_response):
         if api_response.status_code == 201:
-            self.raw_object = api_response.content.data
+            self.load_raw_object(api_response.content.data)
 
     def update(self):
-        api_response = self.endpoint.patch(object=self.raw_object)
+        if not self.is_changed:
+            return
+        query_log.record('PATCH', self.endpoint.path, type(self))
+        api_response = self.endpoint.patch(object=self.get_changed_object())
+        self.clear_changes()
+        self.update_from_update_response(api_response)
+
+    def update_from_update_response(self, api_response):
         if api_response.status_code == 200 and api_response.content.data:
-            self.raw_object = api_response.content.data
+            self.load_raw_object(api_response.content.data)
 
     def delete(self):
+        query_log.record('DELETE', self.endpoint.path, type(self))
         self.endpoint.delete(object=self.raw_object)
 
     def set_related_fields(self, repository):
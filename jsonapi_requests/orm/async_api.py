@@ -0,0 +1,124 @@
+import asyncio
+
+from jsonapi_requests import async_api
+from jsonapi_requests import events
+from jsonapi_requests import request_factory
+from jsonapi_requests.orm import api
+from jsonapi_requests.orm import api_model
+from jsonapi_requests.orm import query_log
+
+
+class AsyncOrmApi(api.OrmApi):
+    @classmethod
+    def config(cls, *args, **kwargs):
+        return cls(async_api.AsyncApi.config(*args, **kwargs))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def __enter__(self):
+        raise TypeError('Use "async with" with AsyncOrmApi.')
+
+    async def close(self):
+        await self.api.close()
+
+
+class AsyncApiModel(api_model.ApiModel):
+    @classmethod
+    async def get_list(cls, **kwargs):
+        query_log.record('GET', cls.endpoint_path(), cls)
+        response = await cls._options.api.endpoint(cls.endpoint_path()).get(**kwargs)
+        with events.resumed(response.request_info):
+            return cls.from_response_content(response.content)
+
+    @classmethod
+    def fetch_all(cls, **kwargs):
+        raise TypeError('Fetching all pages is not supported by AsyncApiModel, use get_list() instead.')
+
+    @classmethod
+    def iter_all(cls, **kwargs):
+        raise TypeError('Page iteration is not supported by AsyncApiModel, use get_list() instead.')
+
+    @classmethod
+    def stream_list(cls, **kwargs):
+        raise TypeError('Streaming is not supported by AsyncApiModel, use get_list() instead.')
+
+    @classmethod
+    async def exists(cls, id):
+        try:
+            obj = cls.from_id(id)
+            await obj.refresh()
+        except request_factory.ApiClientError:
+            return False
+        else:
+            return True
+
+    def __getattr__(self, item):
+        try:
+            return getattr(self.raw_object, item)
+        except AttributeError:
+            if self.is_stub:
+                raise ObjectNotLoadedError(
+                    '{} is not loaded yet, await refresh() or fetch() first.'.format(self._options.type))
+            else:
+                raise
+
+    async def fetch(self, field_name):
+        if self.is_stub:
+            await self.load_stub()
+        related = getattr(self, field_name)
+        if isinstance(related, list):
+            await asyncio.gather(*(related_object.load_stub() for related_object in related if related_object.is_stub))
+        elif related is not None and related.is_stub:
+            await related.load_stub()
+        return related
+
+    async def refresh(self, **kwargs):
+        api_model.validate_id_required(self.id)
+        query_log.record('GET', self.endpoint.path, type(self))
+        await self._load(**kwargs)
+
+    async def load_stub(self):
+        api_model.validate_id_required(self.id)
+        query_log.record('GET', self.endpoint.path, type(self), self.raw_object.relation, is_stub_refresh=True)
+        api_response = await self._load()
+        if events.listeners:
+            with events.resumed(api_response.request_info):
+                events.emit(events.STUB_REFRESH)
+
+    async def _load(self, **kwargs):
+        api_response = await self.endpoint.get(**kwargs)
+        with events.resumed(api_response.request_info):
+            self.update_from_response_content(api_response.content)
+        return api_response
+
+    async def save(self):
+        if not self.id:
+            await self.create()
+        else:
+            await self.update()
+
+    async def create(self):
+        query_log.record('POST', self.endpoint_path(), type(self))
+        api_response = await self._options.api.endpoint(self.endpoint_path()).post(object=self.raw_object)
+        self.clear_changes()
+        self.update_from_create_response(api_response)
+
+    async def update(self):
+        if not self.is_changed:
+            return
+        query_log.record('PATCH', self.endpoint.path, type(self))
+        api_response = await self.endpoint.patch(object=self.get_changed_object())
+        self.clear_changes()
+        self.update_from_update_response(api_response)
+
+    async def delete(self):
+        query_log.record('DELETE', self.endpoint.path, type(self))
+        await self.endpoint.delete(object=self.raw_object)
+
+
+class ObjectNotLoadedError(AttributeError):
+    pass
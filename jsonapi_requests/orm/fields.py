@@ -1,4 +1,5 @@
 from jsonapi_requests import data
+from jsonapi_requests.orm import query_log
 from jsonapi_requests.orm import repositories
 
 
@@ -22,6 +23,7 @@ class AttributeField(BaseField):
 
     def __set__(self, instance, value):
         instance.attributes[self.source] = value
+        instance.changed_attributes |= {self.source}
 
 
 class RelationField(BaseField):
@@ -40,6 +42,7 @@ class RelationField(BaseField):
         else:
             instance_relation = self.get_instance_to_many_relation(instance)
         instance_relation.set(value)
+        instance.changed_relationships |= {self.source}
 
     def set_related(self, instance, repository):
         self.get_instance_relation(instance).set_related(repository)
@@ -77,6 +80,10 @@ class BaseInstanceRelation:
         self.source = source
         self.cache = InstanceCache(instance, source)
 
+    @property
+    def relation(self):
+        return query_log.Relation(type(self.instance).__name__, self.source)
+
     def get(self):
         raise NotImplementedError
 
@@ -107,7 +114,7 @@ class InstanceToOneRelation(BaseInstanceRelation):
             return None
         else:
             model = self.instance._options.api.type_registry.get_model(key.type)
-            return model.from_id(key.id)
+            return model.from_id(key.id, relation=self.relation)
 
     def set_related(self, repository):
         try:
@@ -165,7 +172,7 @@ class InstanceToManyRelation(BaseInstanceRelation):
 
     def get_new_related_object(self, key):
         model = self.instance._options.api.type_registry.get_model(key.type)
-        return model.from_id(key.id)
+        return model.from_id(key.id, relation=self.relation)
 
     def get_object_keys(self):
         relationship = self.instance.relationships[self.source]
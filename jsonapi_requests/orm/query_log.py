@@ -0,0 +1,102 @@
+import collections
+import contextvars
+import os
+import traceback
+import warnings
+
+import jsonapi_requests
+
+PACKAGE_DIRECTORY = os.path.dirname(jsonapi_requests.__file__)
+
+current_log = contextvars.ContextVar('jsonapi_requests_query_log', default=None)
+
+Query = collections.namedtuple('Query', ['method', 'path', 'model', 'relation', 'is_stub_refresh', 'stack'])
+Relation = collections.namedtuple('Relation', ['model', 'field'])
+
+
+class QueryLog:
+    def __init__(self, budget=None, n_plus_one_threshold=2, action='raise', stack_depth=10):
+        assert action in ('raise', 'warn', None)
+        self.budget = budget
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.action = action
+        self.stack_depth = stack_depth
+        self.queries = []
+        self.stub_refreshes = collections.Counter()
+        self.parent = None
+        self.token = None
+
+    def __enter__(self):
+        self.parent = current_log.get()
+        self.token = current_log.set(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        current_log.reset(self.token)
+
+    def __len__(self):
+        return len(self.queries)
+
+    @property
+    def n_plus_one(self):
+        return {
+            key: count for key, count in self.stub_refreshes.items()
+            if self.n_plus_one_threshold and count >= self.n_plus_one_threshold
+        }
+
+    def add(self, query):
+        self.queries.append(query)
+        if self.budget is not None and len(self.queries) > self.budget:
+            self.report(QueryBudgetExceededError(
+                '{} requests exceed budget of {}, last one: {} {}.'.format(
+                    len(self.queries), self.budget, query.method, query.path)))
+        if query.is_stub_refresh:
+            key = (query.model, query.relation)
+            self.stub_refreshes[key] += 1
+            if self.stub_refreshes[key] == self.n_plus_one_threshold:
+                self.report(NPlusOneError('{} objects loaded one by one{}, load them with include instead.'.format(
+                    query.model, ' through {}.{}'.format(*query.relation) if query.relation else '')))
+
+    def report(self, error):
+        if self.action == 'raise':
+            raise error
+        elif self.action == 'warn':
+            warnings.warn(str(error), QueryLogWarning, stacklevel=get_stack_level())
+
+
+def record(method, path, model, relation=None, is_stub_refresh=False):
+    query_log = current_log.get()
+    if query_log is None:
+        return
+    query = Query(method, path, model.__name__, relation, is_stub_refresh, get_stack(query_log.stack_depth))
+    while query_log is not None:
+        query_log.add(query)
+        query_log = query_log.parent
+
+
+def get_stack(depth):
+    return [frame for frame in traceback.extract_stack() if not is_internal(frame.filename)][-depth:]
+
+
+def get_stack_level():
+    frames = traceback.extract_stack()
+    return next(
+        (level for level, frame in enumerate(reversed(frames)) if not is_internal(frame.filename)),
+        1,
+    )
+
+
+def is_internal(filename):
+    return filename.startswith(PACKAGE_DIRECTORY + os.sep)
+
+
+class QueryBudgetExceededError(Exception):
+    pass
+
+
+class NPlusOneError(Exception):
+    pass
+
+
+class QueryLogWarning(UserWarning):
+    pass
@@ -15,7 +15,7 @@ class TypeRegistry:
 
     def get_orm_object(self, raw_object):
         model = self.get_model(raw_object.type)
-        return model(raw_object)
+        return model(raw_object, loaded=True)
 
     def get_model(self, type):
         return self.registry[type]
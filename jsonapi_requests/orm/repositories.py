@@ -34,7 +34,7 @@ class Repository:
             object = self.type_registry.get_orm_object(raw_object)
             self.object_map[key] = object
         else:
-            self.object_map[key].raw_object = raw_object
+            self.object_map[key].load_raw_object(raw_object)
 
     def pouplate_related(self):
         for object in self.object_map.values():
@@ -0,0 +1,61 @@
+import math
+
+from urllib import parse
+
+from jsonapi_requests import data
+
+TOTAL_KEYS = ['total', 'count', 'total-count', 'total_count', 'totalCount', 'total-results', 'total_results']
+
+
+def get_total(meta):
+    if not isinstance(meta, dict):
+        return None
+    for container in [meta, meta.get('page'), meta.get('pagination')]:
+        if isinstance(container, dict):
+            for key in TOTAL_KEYS:
+                if isinstance(container.get(key), int):
+                    return container[key]
+    return None
+
+
+def get_remaining_page_params(params, next_link, page_length, total):
+    if total is None:
+        raise UnknownPaginationError
+    params = params or {}
+    query = dict(parse.parse_qsl(parse.urlsplit(next_link or '').query))
+    query.update(params)
+    if 'page[offset]' in query or 'page[limit]' in query:
+        limit = int(query.get('page[limit]', page_length))
+        first_offset = int(params.get('page[offset]', 0)) + limit
+        return [
+            dict(params, **{'page[offset]': offset, 'page[limit]': limit})
+            for offset in range(first_offset, total, limit)
+        ]
+    elif 'page[number]' in query or 'page[size]' in query:
+        size = int(query.get('page[size]', page_length))
+        first_number = int(params.get('page[number]', 1)) + 1
+        return [
+            dict(params, **{'page[number]': number, 'page[size]': size})
+            for number in range(first_number, math.ceil(total / size) + 1)
+        ]
+    else:
+        raise UnknownPaginationError
+
+
+def merge(responses):
+    objects = data.make_collection(data.List, data.JsonApiObject, allow_empty_data=True)()
+    included = data.make_collection(data.List, data.JsonApiObject)()
+    seen = set()
+    for response in responses:
+        content = response.content
+        objects.extend(content.data if isinstance(content.data, list) else [content.data])
+        for raw_object in content.included:
+            if (raw_object.type, raw_object.id) not in seen:
+                seen.add((raw_object.type, raw_object.id))
+                included.append(raw_object)
+    first = responses[0].content
+    return data.JsonApiResponse(data=objects, included=included, meta=first.meta, jsonapi=first.jsonapi)
+
+
+class UnknownPaginationError(Exception):
+    pass
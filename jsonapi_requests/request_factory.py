@@ -1,15 +1,153 @@
+import collections
+import contextlib
+import contextvars
+import queue
+import threading
+import time
+
+from concurrent import futures
 from urllib import parse
 
-import requests
 import tenacity
 
+from jsonapi_requests import cache
+from jsonapi_requests import coalescing
 from jsonapi_requests import configuration
 from jsonapi_requests import data
+from jsonapi_requests import deadlines
+from jsonapi_requests import events
+from jsonapi_requests import hedging
+from jsonapi_requests import limiting
+from jsonapi_requests import pagination
+from jsonapi_requests import resilience
+from jsonapi_requests import streaming
+from jsonapi_requests import transport
 
 
 class ApiRequestFactory:
     def __init__(self, config: configuration.Configuration):
         self.config = config
+        self.transport = self.config.TRANSPORT or transport.RequestsTransport(config)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        if self.config.VALIDATOR_CACHE_SIZE:
+            self.validator_cache = cache.ValidatorCache(self.config.VALIDATOR_CACHE_SIZE)
+        else:
+            self.validator_cache = None
+        if self.config.CACHE is not None:
+            self.response_cache = cache.ResponseCache(self.config.CACHE)
+        else:
+            self.response_cache = None
+        if self.config.COALESCE_REQUESTS:
+            self.single_flight = coalescing.SingleFlight()
+        else:
+            self.single_flight = None
+        if self.config.HEDGE_DELAY is not None:
+            self.hedging = hedging.Hedging(
+                self.config.HEDGE_DELAY,
+                self.config.HEDGE_MAX_RATIO,
+                max_workers=2 * (self.config.MAX_WORKERS or self.config.POOL_MAXSIZE),
+            )
+        else:
+            self.hedging = None
+        self._setup_resilience()
+        if self.config.PRECONNECT:
+            self.preconnect()
+
+    def _setup_resilience(self):
+        self._retrying = None
+        if self.config.RETRY_BUDGET is not None:
+            self.retry_budget = resilience.RetryBudget(self.config.RETRY_BUDGET, self.config.RETRY_BUDGET_MIN_RETRIES)
+        else:
+            self.retry_budget = None
+        if self.config.CIRCUIT_BREAKER_THRESHOLD:
+            self.circuit_breakers = resilience.CircuitBreakers(
+                self.config.CIRCUIT_BREAKER_THRESHOLD, self.config.CIRCUIT_BREAKER_TIMEOUT)
+        else:
+            self.circuit_breakers = None
+        if self.config.CONCURRENCY_LIMIT:
+            self.limiters = limiting.Limiters(self.config.CONCURRENCY_LIMIT, self.config.CONCURRENCY_LIMIT_ADAPTIVE)
+        else:
+            self.limiters = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+        if self.hedging is not None:
+            self.hedging.close()
+        self.transport.close()
+
+    @property
+    def executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = futures.ThreadPoolExecutor(
+                    max_workers=self.config.MAX_WORKERS or self.config.POOL_MAXSIZE,
+                    thread_name_prefix='jsonapi-requests',
+                )
+            return self._executor
+
+    def gather(self, calls, max_workers=None):
+        if max_workers is None:
+            return self._gather(self.executor, calls)
+        with futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='jsonapi-requests') as executor:
+            return self._gather(executor, calls)
+
+    def _gather(self, executor, calls):
+        pending = [
+            executor.submit(
+                contextvars.copy_context().run, self.request, call.api_path, call.method, **call.kwargs)
+            for call in calls
+        ]
+        return [future.exception() or future.result() for future in pending]
+
+    def fetch_all(self, api_path, **kwargs):
+        return pagination.merge(self.fetch_pages(api_path, **kwargs))
+
+    def fetch_pages(self, api_path, *, parallelism=None, deadline=None, **kwargs):
+        with deadlines.deadline(self.config.DEADLINE if deadline is None else deadline):
+            return self._fetch_pages(api_path, parallelism, kwargs)
+
+    def _fetch_pages(self, api_path, parallelism, kwargs):
+        first_page = self.get(api_path, **kwargs)
+        content = first_page.content
+        next_link = get_next_link(first_page)
+        if next_link is None or not isinstance(content.data, list) or not content.data:
+            return [first_page]
+        try:
+            params_list = pagination.get_remaining_page_params(
+                kwargs.get('params'), next_link, len(content.data), pagination.get_total(content.meta))
+        except pagination.UnknownPaginationError:
+            link_kwargs = {key: value for key, value in kwargs.items() if key != 'params'}
+            return [first_page] + list(self._iter_pages(next_link, link_kwargs))
+        other_pages = self.gather(
+            (Call(api_path, 'GET', dict(kwargs, params=params)) for params in params_list),
+            max_workers=parallelism,
+        )
+        for index, page in enumerate(other_pages):
+            if isinstance(page, Exception):
+                other_pages[index] = self.get(api_path, **dict(kwargs, params=params_list[index]))
+        return [first_page] + other_pages
+
+    def preconnect(self):
+        connections = min(int(self.config.PRECONNECT), self.config.POOL_MAXSIZE)
+        with futures.ThreadPoolExecutor(max_workers=connections) as executor:
+            for _ in range(connections):
+                executor.submit(self._open_connection)
+
+    def _open_connection(self):
+        options = self.default_options
+        options.update(self.configured_options)
+        try:
+            self.transport.request('HEAD', self.config.API_ROOT, **options)
+        except transport.TransportError:
+            pass
 
     def get(self, api_path, **kwargs):
         return self.request(api_path, 'GET', **kwargs)
@@ -26,79 +164,420 @@ class ApiRequestFactory:
     def patch(self, api_path, **kwargs):
         return self.request(api_path, 'PATCH', **kwargs)
 
-    def request(self, api_path, method, *, object: data.JsonApiObject = None, **kwargs):
-        url = self._build_absolute_url(api_path)
+    def request(self, api_path, method, *, object: data.JsonApiObject = None, use_cache=True, deadline=None,
+                priority=None, **kwargs):
+        with deadlines.deadline(self.config.DEADLINE if deadline is None else deadline), limiting.priority(priority):
+            return self._request_with_retries(api_path, method, object, use_cache, kwargs)
+
+    def _request_with_retries(self, api_path, method, object, use_cache, kwargs):
         if object is not None:
-            assert 'json' not in kwargs
-            kwargs['json'] = {'data': object.as_data()}
+            assert 'json' not in kwargs and 'data' not in kwargs
+            kwargs['data'] = self.config.JSON_CODEC.dumps({'data': object.as_data()})
+        if not events.listeners:
+            return self._dispatch(api_path, method, use_cache, kwargs)
+        with events.request(method, api_path, get_body_size(kwargs.get('data'))):
+            start = time.perf_counter()
+            try:
+                api_response = self._dispatch(api_path, method, use_cache, kwargs)
+            except ApiRequestError as e:
+                emit_request_end(start, e)
+                raise
+            events.emit(events.REQUEST_END, time.perf_counter() - start, status_code=api_response.status_code)
+            return api_response
+
+    def _dispatch(self, api_path, method, use_cache, kwargs):
+        url = self._build_absolute_url(api_path)
+        if self.retry_budget is not None:
+            self.retry_budget.record_request()
+        if method == 'GET' and use_cache and self.response_cache is not None:
+            return self._cached_request(url, kwargs)
+        elif method == 'GET':
+            return self._fetch(url, kwargs)
         return self.retrying(self._request, url, method, **kwargs)
 
+    def iter_pages(self, api_path, *, prefetch=None, **kwargs):
+        prefetch = self.config.PREFETCH_PAGES if prefetch is None else prefetch
+        if not prefetch:
+            yield from self._iter_pages(api_path, kwargs)
+            return
+        pages = queue.Queue()
+        slots = threading.Semaphore(prefetch)
+        stopped = threading.Event()
+        context = contextvars.copy_context()
+        threading.Thread(
+            target=context.run, args=(self._prefetch_pages, api_path, kwargs, pages, slots, stopped), daemon=True,
+        ).start()
+        try:
+            while True:
+                response, exception = pages.get()
+                slots.release()
+                if exception is not None:
+                    raise exception
+                elif response is None:
+                    return
+                yield response
+        finally:
+            stopped.set()
+
+    def _iter_pages(self, api_path, kwargs):
+        while api_path is not None:
+            response = self.get(api_path, **kwargs)
+            yield response
+            api_path = get_next_link(response)
+            kwargs = {key: value for key, value in kwargs.items() if key != 'params'}
+
+    @limiting.priority(limiting.LOW)
+    def _prefetch_pages(self, api_path, kwargs, pages, slots, stopped):
+        try:
+            if not acquire_unless_stopped(slots, stopped):
+                return
+            for response in self._iter_pages(api_path, kwargs):
+                pages.put((response, None))
+                if not acquire_unless_stopped(slots, stopped):
+                    return
+        except Exception as e:
+            pages.put((None, e))
+        else:
+            pages.put((None, None))
+
+    def stream(self, api_path, *, deadline=None, **kwargs):
+        url = self._build_absolute_url(api_path)
+        with deadlines.deadline(self.config.DEADLINE if deadline is None else deadline):
+            if not events.listeners:
+                response = self.retrying(self._stream_request, url, **kwargs)
+            else:
+                response = self._stream_with_events(api_path, url, kwargs)
+        if response.status_code == 204:
+            response.close()
+            return streaming.StreamingJsonApiResponse(response.status_code, [])
+        return streaming.StreamingJsonApiResponse(
+            response.status_code, self._iter_content(response), close=response.close, headers=response.headers,
+            invalid_document_error=get_invalid_document_error,
+        )
+
+    def _iter_content(self, response):
+        try:
+            yield from self.transport.iter_content(response, streaming.CHUNK_SIZE)
+        except transport.TransportError:
+            raise ApiConnectionError
+
+    def _stream_with_events(self, api_path, absolute_url, kwargs):
+        with events.request('GET', api_path):
+            start = time.perf_counter()
+            try:
+                response = self.retrying(self._stream_request, absolute_url, **kwargs)
+            except ApiRequestError as e:
+                emit_request_end(start, e)
+                raise
+            events.emit(events.REQUEST_END, time.perf_counter() - start, status_code=response.status_code)
+            return response
+
+    def _stream_request(self, absolute_url, **kwargs):
+        options = self.default_options
+        options.update(self.configured_options)
+        options.update(kwargs)
+        options['stream'] = True
+        self._apply_deadline(options)
+        with self._concurrency_limit(absolute_url), self._circuit_breaker(absolute_url):
+            response = self._transport_request('GET', absolute_url, options)
+            try:
+                self._raise_for_status(response)
+            except ApiRequestError:
+                response.close()
+                raise
+            return response
+
+    def _cached_request(self, absolute_url, kwargs):
+        try:
+            key = self._get_cache_key(absolute_url, kwargs)
+        except cache.UncacheableRequest:
+            return self._fetch(absolute_url, kwargs)
+        entry, is_stale = self.response_cache.get(key)
+        if entry is None:
+            if events.listeners:
+                events.emit(events.CACHE_MISS)
+            return self._fetch_to_cache(key, absolute_url, kwargs)
+        if events.listeners:
+            events.emit(events.CACHE_HIT)
+        if is_stale and self.response_cache.start_revalidation(key):
+            self.executor.submit(self._revalidate, key, absolute_url, kwargs)
+        return self._make_response(entry.status_code, entry.payload, entry.headers)
+
+    def _fetch_to_cache(self, key, absolute_url, kwargs):
+        api_response = self._fetch(absolute_url, kwargs)
+        self.response_cache.store(key, api_response.status_code, api_response.payload, api_response.headers)
+        return api_response
+
+    def _fetch(self, absolute_url, kwargs):
+        if self.single_flight is not None:
+            try:
+                key = self._get_cache_key(absolute_url, kwargs)
+            except cache.UncacheableRequest:
+                pass
+            else:
+                api_response, shared = self.single_flight.do(key, self.retrying, self._get, absolute_url, **kwargs)
+                return api_response.copy() if shared else api_response
+        return self.retrying(self._get, absolute_url, **kwargs)
+
+    def _get(self, absolute_url, **kwargs):
+        if self.hedging is None:
+            return self._request(absolute_url, 'GET', **kwargs)
+        return self.hedging.run(self._request, absolute_url, 'GET', **kwargs)
+
+    def _get_cache_key(self, absolute_url, kwargs):
+        options = dict(self.configured_options, **kwargs)
+        return cache.make_key(absolute_url, options.get('params'), cache.get_auth_identity(options))
+
+    @limiting.priority(limiting.LOW)
+    def _revalidate(self, key, absolute_url, kwargs):
+        try:
+            self._fetch_to_cache(key, absolute_url, kwargs)
+        except ApiRequestError:
+            pass
+        finally:
+            self.response_cache.finish_revalidation(key)
+
     @property
     def retrying(self):
+        if self._retrying is None:
+            self._retrying = tenacity.Retrying(**self.retrying_options)
+        return self._retrying
+
+    @property
+    def retrying_options(self):
         retry_condition = (
             tenacity.retry_if_exception_type(ApiConnectionError)
             | tenacity.retry_if_exception_type(ApiInternalServerError)
+            | tenacity.retry_if_exception(is_too_many_requests_with_retry_after)
         )
-        return tenacity.Retrying(
-            reraise=True,
-            retry=retry_condition,
-            stop=tenacity.stop_after_attempt(self.config.RETRIES),
+        if self.config.RETRY_BACKOFF:
+            backoff = tenacity.wait_random_exponential(
+                multiplier=self.config.RETRY_BACKOFF, max=self.config.RETRY_BACKOFF_MAX)
+        else:
+            backoff = tenacity.wait_none()
+        stop = (
+            tenacity.stop_after_attempt(self.config.RETRIES)
+            | resilience.stop_if_retry_after_exceeds(self.config.RETRY_BACKOFF_MAX)
+            | resilience.stop_if_deadline_exceeded()
         )
+        if self.retry_budget is not None:
+            stop |= resilience.stop_if_retry_budget_exhausted(self.retry_budget)
+        return {
+            'reraise': True,
+            'before': events.before_attempt,
+            'retry': retry_condition,
+            'wait': resilience.wait_retry_after(backoff),
+            'stop': stop,
+        }
 
     def _build_absolute_url(self, api_path):
-        url = parse.urljoin(self.config.API_ROOT, api_path)
-        if self.config.APPEND_SLASH and not url.endswith('/'):
-            url += '/'
-        return url
+        url = parse.urlsplit(parse.urljoin(self.config.API_ROOT, api_path))
+        if self.config.APPEND_SLASH and not url.path.endswith('/'):
+            url = url._replace(path=url.path + '/')
+        return url.geturl()
 
     def _request(self, absolute_url, method, **kwargs):
         options = self.default_options
         options.update(self.configured_options)
         options.update(kwargs)
+        self._apply_deadline(options)
+        with self._concurrency_limit(absolute_url), self._circuit_breaker(absolute_url):
+            if self.validator_cache is not None and method == 'GET':
+                try:
+                    key = cache.make_key(absolute_url, options.get('params'), cache.get_auth_identity(options))
+                except cache.UncacheableRequest:
+                    pass
+                else:
+                    return self._conditional_request(key, absolute_url, options)
+            return self._parse_response(self._transport_request(method, absolute_url, options))
+
+    def _apply_deadline(self, options):
+        remaining = deadlines.get_remaining()
+        if remaining is None:
+            return
+        elif remaining <= 0:
+            raise ApiDeadlineExceededError
+        options['timeout'] = deadlines.clamp_timeout(options.get('timeout'), remaining)
+
+    @contextlib.contextmanager
+    def _circuit_breaker(self, absolute_url):
+        if self.circuit_breakers is None:
+            yield
+            return
+        host = parse.urlsplit(absolute_url).netloc
+        circuit_breaker = self.circuit_breakers.get(host)
+        if not circuit_breaker.allow_request():
+            raise ApiCircuitOpenError(host)
         try:
-            response = requests.request(method, absolute_url, **options)
-        except (requests.ConnectionError, requests.Timeout):
-            raise ApiConnectionError
+            yield
+        except ApiDeadlineExceededError:
+            circuit_breaker.record_cancelled()
+            raise
+        except (ApiConnectionError, ApiInternalServerError):
+            circuit_breaker.record_failure()
+            raise
+        except Exception:
+            circuit_breaker.record_success()
+            raise
+        else:
+            circuit_breaker.record_success()
+
+    def _conditional_request(self, key, absolute_url, options):
+        options['headers'] = dict(options.get('headers') or {}, **self.validator_cache.get_conditional_headers(key))
+        response = self._transport_request('GET', absolute_url, options)
+        if response.status_code == 304:
+            validators = self.validator_cache.get_not_modified(key)
+            if validators is not None:
+                return self._make_response(validators.status_code, validators.payload, response.headers)
+        api_response = self._parse_response(response)
+        self.validator_cache.store(key, api_response.headers, api_response.status_code, api_response.payload)
+        return api_response
+
+    @contextlib.contextmanager
+    def _concurrency_limit(self, absolute_url):
+        if self.limiters is None:
+            yield
+            return
+        limiter = self.limiters.get(parse.urlsplit(absolute_url).netloc)
+        if not limiter.acquire(limiting.current_priority.get(), deadlines.get_remaining()):
+            raise ApiDeadlineExceededError
+        start = time.monotonic()
+        try:
+            yield
+        except ApiCircuitOpenError:
+            limiter.release()
+            raise
+        except Exception as e:
+            limiter.release(time.monotonic() - start, is_overloaded(e))
+            raise
         else:
-            return self._parse_response(response)
+            limiter.release(time.monotonic() - start)
+
+    def _transport_request(self, method, absolute_url, options):
+        start = None
+        if events.listeners:
+            events.emit(events.REQUEST_START)
+            start = time.perf_counter()
+        try:
+            response = self.transport.request(method, absolute_url, **options)
+        except transport.TransportError:
+            error_class = ApiDeadlineExceededError if is_deadline_exceeded() else ApiConnectionError
+            if events.listeners:
+                events.emit(events.ERROR, error=error_class.__name__)
+            raise error_class
+        if start is not None:
+            emit_response_events(response, time.perf_counter() - start, options.get('stream', False))
+        return response
 
     @property
     def default_options(self):
-        return {
-            'headers': {
-                'Content-Type': 'application/vnd.api+json',
-                'Accept': 'application/vnd.api+json',
-            },
+        headers = {
+            'Content-Type': 'application/vnd.api+json',
+            'Accept': 'application/vnd.api+json',
         }
+        if not self.config.KEEP_ALIVE:
+            headers['Connection'] = 'close'
+        return {'headers': headers}
 
     @property
     def configured_options(self):
         options = {'verify': self.config.VALIDATE_SSL}
         if self.config.AUTH:
             options['auth'] = self.config.AUTH
-        if self.config.TIMEOUT:
-            options['timeout'] = self.config.TIMEOUT
+        if self.timeout:
+            options['timeout'] = self.timeout
         return options
 
+    @property
+    def timeout(self):
+        connect_timeout = self.config.CONNECT_TIMEOUT or self.config.TIMEOUT
+        read_timeout = self.config.READ_TIMEOUT or self.config.TIMEOUT
+        if connect_timeout == read_timeout:
+            return read_timeout
+        return connect_timeout, read_timeout
+
     def _parse_response(self, response):
-        if response.status_code >= 500:
-            raise ApiInternalServerError(response.status_code, response.content)
-        elif response.status_code == 204:
-            return ApiResponse(response.status_code, {})
-        elif 400 <= response.status_code < 500:
-            raise ApiClientError(response.status_code, response.content)
+        self._raise_for_status(response)
+        if response.status_code == 204:
+            return self._make_response(response.status_code, {}, response.headers)
+        start = time.perf_counter() if events.listeners else None
         try:
-            payload = response.json()
+            payload = self.config.JSON_CODEC.loads(response.content)
         except ValueError:
-            raise ApiInvalidResponseError(response.status_code, response.content)
+            raise ApiInvalidResponseError(response.status_code, response.content, response.headers)
+        if start is not None:
+            events.emit(events.DECODE, time.perf_counter() - start)
+        return self._make_response(response.status_code, payload, response.headers)
+
+    def _make_response(self, status_code, payload, headers):
+        return ApiResponse(status_code, payload, headers, view=self.config.VIEW_MODE, interning=self.config.INTERNING)
+
+    def _raise_for_status(self, response):
+        if response.status_code >= 500:
+            error_class = ApiInternalServerError
+        elif 400 <= response.status_code < 500:
+            error_class = ApiClientError
         else:
-            return ApiResponse(response.status_code, payload)
+            return
+        if events.listeners:
+            events.emit(events.ERROR, error=error_class.__name__, status_code=response.status_code)
+        raise error_class(response.status_code, response.content, response.headers)
+
+
+def emit_response_events(response, duration, stream):
+    elapsed = getattr(response, 'elapsed', None)
+    first_byte = elapsed.total_seconds() if elapsed is not None else duration
+    events.emit(events.FIRST_BYTE, first_byte, status_code=response.status_code)
+    if not stream:
+        events.emit(events.BODY_READ, max(duration - first_byte, 0), size=len(response.content))
+
+
+def get_invalid_document_error(status_code, headers):
+    return ApiInvalidResponseError(status_code, b'', headers)
+
+
+def emit_request_end(start, exception):
+    events.emit(
+        events.REQUEST_END, time.perf_counter() - start,
+        error=type(exception).__name__, status_code=getattr(exception, 'status_code', None),
+    )
+
+
+def get_body_size(body):
+    if isinstance(body, (bytes, str)):
+        return len(body)
+    return None
+
+
+def get_next_link(response):
+    next_link = response.content.links.get('next')
+    if isinstance(next_link, dict):
+        next_link = next_link.get('href')
+    return next_link or None
+
+
+def acquire_unless_stopped(slots, stopped):
+    while not stopped.is_set():
+        if slots.acquire(timeout=0.1):
+            return True
+    return False
+
+
+Call = collections.namedtuple('Call', ['api_path', 'method', 'kwargs'])
 
 
 class ApiResponse:
-    def __init__(self, status_code, payload):
+    def __init__(self, status_code, payload, headers=None, *, view=False, interning=False):
         self.status_code = status_code
         self.payload = payload
+        self.headers = headers or {}
+        self.view = view
+        self.interning = interning
+        self.request_info = events.current_request.get()
+        self._content = None
+
+    def copy(self):
+        return ApiResponse(self.status_code, self.payload, self.headers, view=self.view, interning=self.interning)
 
     @property
     def data(self):
@@ -110,7 +589,25 @@ class ApiResponse:
 
     @property
     def content(self):
-        return data.JsonApiResponse.from_data(self.payload)
+        if self._content is None:
+            self._content = self._parse()
+        return self._content
+
+    def _parse(self):
+        if not events.listeners:
+            return self._load_content()
+        with events.resumed(self.request_info):
+            start = time.perf_counter()
+            content = self._load_content()
+            events.emit(events.PARSE, time.perf_counter() - start)
+        return content
+
+    def _load_content(self):
+        content_class = data.JsonApiResponseView if self.view else data.JsonApiResponse
+        if not self.interning:
+            return content_class.from_data(self.payload)
+        with data.interning():
+            return content_class.from_data(self.payload)
 
     def __repr__(self):
         return '<ApiResponse({})>'.format(self.payload)
@@ -125,9 +622,10 @@ class ApiResponseError(ApiRequestError):
 
 
 class ApiInvalidResponseError(ApiRequestError):
-    def __init__(self, status_code, content):
+    def __init__(self, status_code, content, headers=None):
         self.status_code = status_code
         self.content = content
+        self.headers = headers or {}
 
 
 class ApiInternalServerError(ApiInvalidResponseError):
@@ -140,3 +638,32 @@ class ApiClientError(ApiInvalidResponseError):
 
 class ApiConnectionError(ApiRequestError):
     pass
+
+
+class ApiDeadlineExceededError(ApiConnectionError):
+    pass
+
+
+class ApiCircuitOpenError(ApiRequestError):
+    def __init__(self, host):
+        super().__init__('Circuit breaker for {} is open.'.format(host))
+        self.host = host
+
+
+def is_overloaded(exception):
+    if isinstance(exception, ApiInvalidResponseError):
+        return exception.status_code in (429, 503)
+    return isinstance(exception, ApiConnectionError)
+
+
+def is_deadline_exceeded():
+    remaining = deadlines.get_remaining()
+    return remaining is not None and remaining <= 0
+
+
+def is_too_many_requests_with_retry_after(exception):
+    return (
+        isinstance(exception, ApiClientError)
+        and exception.status_code == 429
+        and resilience.parse_retry_after(exception.headers) is not None
+    )
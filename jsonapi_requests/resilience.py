@@ -0,0 +1,158 @@
+import email.utils
+import threading
+import time
+
+import tenacity
+
+from jsonapi_requests import deadlines
+
+
+def parse_retry_after(headers):
+    try:
+        value = headers.get('Retry-After')
+    except AttributeError:
+        return None
+    if not isinstance(value, str):
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at - time.time(), 0)
+
+
+class wait_retry_after(tenacity.wait.wait_base):
+    def __init__(self, fallback):
+        self.fallback = fallback
+
+    def __call__(self, retry_state):
+        backoff = self.fallback(retry_state)
+        retry_after = parse_retry_after(getattr(retry_state.outcome.exception(), 'headers', None))
+        if retry_after is None:
+            return backoff
+        return max(retry_after, backoff)
+
+
+class stop_if_retry_after_exceeds(tenacity.stop.stop_base):
+    def __init__(self, max_delay):
+        self.max_delay = max_delay
+
+    def __call__(self, retry_state):
+        retry_after = parse_retry_after(getattr(retry_state.outcome.exception(), 'headers', None))
+        return retry_after is not None and retry_after > self.max_delay
+
+
+class stop_if_retry_budget_exhausted(tenacity.stop.stop_base):
+    def __init__(self, retry_budget):
+        self.retry_budget = retry_budget
+
+    def __call__(self, retry_state):
+        return not self.retry_budget.acquire_retry()
+
+
+class stop_if_deadline_exceeded(tenacity.stop.stop_base):
+    def __call__(self, retry_state):
+        remaining = deadlines.get_remaining()
+        return remaining is not None and remaining <= getattr(retry_state, 'upcoming_sleep', 0)
+
+
+class RetryBudget:
+    window = 10
+
+    def __init__(self, ratio, min_retries):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.lock = threading.Lock()
+        self.window_start = time.monotonic()
+        self.requests = 0
+        self.retries = 0
+
+    def record_request(self):
+        with self.lock:
+            self._roll_window()
+            self.requests += 1
+
+    def acquire_retry(self):
+        with self.lock:
+            self._roll_window()
+            if self.retries < self.min_retries + self.ratio * self.requests:
+                self.retries += 1
+                return True
+            else:
+                return False
+
+    def _roll_window(self):
+        now = time.monotonic()
+        if now - self.window_start >= self.window:
+            self.window_start = now
+            self.requests = 0
+            self.retries = 0
+
+
+class CircuitBreaker:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.lock = threading.Lock()
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_progress = False
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return self.CLOSED
+        elif self.trial_in_progress or time.monotonic() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        else:
+            return self.OPEN
+
+    def allow_request(self):
+        with self.lock:
+            state = self.state
+            if state == self.CLOSED:
+                return True
+            elif state == self.HALF_OPEN and not self.trial_in_progress:
+                self.trial_in_progress = True
+                return True
+            else:
+                return False
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_in_progress = False
+
+    def record_cancelled(self):
+        with self.lock:
+            self.trial_in_progress = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.trial_in_progress or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self.trial_in_progress = False
+
+
+class CircuitBreakers:
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.lock = threading.Lock()
+        self.breakers = {}
+
+    def get(self, host):
+        with self.lock:
+            if host not in self.breakers:
+                self.breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return self.breakers[host]
@@ -0,0 +1,145 @@
+import codecs
+import json
+
+from jsonapi_requests import data
+
+CHUNK_SIZE = 64 * 1024
+
+
+class StreamingJsonApiResponse:
+    """Document read from ``chunks`` while it is iterated.
+
+    Invalid documents raise ``ValueError``, or the error returned by ``invalid_document_error(status_code, headers)``
+    when it is given.
+    """
+
+    def __init__(self, status_code, chunks, close=None, *, headers=None, invalid_document_error=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.reader = JsonStreamReader(chunks)
+        self.close = close or (lambda: None)
+        self.invalid_document_error = invalid_document_error
+        self.errors = data.List()
+        self.meta = None
+        self.jsonapi = None
+        self.links = data.Dictionary()
+        self.included = data.make_collection(data.List, data.JsonApiObject)()
+        self.is_included_read = False
+        self.is_consumed = False
+
+    def __iter__(self):
+        if self.is_consumed:
+            raise StreamConsumedError
+        self.is_consumed = True
+        try:
+            yield from self._iter_data()
+        except ValueError as e:
+            if self.invalid_document_error is None:
+                raise
+            raise self.invalid_document_error(self.status_code, self.headers) from e
+        finally:
+            self.close()
+
+    def _iter_data(self):
+        reader = self.reader
+        if reader.peek() is None:
+            return
+        reader.expect('{')
+        if reader.peek() == '}':
+            return
+        while True:
+            key = reader.read_value()
+            reader.expect(':')
+            if key == 'data' and reader.peek() == '[':
+                yield from self._iter_array()
+            elif key == 'data':
+                value = reader.read_value()
+                if value is not None:
+                    yield data.JsonApiObject.from_data(value)
+            else:
+                self._set_member(key, reader.read_value())
+            if reader.read_char() == '}':
+                break
+
+    def _iter_array(self):
+        reader = self.reader
+        reader.expect('[')
+        if reader.peek() == ']':
+            reader.expect(']')
+            return
+        while True:
+            yield data.JsonApiObject.from_data(reader.read_value())
+            if reader.read_char() == ']':
+                break
+
+    def _set_member(self, key, value):
+        schema = data.JsonApiResponse.get_schema()
+        if key in schema:
+            setattr(self, key, schema[key].from_data(value))
+        if key == 'included':
+            self.is_included_read = True
+
+
+class JsonStreamReader:
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.json_decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.position = 0
+        self.is_exhausted = False
+
+    def peek(self):
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position].isspace():
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._fill():
+                return None
+
+    def read_char(self):
+        char = self.peek()
+        if char not in (',', '}', ']'):
+            raise ValueError('Unexpected {!r} in JSON stream.'.format(char))
+        self.position += 1
+        return char
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError('Expected {!r} in JSON stream.'.format(char))
+        self.position += 1
+
+    def read_value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.json_decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+            else:
+                # value at the end of buffer may be cut in half, e.g. a number
+                if end < len(self.buffer) or not self._fill():
+                    self.position = end
+                    return value
+
+    def _fill(self):
+        for chunk in self.chunks:
+            text = self.decoder.decode(chunk)
+            if text:
+                self.buffer = self.buffer[self.position:] + text
+                self.position = 0
+                return True
+        if not self.is_exhausted:
+            self.is_exhausted = True
+            text = self.decoder.decode(b'', final=True)
+            if text:
+                self.buffer = self.buffer[self.position:] + text
+                self.position = 0
+                return True
+        return False
+
+
+class StreamConsumedError(Exception):
+    pass
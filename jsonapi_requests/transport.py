@@ -0,0 +1,94 @@
+import json
+
+from urllib import parse
+
+import requests
+
+from jsonapi_requests import configuration
+
+
+class Transport:
+    def request(self, method, url, **options):
+        raise NotImplementedError
+
+    def iter_content(self, response, chunk_size):
+        return response.iter_content(chunk_size)
+
+    def close(self):
+        pass
+
+
+class RequestsTransport(Transport):
+    def __init__(self, config: configuration.Configuration):
+        self.config = config
+        self.session = self._create_session()
+
+    def request(self, method, url, **options):
+        try:
+            return self.session.request(method, url, **options)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            raise TransportError(e)
+
+    def iter_content(self, response, chunk_size):
+        try:
+            yield from response.iter_content(chunk_size)
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+            raise TransportError(e)
+
+    def close(self):
+        self.session.close()
+
+    def _create_session(self):
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.config.POOL_CONNECTIONS,
+            pool_maxsize=self.config.POOL_MAXSIZE,
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+
+class InMemoryTransport(Transport):
+    def __init__(self):
+        self.fixtures = {}
+        self.history = []
+
+    def add(self, method, url, payload=None, *, status_code=200, params=None, headers=None):
+        content = b'' if payload is None else json.dumps(payload).encode()
+        self.fixtures[self._get_key(method, url, params)] = (status_code, content, headers or {})
+
+    def request(self, method, url, *, params=None, **options):
+        self.history.append((method, url, params, options))
+        key = self._get_key(method, url, params)
+        fixture = self.fixtures.get(key) or self.fixtures.get(key[:2] + ((),))
+        if fixture is None:
+            return TransportResponse(404, b'{"errors": [{"status": "404"}]}')
+        status_code, content, headers = fixture
+        return TransportResponse(status_code, content, headers)
+
+    def _get_key(self, method, url, params):
+        split_url = parse.urlsplit(url)
+        query = parse.parse_qsl(split_url.query) + parse.parse_qsl(parse.urlencode(params or {}, doseq=True))
+        return method.upper(), split_url._replace(query='', fragment='').geturl(), tuple(sorted(query))
+
+
+class TransportResponse:
+    def __init__(self, status_code, content, headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        pass
+
+
+class TransportError(Exception):
+    pass
@@ -21,10 +21,11 @@ setup(
     author='Social WiFi',
     author_email='it@socialwifi.com',
     url='https://github.com/socialwifi/jsonapi-requests',
-    packages=find_packages(exclude=['tests']),
+    packages=find_packages(exclude=['tests', 'benchmarks']),
     install_requires=parse_requirements('base_requirements.txt'),
     extras_require={
         'flask': ['flask'],
+        'async': ['httpx'],
     },
     python_requires='>=3.9',
     license='BSD',
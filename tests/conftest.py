@@ -0,0 +1,15 @@
+from unittest import mock
+
+import pytest
+
+
+@pytest.fixture
+def request_mock():
+    with mock.patch('requests.Session.request') as mocked:
+        yield mocked
+
+
+@pytest.fixture
+def sleep_mock():
+    with mock.patch('time.sleep') as mocked:
+        yield mocked
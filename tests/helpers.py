@@ -0,0 +1,17 @@
+import json
+
+from unittest import mock
+
+from jsonapi_requests import configuration
+from jsonapi_requests import request_factory
+
+
+def make_response(status_code, payload=None, headers=None):
+    response = mock.Mock(status_code=status_code, headers=headers or {})
+    response.content = json.dumps(payload if payload is not None else {}).encode()
+    return response
+
+
+def make_factory(**config):
+    config = configuration.Factory(dict({'API_ROOT': 'http://testing'}, **config)).create()
+    return request_factory.ApiRequestFactory(config)
@@ -0,0 +1,329 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from jsonapi_requests import async_api
+from jsonapi_requests import data
+from jsonapi_requests import events
+from jsonapi_requests import limiting
+from jsonapi_requests import orm
+from jsonapi_requests import request_factory
+from jsonapi_requests.orm import async_api as orm_async_api
+from jsonapi_requests.orm import query_log
+
+
+def make_api(handler, **config):
+    api = async_api.AsyncApi.config({'API_ROOT': 'http://testing', 'RETRIES': 2}, **config)
+    api.requests.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return api
+
+
+def json_response(payload, status_code=200):
+    return httpx.Response(status_code, content=json.dumps(payload).encode())
+
+
+def test_get():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return json_response({'data': {'type': 'test', 'id': '1'}})
+
+    async def run():
+        async with make_api(handler) as api:
+            return await api.endpoint('test/1').get(params={'include': 'other'})
+
+    response = asyncio.run(run())
+    assert response.data == data.JsonApiObject(type='test', id='1')
+    assert str(requests[0].url) == 'http://testing/test/1/?include=other'
+    assert requests[0].headers['Accept'] == 'application/vnd.api+json'
+
+
+def test_post_object():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return json_response({'data': {'type': 'test', 'id': '1'}}, status_code=201)
+
+    async def run():
+        async with make_api(handler) as api:
+            return await api.endpoint('test').post(object=data.JsonApiObject(type='test'))
+
+    response = asyncio.run(run())
+    assert response.status_code == 201
+    assert json.loads(requests[0].content) == {'data': {'type': 'test'}}
+
+
+def test_retrying():
+    responses = [httpx.ConnectError('failed'), json_response({})]
+
+    def handler(request):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    async def run():
+        async with make_api(handler) as api:
+            return await api.endpoint('test').get()
+
+    assert asyncio.run(run()).content == data.JsonApiResponse.from_data({})
+
+
+def test_deadline_clamps_split_timeouts():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return json_response({})
+
+    async def run():
+        async with make_api(handler, CONNECT_TIMEOUT=0.5, READ_TIMEOUT=5) as api:
+            await api.endpoint('test').get(deadline=2)
+
+    asyncio.run(run())
+    timeout = requests[0].extensions['timeout']
+    assert timeout['connect'] == 0.5
+    assert 1.5 < timeout['read'] <= 2
+
+
+def test_expired_deadline():
+    async def run():
+        async with make_api(lambda request: json_response({})) as api:
+            await api.endpoint('test').get(deadline=-1)
+
+    with pytest.raises(request_factory.ApiDeadlineExceededError):
+        asyncio.run(run())
+
+
+def test_reraises():
+    def handler(request):
+        return httpx.Response(500)
+
+    async def run():
+        async with make_api(handler) as api:
+            await api.endpoint('test').get()
+
+    with pytest.raises(request_factory.ApiInternalServerError):
+        asyncio.run(run())
+
+
+class TestAsyncApiModel:
+    @pytest.fixture
+    def payloads(self):
+        return {
+            '/car/2/': {
+                'data': {
+                    'type': 'car', 'id': '2', 'attributes': {'color': 'red'},
+                    'relationships': {'driver': {'data': {'type': 'person', 'id': '3'}}},
+                },
+            },
+            '/person/3/': {'data': {'type': 'person', 'id': '3', 'attributes': {'name': 'Kowalski'}}},
+            '/person/4/': {'data': {'type': 'person', 'id': '4', 'attributes': {'name': 'Nowak'}}},
+            '/car/': {
+                'data': [
+                    {
+                        'type': 'car', 'id': '2', 'attributes': {'color': 'red'},
+                        'relationships': {'driver': {'data': {'type': 'person', 'id': '3'}}},
+                    },
+                    {
+                        'type': 'car', 'id': '5', 'attributes': {'color': 'blue'},
+                        'relationships': {'driver': {'data': {'type': 'person', 'id': '4'}}},
+                    },
+                ],
+            },
+        }
+
+    @pytest.fixture
+    def orm_api(self, payloads):
+        return orm_async_api.AsyncOrmApi(make_api(lambda request: json_response(payloads[request.url.path])))
+
+    @pytest.fixture
+    def models(self, orm_api):
+        class Person(orm_async_api.AsyncApiModel):
+            class Meta:
+                type = 'person'
+                api = orm_api
+
+            name = orm.AttributeField('name')
+
+        class Car(orm_async_api.AsyncApiModel):
+            class Meta:
+                type = 'car'
+                api = orm_api
+
+            color = orm.AttributeField('color')
+            driver = orm.RelationField('driver')
+
+        return Car, Person
+
+    def test_refresh(self, models):
+        car_model, _ = models
+        car = car_model.from_id('2')
+        asyncio.run(car.refresh())
+        assert car.color == 'red'
+
+    def test_stub_is_not_loaded_implicitly(self, models):
+        car_model, _ = models
+        car = car_model.from_id('2')
+        with pytest.raises(orm_async_api.ObjectNotLoadedError):
+            car.color
+
+    def test_fetch_relation(self, models):
+        car_model, _ = models
+        car = car_model.from_id('2')
+        driver = asyncio.run(car.fetch('driver'))
+        assert driver.name == 'Kowalski'
+        assert car.driver is driver
+
+    def test_get_list(self, models):
+        car_model, _ = models
+        cars = asyncio.run(car_model.get_list())
+        assert [car.color for car in cars] == ['red', 'blue']
+
+    def test_queries_are_logged(self, models):
+        car_model, _ = models
+
+        async def run():
+            await car_model.get_list()
+            car = car_model.from_id('2')
+            await car.fetch('driver')
+            await car.refresh()
+
+        with query_log.QueryLog(action=None) as log:
+            asyncio.run(run())
+        assert [(query.method, query.path, query.model, query.is_stub_refresh) for query in log.queries] == [
+            ('GET', 'car', 'Car', False),
+            ('GET', 'car/2', 'Car', True),
+            ('GET', 'person/3', 'Person', True),
+            ('GET', 'car/2', 'Car', False),
+        ]
+        assert log.queries[2].relation == query_log.Relation('Car', 'driver')
+
+    def test_n_plus_one_raises(self, models):
+        car_model, _ = models
+
+        async def run():
+            for car in await car_model.get_list():
+                await car.fetch('driver')
+
+        with query_log.QueryLog():
+            with pytest.raises(query_log.NPlusOneError, match='Person objects loaded one by one through Car.driver'):
+                asyncio.run(run())
+
+    def test_paginating_methods_are_not_supported(self, models):
+        car_model, _ = models
+        with pytest.raises(TypeError):
+            car_model.fetch_all()
+        with pytest.raises(TypeError):
+            car_model.stream_list()
+        with pytest.raises(TypeError):
+            car_model.iter_all()
+
+
+def test_get_many():
+    def handler(request):
+        if request.url.params['page'] == '2':
+            return httpx.Response(404)
+        return json_response({'data': [{'type': 'test', 'id': request.url.params['page']}]})
+
+    async def run():
+        async with make_api(handler) as api:
+            return await api.endpoint('test').get_many([{'page': 1}, {'page': 2}])
+
+    responses = asyncio.run(run())
+    assert responses[0].data[0].id == '1'
+    assert isinstance(responses[1], request_factory.ApiClientError)
+
+
+def test_get_many_is_limited_by_max_workers():
+    in_flight = []
+    max_in_flight = []
+
+    async def handler(request):
+        in_flight.append(request)
+        max_in_flight.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(request)
+        return json_response({'data': []})
+
+    async def run():
+        async with make_api(handler, MAX_WORKERS=3) as api:
+            return await api.endpoint('test').get_many([{'page': page} for page in range(10)])
+
+    responses = asyncio.run(run())
+    assert len(responses) == 10
+    assert max(max_in_flight) == 3
+
+
+def test_paginating_methods_are_not_supported():
+    api = make_api(lambda request: json_response({}))
+    with pytest.raises(TypeError):
+        api.endpoint('test').fetch_all()
+    with pytest.raises(TypeError):
+        api.endpoint('test').stream()
+    with pytest.raises(TypeError):
+        api.endpoint('test').iter_pages()
+
+
+def test_request_events():
+    recorded = []
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.path == '/broken/':
+            raise httpx.ConnectError('failed')
+        return json_response({'data': {'type': 'test', 'id': '1'}})
+
+    async def run():
+        async with make_api(handler, RETRIES=1) as api:
+            await api.endpoint('test/1').post(object=data.JsonApiObject(type='test', id='1'))
+            with pytest.raises(request_factory.ApiConnectionError):
+                await api.endpoint('broken').get()
+
+    events.add_listener(recorded.append)
+    try:
+        asyncio.run(run())
+    finally:
+        events.remove_listener(recorded.append)
+    assert [event.phase for event in recorded] == [
+        events.REQUEST_START, events.FIRST_BYTE, events.BODY_READ, events.DECODE, events.REQUEST_END,
+        events.REQUEST_START, events.ERROR, events.REQUEST_END,
+    ]
+    body_read = recorded[2]
+    assert body_read.size == len(b'{"data": {"type": "test", "id": "1"}}')
+    assert body_read.request_size == len(requests[0].content)
+    assert recorded[6].error == 'ApiConnectionError'
+
+
+@pytest.mark.parametrize('setting', [
+    {'TRANSPORT': object()},
+    {'VALIDATOR_CACHE_SIZE': 10},
+    {'CACHE': object()},
+    {'COALESCE_REQUESTS': True},
+    {'HEDGE_DELAY': 0.1},
+    {'CONCURRENCY_LIMIT': 4},
+])
+def test_unsupported_settings(setting):
+    with pytest.raises(ValueError, match='not supported by AsyncApi'):
+        async_api.AsyncApi.config({'API_ROOT': 'http://testing'}, **setting)
+
+
+def test_sync_request_options_are_accepted():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return json_response({})
+
+    async def run():
+        async with make_api(handler) as api:
+            await api.endpoint('test', use_cache=False).get(priority=limiting.HIGH)
+            await api.endpoint('test').get(use_cache=False)
+
+    asyncio.run(run())
+    assert len(requests) == 2
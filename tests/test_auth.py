@@ -1,3 +1,5 @@
+import json
+
 from unittest import mock
 
 import pytest
@@ -23,7 +25,7 @@ def flask_app():
 @pytest.fixture
 def valid_response():
     response = mock.Mock(status_code=200)
-    response.json.return_value = {}
+    response.content = json.dumps({}).encode()
     return response
 
 
@@ -0,0 +1,229 @@
+import os
+import sqlite3
+
+from unittest import mock
+
+import pytest
+
+from jsonapi_requests import base
+from jsonapi_requests import cache
+from jsonapi_requests import configuration
+from jsonapi_requests import request_factory
+from jsonapi_requests import transport
+from tests.helpers import make_response
+
+
+@pytest.fixture
+def api_configuration():
+    return configuration.Factory({'API_ROOT': 'http://testing', 'VALIDATOR_CACHE_SIZE': 2}).create()
+
+
+class TestLRUCache:
+    def test_evicts_least_recently_used(self):
+        lru_cache = cache.LRUCache(2)
+        lru_cache.set('a', 1)
+        lru_cache.set('b', 2)
+        lru_cache.get('a')
+        lru_cache.set('c', 3)
+        assert lru_cache.get('a') == 1
+        assert lru_cache.get('b') is None
+        assert lru_cache.get('c') == 3
+        assert len(lru_cache) == 2
+
+
+class TestConditionalRequests:
+    def test_returns_cached_response_when_not_modified(self, api_configuration, request_mock):
+        request_mock.side_effect = [
+            make_response(200, {'data': {'type': 'test', 'id': '1'}}, {'ETag': '"abc"'}),
+            make_response(304),
+        ]
+        factory = request_factory.ApiRequestFactory(api_configuration)
+        factory.get('test/1')
+        response = factory.get('test/1')
+        assert response.status_code == 200
+        assert response.data.id == '1'
+        _, kwargs = request_mock.call_args
+        assert kwargs['headers']['If-None-Match'] == '"abc"'
+        assert factory.validator_cache.hits == 1
+        assert factory.validator_cache.misses == 1
+
+    def test_modifying_response_does_not_modify_stored_payload(self, api_configuration, request_mock):
+        request_mock.side_effect = [
+            make_response(200, {'data': {'type': 'test', 'id': '1'}}, {'ETag': '"abc"'}),
+            make_response(304),
+            make_response(304),
+        ]
+        factory = request_factory.ApiRequestFactory(api_configuration)
+        factory.get('test/1').payload['data']['id'] = '2'
+        factory.get('test/1').payload['data']['id'] = '3'
+        assert factory.get('test/1').data.id == '1'
+
+    def test_sends_if_modified_since(self, api_configuration, request_mock):
+        request_mock.side_effect = [
+            make_response(200, {}, {'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}),
+            make_response(200, {}),
+        ]
+        factory = request_factory.ApiRequestFactory(api_configuration)
+        factory.get('test', params={'page': 1})
+        factory.get('test', params={'page': 1})
+        _, kwargs = request_mock.call_args
+        assert kwargs['headers']['If-Modified-Since'] == 'Wed, 21 Oct 2015 07:28:00 GMT'
+        assert factory.validator_cache.misses == 2
+
+    def test_params_are_part_of_key(self, api_configuration, request_mock):
+        request_mock.side_effect = [make_response(200, {}, {'ETag': '"abc"'}), make_response(200, {})]
+        factory = request_factory.ApiRequestFactory(api_configuration)
+        factory.get('test', params={'page': 1})
+        factory.get('test', params={'page': 2})
+        _, kwargs = request_mock.call_args
+        assert 'If-None-Match' not in kwargs['headers']
+
+    def test_auth_is_part_of_key(self, api_configuration, request_mock):
+        request_mock.side_effect = [make_response(200, {}, {'ETag': '"abc"'}), make_response(200, {})]
+        factory = request_factory.ApiRequestFactory(api_configuration)
+        factory.get('test', headers={'Authorization': 'Bearer first'})
+        factory.get('test', headers={'Authorization': 'Bearer second'})
+        _, kwargs = request_mock.call_args
+        assert 'If-None-Match' not in kwargs['headers']
+
+    def test_callable_auth_skips_validators(self, api_configuration, request_mock):
+        request_mock.side_effect = [make_response(200, {}, {'ETag': '"abc"'}), make_response(200, {})]
+        factory = request_factory.ApiRequestFactory(api_configuration)
+        factory.get('test', auth=lambda request: request)
+        factory.get('test', auth=lambda request: request)
+        _, kwargs = request_mock.call_args
+        assert 'If-None-Match' not in kwargs['headers']
+        assert factory.validator_cache.misses == 0
+
+    def test_disabled_by_default(self, request_mock):
+        request_mock.return_value = make_response(200, {}, {'ETag': '"abc"'})
+        config = configuration.Factory({'API_ROOT': 'http://testing'}).create()
+        factory = request_factory.ApiRequestFactory(config)
+        factory.get('test')
+        factory.get('test')
+        _, kwargs = request_mock.call_args
+        assert 'If-None-Match' not in kwargs['headers']
+        assert factory.validator_cache is None
+
+
+class TestResponseCache:
+    @pytest.fixture
+    def memory_transport(self):
+        memory_transport = transport.InMemoryTransport()
+        memory_transport.add(
+            'GET', 'http://testing/test/1/', {'data': {'type': 'test', 'id': '1'}},
+            headers={'Cache-Control': 'max-age=60'},
+        )
+        return memory_transport
+
+    def make_api(self, memory_transport, backend, **config):
+        return base.Api.config(
+            {'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport, 'CACHE': backend}, **config)
+
+    def test_serves_fresh_response_from_cache(self, memory_transport):
+        api = self.make_api(memory_transport, cache.MemoryBackend())
+        api.endpoint('test/1').get()
+        response = api.endpoint('test/1').get()
+        assert response.data.id == '1'
+        assert len(memory_transport.history) == 1
+        assert api.requests.response_cache.hits == 1
+        assert api.requests.response_cache.misses == 1
+
+    def test_modifying_response_does_not_modify_cache(self, memory_transport):
+        api = self.make_api(memory_transport, cache.MemoryBackend())
+        first = api.endpoint('test/1').get()
+        first.payload['data']['id'] = '2'
+        cached = api.endpoint('test/1').get()
+        cached.payload['data']['id'] = '3'
+        cached.headers['Cache-Control'] = 'no-store'
+        response = api.endpoint('test/1').get()
+        assert response.data.id == '1'
+        assert response.headers['Cache-Control'] == 'max-age=60'
+        assert len(memory_transport.history) == 1
+
+    def test_endpoint_opt_out(self, memory_transport):
+        api = self.make_api(memory_transport, cache.MemoryBackend())
+        api.endpoint('test/1', use_cache=False).get()
+        api.endpoint('test/1', use_cache=False).get()
+        assert len(memory_transport.history) == 2
+
+    def test_does_not_store_without_freshness(self, memory_transport):
+        memory_transport.add('GET', 'http://testing/test/2/', {}, headers={'Cache-Control': 'no-cache, max-age=60'})
+        api = self.make_api(memory_transport, cache.MemoryBackend())
+        api.endpoint('test/2').get()
+        api.endpoint('test/2').get()
+        assert len(memory_transport.history) == 2
+
+    def test_expires_header(self, memory_transport):
+        memory_transport.add('GET', 'http://testing/test/2/', {}, headers={'Expires': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+        memory_transport.add('GET', 'http://testing/test/3/', {}, headers={'Expires': 'Wed, 21 Oct 2099 07:28:00 GMT'})
+        api = self.make_api(memory_transport, cache.MemoryBackend())
+        for _ in range(2):
+            api.endpoint('test/2').get()
+            api.endpoint('test/3').get()
+        assert [url for _, url, _, _ in memory_transport.history] == [
+            'http://testing/test/2/', 'http://testing/test/3/', 'http://testing/test/2/',
+        ]
+
+    def test_stale_while_revalidate(self, memory_transport):
+        memory_transport.add(
+            'GET', 'http://testing/test/2/', {'data': {'type': 'test', 'id': '2'}},
+            headers={'Cache-Control': 'max-age=0, stale-while-revalidate=60'},
+        )
+        api = self.make_api(memory_transport, cache.MemoryBackend())
+        api.endpoint('test/2').get()
+        response = api.endpoint('test/2').get()
+        api.close()
+        assert response.data.id == '2'
+        assert api.requests.response_cache.stale_hits == 1
+        assert len(memory_transport.history) == 2
+
+    def test_callable_auth_is_not_cached(self, memory_transport):
+        api = self.make_api(memory_transport, cache.MemoryBackend(), AUTH=lambda request: request)
+        api.endpoint('test/1').get()
+        api.endpoint('test/1').get()
+        assert len(memory_transport.history) == 2
+
+    def test_auth_is_part_of_key(self, memory_transport):
+        api = self.make_api(memory_transport, cache.MemoryBackend())
+        api.endpoint('test/1').get(headers={'Authorization': 'Bearer 1'})
+        api.endpoint('test/1').get(headers={'Authorization': 'Bearer 2'})
+        api.endpoint('test/1').get(headers={'Authorization': 'Bearer 1'})
+        assert len(memory_transport.history) == 2
+
+    def test_sqlite_backend_survives_restart(self, memory_transport, tmp_path):
+        path = str(tmp_path / 'cache.sqlite')
+        self.make_api(memory_transport, cache.SqliteBackend(path)).endpoint('test/1').get()
+        response = self.make_api(memory_transport, cache.SqliteBackend(path)).endpoint('test/1').get()
+        assert response.data.id == '1'
+        assert len(memory_transport.history) == 1
+
+    def test_sqlite_backend_limits_size(self, tmp_path):
+        backend = cache.SqliteBackend(str(tmp_path / 'cache.sqlite'), max_size=2)
+        for i in range(3):
+            backend.set(('url', i), cache.CacheEntry(200, {}, {}, i, i))
+        assert backend.get(('url', 0)) is None
+        assert backend.get(('url', 2)) == cache.CacheEntry(200, {}, {}, 2, 2)
+
+    def test_sqlite_backend_evicts_using_index(self, tmp_path):
+        backend = cache.SqliteBackend(str(tmp_path / 'cache.sqlite'))
+        plan = backend.connection.execute(
+            'EXPLAIN QUERY PLAN SELECT key FROM responses ORDER BY stale_until LIMIT 1').fetchall()
+        assert any('responses_stale_until' in row[-1] for row in plan)
+
+    def test_sqlite_backend_connects_in_each_process(self, tmp_path):
+        backend = cache.SqliteBackend(str(tmp_path / 'cache.sqlite'))
+        backend.set(('url',), cache.CacheEntry(200, {}, {}, 1, 1))
+        parent_connection = backend.connection
+        with mock.patch('os.getpid', return_value=-1):
+            assert backend.connection is not parent_connection
+            assert backend.get(('url',)) == cache.CacheEntry(200, {}, {}, 1, 1)
+
+    def test_sqlite_errors_are_cache_misses(self, memory_transport, tmp_path):
+        backend = cache.SqliteBackend(str(tmp_path / 'cache.sqlite'))
+        backend._connection = mock.Mock(execute=mock.Mock(side_effect=sqlite3.OperationalError('database is locked')))
+        backend._pid = os.getpid()
+        api = self.make_api(memory_transport, backend)
+        assert api.endpoint('test/1').get().data.id == '1'
+        assert api.endpoint('test/1').get().data.id == '1'
+        assert len(memory_transport.history) == 2
@@ -0,0 +1,103 @@
+import json
+import threading
+
+from unittest import mock
+
+import pytest
+
+from jsonapi_requests import coalescing
+from jsonapi_requests import configuration
+from jsonapi_requests import request_factory
+
+
+class TestSingleFlight:
+    def test_shares_result_of_concurrent_calls(self):
+        single_flight = coalescing.SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def function(value):
+            calls.append(value)
+            release.wait()
+            return value
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(single_flight.do('key', function, 'result')))
+            for _ in range(5)
+        ]
+        threads[0].start()
+        while not calls:
+            pass
+        for thread in threads[1:]:
+            thread.start()
+        while single_flight.collapsed < 4:
+            pass
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert calls == ['result']
+        assert sorted(results) == [('result', False)] + [('result', True)] * 4
+
+    def test_shares_exception(self):
+        single_flight = coalescing.SingleFlight()
+        release = threading.Event()
+        errors = []
+
+        def function():
+            release.wait()
+            raise ValueError
+
+        def call():
+            try:
+                single_flight.do('key', function)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        while single_flight.collapsed < 2:
+            pass
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert len(errors) == 3
+        assert single_flight.calls == {}
+
+    def test_sequential_calls_are_not_collapsed(self):
+        single_flight = coalescing.SingleFlight()
+        assert single_flight.do('key', lambda: 1) == (1, False)
+        assert single_flight.do('key', lambda: 2) == (2, False)
+        assert single_flight.collapsed == 0
+
+
+@pytest.fixture
+def api_configuration():
+    return configuration.Factory({'API_ROOT': 'http://testing', 'COALESCE_REQUESTS': True}).create()
+
+
+def test_concurrent_identical_gets_are_collapsed(api_configuration):
+    release = threading.Event()
+
+    def fake_request(method, url, **kwargs):
+        release.wait()
+        response = mock.Mock(status_code=200, headers={})
+        response.content = json.dumps({'data': {'type': 'test', 'id': '1'}}).encode()
+        return response
+
+    with mock.patch('requests.Session.request', side_effect=fake_request) as request_mock:
+        factory = request_factory.ApiRequestFactory(api_configuration)
+        pending = [factory.executor.submit(factory.get, 'test/1') for _ in range(3)]
+        while factory.single_flight.collapsed < 2:
+            pass
+        release.set()
+        responses = [future.result() for future in pending]
+    assert request_mock.call_count == 1
+    assert [response.data.id for response in responses] == ['1', '1', '1']
+    assert len({id(response) for response in responses}) == 3
+
+
+def test_different_auth_is_not_collapsed(api_configuration):
+    factory = request_factory.ApiRequestFactory(api_configuration)
+    assert factory._get_cache_key('url', {'auth': ('a', 'b')}) != factory._get_cache_key('url', {'auth': ('a', 'c')})
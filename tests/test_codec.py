@@ -0,0 +1,45 @@
+from unittest import mock
+
+import pytest
+
+from jsonapi_requests import codec
+from jsonapi_requests import configuration
+from jsonapi_requests import data
+from jsonapi_requests import request_factory
+
+
+@pytest.fixture(params=['json', 'orjson', 'ujson'])
+def json_codec(request):
+    if request.param == 'json':
+        return codec.JsonCodec()
+    pytest.importorskip(request.param)
+    return {'orjson': codec.OrjsonCodec, 'ujson': codec.UjsonCodec}[request.param]()
+
+
+def test_codec_round_trip(json_codec):
+    payload = {'data': {'type': 'test', 'id': '1', 'attributes': {'name': 'zażółć', 'count': 2, 'tags': None}}}
+    encoded = json_codec.dumps(payload)
+    assert isinstance(encoded, bytes)
+    assert json_codec.loads(encoded) == payload
+
+
+def test_codec_raises_value_error(json_codec):
+    with pytest.raises(ValueError):
+        json_codec.loads(b'<html>')
+
+
+def test_get_fastest_codec():
+    with mock.patch.object(codec, 'orjson', None), mock.patch.object(codec, 'ujson', None):
+        assert type(codec.get_fastest_codec()) is codec.JsonCodec
+
+
+def test_configured_codec_is_used_for_request_and_response():
+    json_codec = mock.Mock(wraps=codec.JsonCodec())
+    config = configuration.Factory({'API_ROOT': 'http://testing', 'JSON_CODEC': json_codec}).create()
+    with mock.patch('requests.Session.request') as request_mock:
+        request_mock.return_value = mock.Mock(status_code=201, content=b'{"data": {"type": "test", "id": "1"}}')
+        response = request_factory.ApiRequestFactory(config).post('test', object=data.JsonApiObject(type='test'))
+    _, kwargs = request_mock.call_args
+    assert kwargs['data'] == b'{"data":{"type":"test"}}'
+    assert response.data.id == '1'
+    json_codec.loads.assert_called_once_with(b'{"data": {"type": "test", "id": "1"}}')
@@ -1,3 +1,7 @@
+from unittest import mock
+
+import pytest
+
 import jsonapi_requests.data
 
 
@@ -119,3 +123,198 @@ example_response = {
     },
   }],
 }
+
+
+class TestLazyList:
+    def test_objects_are_parsed_when_accessed(self):
+        parsed = jsonapi_requests.data.JsonApiResponse.from_data({
+            'data': [{'id': '1', 'type': 'x'}, {'id': '2', 'type': 'x'}],
+        })
+        assert isinstance(list.__getitem__(parsed.data, 1), dict)
+        assert parsed.data[1].id == '2'
+        assert parsed.data[1] is parsed.data[1]
+        assert isinstance(list.__getitem__(parsed.data, 0), dict)
+
+    def test_behaves_like_list(self):
+        collection = jsonapi_requests.data.make_collection(
+            jsonapi_requests.data.LazyList, jsonapi_requests.data.JsonApiObject)
+        lazy = collection.from_data([{'id': '1', 'type': 'x'}, {'id': '2', 'type': 'x'}, {'id': '3', 'type': 'x'}])
+        first = jsonapi_requests.data.JsonApiObject(id='1', type='x')
+        assert [item.id for item in lazy] == ['1', '2', '3']
+        assert [item.id for item in reversed(lazy)] == ['3', '2', '1']
+        assert [item.id for item in lazy[1:]] == ['2', '3']
+        assert [item.id for item in list(lazy)] == ['1', '2', '3']
+        assert first in lazy
+        assert lazy.index(first) == 0
+        assert lazy.count(first) == 1
+        assert lazy.pop().id == '3'
+        lazy.sort(key=lambda item: item.id, reverse=True)
+        assert [item.id for item in lazy.copy()] == ['2', '1']
+        assert lazy.as_data() == [{'id': '2', 'type': 'x'}, {'id': '1', 'type': 'x'}]
+
+    @pytest.mark.parametrize('combine', [
+        lambda lazy: lazy + [],
+        lambda lazy: [] + lazy,
+        lambda lazy: lazy * 2,
+        lambda lazy: 2 * lazy,
+        lambda lazy: lazy.copy(),
+    ])
+    def test_combining_parses_objects(self, combine):
+        collection = jsonapi_requests.data.make_collection(
+            jsonapi_requests.data.LazyList, jsonapi_requests.data.JsonApiObject)
+        combined = combine(collection.from_data([{'id': '1', 'type': 'x'}]))
+        assert all(isinstance(list.__getitem__(combined, index), jsonapi_requests.data.JsonApiObject)
+                   for index in range(len(combined)))
+
+    def test_in_place_multiplication_parses_objects(self):
+        collection = jsonapi_requests.data.make_collection(
+            jsonapi_requests.data.LazyList, jsonapi_requests.data.JsonApiObject)
+        lazy = collection.from_data([{'id': '1', 'type': 'x'}])
+        lazy *= 2
+        assert isinstance(lazy, collection)
+        assert [list.__getitem__(lazy, index).id for index in range(2)] == ['1', '1']
+
+    def test_keeps_example_in_lazy_collection(self):
+        parsed = jsonapi_requests.data.JsonApiResponse.from_data(example_response)
+        assert parsed.included[0].type == 'people'
+        assert parsed.as_data() == example_response
+
+
+class TestSchemaAlternativeWrapper:
+    def test_dispatches_on_structure(self):
+        wrapper = jsonapi_requests.data.Relationship.schema['data']
+        assert isinstance(wrapper.from_data({'id': '1', 'type': 'x'}), jsonapi_requests.data.ResourceIdentifier)
+        assert isinstance(wrapper.from_data([{'id': '1', 'type': 'x'}]), jsonapi_requests.data.List)
+        assert wrapper.from_data(None) == jsonapi_requests.data.ResourceIdentifier()
+
+    def test_parses_data_once(self):
+        with mock.patch.object(
+            jsonapi_requests.data.ResourceIdentifier, 'from_data',
+            wraps=jsonapi_requests.data.ResourceIdentifier.from_data,
+        ) as from_data:
+            jsonapi_requests.data.Relationship.from_data({'data': {'id': '1', 'type': 'x'}})
+        assert from_data.call_count == 1
+
+    def test_raises_when_no_alternative_matches(self):
+        with pytest.raises(jsonapi_requests.data.CantLoadData):
+            jsonapi_requests.data.Relationship.from_data({'data': 1})
+
+
+class TestRecord:
+    def test_subclass_with_extended_schema(self):
+        class ExtendedIdentifier(jsonapi_requests.data.ResourceIdentifier):
+            schema = dict(jsonapi_requests.data.ResourceIdentifier.schema, meta=jsonapi_requests.data.Dictionary)
+
+            def __init__(self, *, meta=None, **kwargs):
+                super().__init__(**kwargs)
+                self.meta = meta
+
+        jsonapi_requests.data.ResourceIdentifier.from_data({'id': '1', 'type': 'x'})
+        parsed = ExtendedIdentifier.from_data({'id': '1', 'type': 'x', 'meta': {'a': 1}})
+        assert parsed.meta.as_data() == {'a': 1}
+        assert parsed.as_data() == {'id': '1', 'type': 'x', 'meta': {'a': 1}}
+        reparsed = jsonapi_requests.data.ResourceIdentifier.from_data(parsed.as_data())
+        assert reparsed.as_data() == {'id': '1', 'type': 'x'}
+
+    def test_raises_for_non_mapping(self):
+        with pytest.raises(jsonapi_requests.data.CantLoadData):
+            jsonapi_requests.data.ResourceIdentifier.from_data(['x'])
+
+    def test_records_have_no_instance_dict(self):
+        parsed = jsonapi_requests.data.JsonApiResponse.from_data(example_response)
+        for record in [parsed, parsed.data[0], parsed.data[0].relationships['author'], parsed.included[0]]:
+            assert not hasattr(record, '__dict__')
+
+    def test_empty_collections_are_allocated_on_access(self):
+        parsed = jsonapi_requests.data.JsonApiObject.from_data({'id': '1', 'type': 'x'})
+        assert parsed._links is None
+        assert parsed.as_data() == {'id': '1', 'type': 'x'}
+        assert not parsed.links
+        parsed.links['self'] = 'http://example.com/x/1'
+        assert parsed.as_data() == {'id': '1', 'type': 'x', 'links': {'self': 'http://example.com/x/1'}}
+
+
+class TestDictionaryView:
+    def test_wraps_payload_without_copying(self):
+        payload = {'id': '1', 'type': 'x', 'attributes': {'name': 'a'}}
+        parsed = jsonapi_requests.data.JsonApiObjectView.from_data(payload)
+        assert parsed.attributes.data is payload['attributes']
+        assert parsed.attributes['name'] == 'a'
+        assert dict(parsed.attributes) == {'name': 'a'}
+
+    def test_copies_payload_on_write(self):
+        payload = {'id': '1', 'type': 'x', 'attributes': {'name': 'a'}}
+        parsed = jsonapi_requests.data.JsonApiObjectView.from_data(payload)
+        parsed.attributes['name'] = 'b'
+        del parsed.attributes['name']
+        parsed.attributes['other'] = 'c'
+        assert payload == {'id': '1', 'type': 'x', 'attributes': {'name': 'a'}}
+        assert parsed.as_data() == {'id': '1', 'type': 'x', 'attributes': {'other': 'c'}}
+
+    def test_parses_relationships_when_accessed(self):
+        payload = {'id': '1', 'type': 'x', 'relationships': {'y': {'data': {'id': '2', 'type': 'y'}}}}
+        parsed = jsonapi_requests.data.JsonApiObjectView.from_data(payload)
+        assert parsed.relationships['y'].data.id == '2'
+        assert parsed.relationships['y'] is parsed.relationships['y']
+        assert payload['relationships']['y'] == {'data': {'id': '2', 'type': 'y'}}
+
+    def test_keeps_example(self):
+        parsed = jsonapi_requests.data.JsonApiResponseView.from_data(example_response)
+        assert isinstance(parsed.data[0], jsonapi_requests.data.JsonApiObject)
+        assert parsed.as_data() == example_response
+
+
+class TestInterning:
+    document = {
+        'data': [
+            {'type': 'x', 'id': '1', 'relationships': {'y': {'data': {'type': 'y', 'id': '1'}}}},
+            {'type': 'x', 'id': '2', 'relationships': {'y': {'data': [{'type': 'y', 'id': '1'}]}}},
+        ],
+        'included': [{'type': 'y', 'id': '1'}],
+    }
+
+    def test_identifiers_are_shared_in_response(self):
+        with jsonapi_requests.data.interning():
+            parsed = jsonapi_requests.data.JsonApiResponse.from_data(self.document)
+        first = parsed.data[0].relationships['y'].data
+        assert first is parsed.data[1].relationships['y'].data[0]
+        assert first.type is parsed.included[0].type
+        assert isinstance(first, jsonapi_requests.data.ResourceIdentifier)
+        assert parsed.as_data() == self.document
+
+    def test_shared_identifiers_are_read_only(self):
+        with jsonapi_requests.data.interning():
+            parsed = jsonapi_requests.data.JsonApiResponse.from_data(self.document)
+        with pytest.raises(AttributeError):
+            parsed.data[0].relationships['y'].data.id = '10'
+        parsed.data[0].relationships['y'].data = jsonapi_requests.data.ResourceIdentifier(type='y', id='10')
+        assert parsed.data[1].relationships['y'].data[0].id == '1'
+
+    def test_identifiers_are_not_shared_by_default(self):
+        parsed = jsonapi_requests.data.JsonApiResponse.from_data(self.document)
+        first = parsed.data[0].relationships['y'].data
+        assert first is not parsed.data[1].relationships['y'].data[0]
+        first.id = '10'
+        assert parsed.data[1].relationships['y'].data[0].id == '1'
+
+    def test_identifiers_are_not_shared_between_responses(self):
+        with jsonapi_requests.data.interning():
+            first = jsonapi_requests.data.JsonApiResponse.from_data(self.document)
+        with jsonapi_requests.data.interning():
+            second = jsonapi_requests.data.JsonApiResponse.from_data(self.document)
+        assert first.data[0].relationships['y'].data is not second.data[0].relationships['y'].data
+
+    def test_identifiers_are_shared_in_view(self):
+        with jsonapi_requests.data.interning():
+            parsed = jsonapi_requests.data.JsonApiResponseView.from_data(self.document)
+        assert parsed.data[0].relationships['y'].data is parsed.data[1].relationships['y'].data[0]
+
+    def test_identifiers_are_not_shared_outside_response(self):
+        relationship = {'data': {'type': 'y', 'id': '1'}}
+        first = jsonapi_requests.data.Relationship.from_data(relationship)
+        assert first.data is not jsonapi_requests.data.Relationship.from_data(relationship).data
+
+    def test_unhashable_id(self):
+        with jsonapi_requests.data.interning():
+            identifier = jsonapi_requests.data.ResourceIdentifier.from_data({'type': 'y', 'id': ['1']})
+        assert identifier.id == ['1']
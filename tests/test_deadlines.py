@@ -0,0 +1,110 @@
+import time
+
+from unittest import mock
+
+import pytest
+import requests
+
+from jsonapi_requests import base
+from jsonapi_requests import deadlines
+from jsonapi_requests import orm
+from jsonapi_requests import request_factory
+from tests.helpers import make_factory
+from tests.helpers import make_response
+
+
+def test_split_timeouts(request_mock):
+    request_mock.return_value = make_response(200)
+    make_factory(CONNECT_TIMEOUT=0.5, READ_TIMEOUT=5).get('test')
+    assert request_mock.call_args.kwargs['timeout'] == (0.5, 5)
+
+
+def test_read_timeout_falls_back_to_timeout(request_mock):
+    request_mock.return_value = make_response(200)
+    make_factory(TIMEOUT=2, CONNECT_TIMEOUT=0.5).get('test')
+    assert request_mock.call_args.kwargs['timeout'] == (0.5, 2)
+
+
+def test_deadline_context():
+    assert deadlines.get_remaining() is None
+    with deadlines.deadline(10):
+        assert 9 < deadlines.get_remaining() <= 10
+        with deadlines.deadline(20):
+            assert deadlines.get_remaining() <= 10
+        with deadlines.deadline(1):
+            assert deadlines.get_remaining() <= 1
+    assert deadlines.get_remaining() is None
+
+
+def test_clamp_timeout():
+    assert deadlines.clamp_timeout(5, None) == 5
+    assert deadlines.clamp_timeout(5, 2) == 2
+    assert deadlines.clamp_timeout(None, 2) == 2
+    assert deadlines.clamp_timeout((0.5, 5), 2) == (0.5, 2)
+
+
+def test_deadline_clamps_timeout(request_mock):
+    request_mock.return_value = make_response(200)
+    make_factory(CONNECT_TIMEOUT=0.5, READ_TIMEOUT=5).get('test', deadline=2)
+    connect_timeout, read_timeout = request_mock.call_args.kwargs['timeout']
+    assert connect_timeout == 0.5
+    assert 1.5 < read_timeout <= 2
+
+
+def test_configured_deadline(request_mock):
+    request_mock.return_value = make_response(200)
+    make_factory(TIMEOUT=5, DEADLINE=2).get('test')
+    assert request_mock.call_args.kwargs['timeout'] <= 2
+
+
+def test_expired_deadline_is_not_sent(request_mock):
+    with deadlines.deadline(-1):
+        with pytest.raises(request_factory.ApiDeadlineExceededError):
+            make_factory().get('test')
+    assert request_mock.call_count == 0
+
+
+def test_timeout_after_deadline_is_deadline_error(request_mock):
+    def slow_request(*args, **kwargs):
+        time.sleep(0.05)
+        raise requests.Timeout
+
+    request_mock.side_effect = slow_request
+    with pytest.raises(request_factory.ApiDeadlineExceededError):
+        make_factory(RETRIES=3).get('test', deadline=0.01)
+    assert request_mock.call_count == 1
+
+
+def test_retry_is_not_started_when_wait_exceeds_deadline(request_mock, sleep_mock):
+    request_mock.side_effect = [
+        mock.Mock(status_code=503, headers={'Retry-After': '3'}, content=b'{}'), make_response(200)]
+    with pytest.raises(request_factory.ApiInternalServerError):
+        make_factory(RETRIES=3).get('test', deadline=2)
+    assert request_mock.call_count == 1
+    assert sleep_mock.call_count == 0
+
+
+def test_retries_within_deadline(request_mock, sleep_mock):
+    request_mock.side_effect = [make_response(500), make_response(200)]
+    assert make_factory(RETRIES=3).get('test', deadline=2).status_code == 200
+    assert request_mock.call_count == 2
+
+
+def test_deadline_is_inherited_by_orm_loads(request_mock):
+    request_mock.return_value = make_response(200, {
+        'data': {'type': 'test', 'id': '1', 'attributes': {'name': 'alice'}},
+    })
+    orm_api = orm.OrmApi(base.Api.config({'API_ROOT': 'http://testing', 'TIMEOUT': 5}))
+
+    class Test(orm.ApiModel):
+        class Meta:
+            type = 'test'
+            api = orm_api
+
+        name = orm.AttributeField('name')
+
+    with deadlines.deadline(2):
+        assert Test.from_id('1').name == 'alice'
+    assert request_mock.call_args.kwargs['timeout'] <= 2
+    Test.from_id('1').refresh(deadline=1)
+    assert request_mock.call_args.kwargs['timeout'] <= 1
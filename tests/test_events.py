@@ -0,0 +1,97 @@
+import pytest
+
+from jsonapi_requests import base
+from jsonapi_requests import events
+from jsonapi_requests import orm
+from jsonapi_requests import transport
+
+
+@pytest.fixture
+def recorded_events():
+    recorded = []
+    events.add_listener(recorded.append)
+    yield recorded
+    events.remove_listener(recorded.append)
+
+
+@pytest.fixture
+def memory_transport():
+    memory_transport = transport.InMemoryTransport()
+    memory_transport.add('GET', 'http://testing/car/', {
+        'data': [{'type': 'car', 'id': '1', 'relationships': {'driver': {'data': {'type': 'driver', 'id': '2'}}}}],
+        'included': [{'type': 'driver', 'id': '2', 'attributes': {'name': 'alice'}}],
+    })
+    memory_transport.add('GET', 'http://testing/car/1/', {'data': {'type': 'car', 'id': '1'}})
+    return memory_transport
+
+
+def test_request_events(recorded_events, memory_transport):
+    api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport})
+    api.endpoint('car/1').get().content
+    assert [event.phase for event in recorded_events] == [
+        events.REQUEST_START, events.FIRST_BYTE, events.BODY_READ, events.DECODE, events.REQUEST_END, events.PARSE]
+    body_read = recorded_events[2]
+    assert body_read.method == 'GET'
+    assert body_read.path == 'car/{id}'
+    assert body_read.status_code == 200
+    assert body_read.retries == 0
+    assert body_read.size == len(b'{"data": {"type": "car", "id": "1"}}')
+    assert body_read.duration >= 0
+
+
+def test_retries_are_counted(recorded_events):
+    memory_transport = transport.InMemoryTransport()
+    memory_transport.add('GET', 'http://testing/car/', {}, status_code=500)
+    api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport, 'RETRIES': 3})
+    with pytest.raises(Exception):
+        api.endpoint('car').get()
+    starts = [event for event in recorded_events if event.phase == events.REQUEST_START]
+    assert [event.retries for event in starts] == [0, 1, 2]
+
+
+def test_orm_events(recorded_events, memory_transport):
+    orm_api = orm.OrmApi.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport})
+
+    class Driver(orm.ApiModel):
+        class Meta:
+            type = 'driver'
+            api = orm_api
+
+    class Car(orm.ApiModel):
+        class Meta:
+            type = 'car'
+            api = orm_api
+
+        driver = orm.RelationField('driver')
+
+    Car.get_list()
+    assert [event.phase for event in recorded_events][-2:] == [events.HYDRATE, events.POPULATE]
+    assert all(event.path == 'car' for event in recorded_events)
+
+
+def test_no_events_without_listeners(memory_transport, monkeypatch):
+    monkeypatch.setattr(events, 'emit', None)
+    api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport})
+    api.endpoint('car/1').get().content
+
+
+def test_path_template():
+    assert events.get_path_template('car/12') == 'car/{id}'
+    assert events.get_path_template('http://testing/car/?page=2') == '/car/'
+    assert events.get_path_template('car/0c5a3e3e-8c1f-4f4e-9d43-6a0f4b4e2c11/driver') == 'car/{id}/driver'
+
+
+def test_request_context_is_reset(recorded_events, memory_transport):
+    memory_transport.add('POST', 'http://testing/car/', {}, status_code=400)
+    memory_transport.add('GET', 'http://testing/driver/', {}, status_code=500)
+    api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport, 'RETRIES': 1})
+    with pytest.raises(Exception):
+        api.endpoint('car').post()
+    assert events.current_request.get() is None
+    del recorded_events[:]
+    with pytest.raises(Exception):
+        api.endpoint('driver').stream()
+    assert [event.phase for event in recorded_events] == [
+        events.REQUEST_START, events.FIRST_BYTE, events.ERROR, events.REQUEST_END]
+    assert all(event.method == 'GET' and event.path == 'driver' for event in recorded_events)
+    assert recorded_events[-1].error == 'ApiInternalServerError'
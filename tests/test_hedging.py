@@ -0,0 +1,107 @@
+import threading
+import time
+
+import pytest
+
+from jsonapi_requests import base
+from jsonapi_requests import hedging
+from jsonapi_requests import transport
+
+
+class SlowTransport(transport.InMemoryTransport):
+    def __init__(self, delays):
+        super().__init__()
+        self.delays = list(delays)
+        self.lock = threading.Lock()
+        self.add('GET', 'http://testing/test/', {'data': {'type': 'test', 'id': '1'}})
+        self.add('POST', 'http://testing/test/', {'data': {'type': 'test', 'id': '1'}})
+
+    def request(self, method, url, **options):
+        with self.lock:
+            delay = self.delays.pop(0) if self.delays else 0
+        time.sleep(delay)
+        if delay is None:
+            raise transport.TransportError
+        return super().request(method, url, **options)
+
+
+def make_api(memory_transport, **config):
+    return base.Api.config(dict({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport}, **config))
+
+
+def test_hedge_wins_over_slow_request():
+    memory_transport = SlowTransport([1, 0])
+    api = make_api(memory_transport, HEDGE_DELAY=0.05, HEDGE_MAX_RATIO=1)
+    start = time.monotonic()
+    response = api.endpoint('test').get()
+    assert time.monotonic() - start < 0.5
+    assert response.data.id == '1'
+    assert api.requests.hedging.hedged == 1
+    assert api.requests.hedging.hedge_wins == 1
+
+
+def test_fast_request_is_not_hedged():
+    memory_transport = SlowTransport([0])
+    api = make_api(memory_transport, HEDGE_DELAY=0.5, HEDGE_MAX_RATIO=1)
+    api.endpoint('test').get()
+    assert len(memory_transport.history) == 1
+    assert api.requests.hedging.hedged == 0
+
+
+def test_only_get_is_hedged():
+    memory_transport = SlowTransport([0.2])
+    api = make_api(memory_transport, HEDGE_DELAY=0.01, HEDGE_MAX_RATIO=1)
+    api.endpoint('test').post()
+    assert len(memory_transport.history) == 1
+
+
+def test_hedges_are_limited_by_ratio():
+    memory_transport = SlowTransport([0.1, 0] * 10)
+    api = make_api(memory_transport, HEDGE_DELAY=0.01, HEDGE_MAX_RATIO=0.5)
+    for _ in range(4):
+        api.endpoint('test').get()
+    assert api.requests.hedging.hedged == 2
+
+
+def test_failed_hedge_waits_for_primary():
+    memory_transport = SlowTransport([0.1, None])
+    api = make_api(memory_transport, HEDGE_DELAY=0.01, HEDGE_MAX_RATIO=1, RETRIES=1)
+    assert api.endpoint('test').get().data.id == '1'
+    assert api.requests.hedging.hedge_wins == 0
+
+
+def test_busy_pool_does_not_delay_primary():
+    hedger = hedging.Hedging(0.05, 1, max_workers=1)
+    hedger.executor.submit(time.sleep, 0.3)
+    start = time.monotonic()
+    assert hedger.run(time.sleep, 0.01) is None
+    assert time.monotonic() - start < 0.2
+    assert hedger.hedged == 0
+    hedger.close()
+
+
+def test_primary_requests_reuse_threads():
+    hedger = hedging.Hedging(0.5, 1, max_workers=4)
+    threads = [hedger.run(threading.current_thread) for _ in range(10)]
+    assert len(set(threads)) <= 4
+    assert threads[0].name.startswith('jsonapi-requests-primary')
+    hedger.close()
+
+
+def test_percentile_delay():
+    memory_transport = SlowTransport([0.001] * hedging.LatencyTracker.min_samples)
+    api = make_api(memory_transport, HEDGE_DELAY='p90', HEDGE_MAX_RATIO=1)
+    assert api.requests.hedging.delay is None
+    for _ in range(hedging.LatencyTracker.min_samples):
+        api.endpoint('test').get()
+    assert 0.001 <= api.requests.hedging.delay < 0.1
+    assert api.requests.hedging.hedged == 0
+
+
+def test_parse_percentile():
+    assert hedging.parse_percentile('p95') == 95
+    assert hedging.parse_percentile('P99.9') == 99.9
+    with pytest.raises(ValueError):
+        hedging.parse_percentile('95')
+    with pytest.raises(ValueError):
+        hedging.parse_percentile('p100')
@@ -0,0 +1,126 @@
+import threading
+import time
+
+import pytest
+
+from jsonapi_requests import base
+from jsonapi_requests import limiting
+from jsonapi_requests import request_factory
+from jsonapi_requests import resilience
+from jsonapi_requests import transport
+
+
+class ConcurrencyTrackingTransport(transport.InMemoryTransport):
+    def __init__(self, delay=0.02):
+        super().__init__()
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.add('GET', 'http://testing/test/', {'data': []})
+
+    def request(self, method, url, **options):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        return super().request(method, url, **options)
+
+
+def test_limiter_runs_waiters_by_priority():
+    limiter = limiting.Limiter(1)
+    assert limiter.acquire()
+    order = []
+
+    def wait(priority):
+        limiter.acquire(priority)
+        order.append(priority)
+        limiter.release(0)
+
+    threads = [threading.Thread(target=wait, args=(priority,)) for priority in [limiting.LOW, limiting.HIGH]]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.02)
+    assert limiter.stats.queued == 2
+    limiter.release(0)
+    for thread in threads:
+        thread.join()
+    assert order == [limiting.HIGH, limiting.LOW]
+    stats = limiter.stats
+    assert stats.in_flight == 0
+    assert stats.queued == 0
+    assert stats.waits == 2
+    assert stats.max_wait_time > 0
+
+
+def test_limiter_acquire_timeout():
+    limiter = limiting.Limiter(1)
+    assert limiter.acquire()
+    assert not limiter.acquire(timeout=0.01)
+    assert limiter.stats.queued == 0
+    limiter.release(0)
+    assert limiter.acquire(timeout=0.01)
+
+
+def test_aimd_limiter():
+    limiter = limiting.AimdLimiter(10)
+    limiter.acquire()
+    limiter.release(0.1, overloaded=True)
+    assert limiter.stats.limit == 5
+    limiter.acquire()
+    limiter.release(1)
+    assert limiter.stats.limit == 2
+    for _ in range(20):
+        limiter.acquire()
+        limiter.release(0.1)
+    assert limiter.stats.limit > 2
+    for _ in range(1000):
+        limiter.acquire()
+        limiter.release(0.1)
+    assert limiter.stats.limit == 10
+
+
+def test_requests_are_limited_per_host():
+    memory_transport = ConcurrencyTrackingTransport()
+    api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport, 'CONCURRENCY_LIMIT': 2})
+    responses = api.endpoint('test').get_many([{'page': page} for page in range(6)])
+    assert all(isinstance(response, request_factory.ApiResponse) for response in responses)
+    assert memory_transport.max_in_flight == 2
+    stats = api.requests.limiters.stats()
+    assert stats['testing'].in_flight == 0
+    assert stats['testing'].waits >= 4
+
+
+def test_adaptive_limit_reacts_to_overload():
+    memory_transport = ConcurrencyTrackingTransport(delay=0)
+    memory_transport.add('GET', 'http://testing/busy/', {}, status_code=503)
+    api = base.Api.config({
+        'API_ROOT': 'http://testing',
+        'TRANSPORT': memory_transport,
+        'CONCURRENCY_LIMIT': 8,
+        'CONCURRENCY_LIMIT_ADAPTIVE': True,
+        'RETRIES': 1,
+    })
+    with pytest.raises(request_factory.ApiInternalServerError):
+        api.endpoint('busy').get()
+    assert api.requests.limiters.stats()['testing'].limit == 4
+
+
+def test_waiting_for_limit_respects_deadline():
+    memory_transport = ConcurrencyTrackingTransport(delay=0.2)
+    api = base.Api.config({
+        'API_ROOT': 'http://testing',
+        'TRANSPORT': memory_transport,
+        'CONCURRENCY_LIMIT': 1,
+        'CIRCUIT_BREAKER_THRESHOLD': 1,
+    })
+    thread = threading.Thread(target=api.endpoint('test').get)
+    thread.start()
+    time.sleep(0.05)
+    with pytest.raises(request_factory.ApiDeadlineExceededError):
+        api.endpoint('test').get(deadline=0.05, priority=limiting.HIGH)
+    thread.join()
+    assert api.requests.circuit_breakers.get('testing').state == resilience.CircuitBreaker.CLOSED
+    assert api.requests.limiters.stats()['testing'].in_flight == 0
@@ -0,0 +1,100 @@
+import pytest
+
+from jsonapi_requests import base
+from jsonapi_requests import cache
+from jsonapi_requests import data
+from jsonapi_requests import metrics
+from jsonapi_requests import orm
+from jsonapi_requests import request_factory
+from jsonapi_requests import transport
+
+
+@pytest.fixture
+def registry():
+    registry = metrics.Registry()
+    registry.install()
+    yield registry
+    registry.uninstall()
+
+
+@pytest.fixture
+def memory_transport():
+    memory_transport = transport.InMemoryTransport()
+    memory_transport.add('GET', 'http://testing/car/1/', {
+        'data': {'type': 'car', 'id': '1', 'attributes': {'color': 'red'}},
+    })
+    memory_transport.add('GET', 'http://testing/broken/', {}, status_code=500)
+    memory_transport.add('POST', 'http://testing/car/', {'data': {'type': 'car', 'id': '2'}}, status_code=201)
+    return memory_transport
+
+
+def get_value(snapshot, name, **labels):
+    return next(sample for sample in snapshot[name] if sample['labels'] == labels)
+
+
+def test_request_metrics(registry, memory_transport):
+    api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport, 'RETRIES': 2})
+    api.endpoint('car/1').get()
+    api.endpoint('car/1').get()
+    api.endpoint('car').post(object=data.JsonApiObject(type='car'))
+    with pytest.raises(request_factory.ApiInternalServerError):
+        api.endpoint('broken').get()
+    snapshot = registry.snapshot()
+    assert get_value(
+        snapshot, 'jsonapi_requests_requests_total', method='GET', path='car/{id}', status='200')['value'] == 2
+    assert get_value(
+        snapshot, 'jsonapi_requests_requests_total', method='GET', path='broken', status='500')['value'] == 1
+    duration = get_value(
+        snapshot, 'jsonapi_requests_request_duration_seconds', method='GET', path='car/{id}', status='200')
+    assert duration['count'] == 2
+    assert duration['buckets'][10] == 2
+    assert get_value(snapshot, 'jsonapi_requests_retries_total', method='GET', path='broken')['value'] == 1
+    assert get_value(
+        snapshot, 'jsonapi_requests_errors_total', method='GET', path='broken', error='ApiInternalServerError',
+    )['value'] == 2
+    request_body = api.requests.config.JSON_CODEC.dumps({'data': {'type': 'car'}})
+    assert get_value(
+        snapshot, 'jsonapi_requests_sent_bytes_total', method='POST', path='car')['value'] == len(request_body)
+    assert get_value(snapshot, 'jsonapi_requests_received_bytes_total', method='GET', path='car/{id}')['value'] > 0
+
+
+def test_cache_metrics(registry, memory_transport):
+    memory_transport.add(
+        'GET', 'http://testing/car/', {'data': []}, headers={'Cache-Control': 'max-age=60'})
+    api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport, 'CACHE': cache.MemoryBackend()})
+    api.endpoint('car').get()
+    api.endpoint('car').get()
+    snapshot = registry.snapshot()
+    assert get_value(snapshot, 'jsonapi_requests_cache_hits_total', path='car')['value'] == 1
+    assert get_value(snapshot, 'jsonapi_requests_cache_misses_total', path='car')['value'] == 1
+
+
+def test_stub_refresh_metrics(registry, memory_transport):
+    orm_api = orm.OrmApi.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport})
+
+    class Car(orm.ApiModel):
+        class Meta:
+            type = 'car'
+            api = orm_api
+
+        color = orm.AttributeField('color')
+
+    assert Car.from_id('1').color == 'red'
+    assert get_value(registry.snapshot(), 'jsonapi_requests_stub_refreshes_total', path='car/{id}')['value'] == 1
+
+
+def test_prometheus_format(registry, memory_transport):
+    api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport})
+    api.endpoint('car/1').get()
+    text = registry.to_prometheus()
+    assert '# TYPE jsonapi_requests_requests_total counter\n' in text
+    assert 'jsonapi_requests_requests_total{method="GET",path="car/{id}",status="200"} 1\n' in text
+    assert (
+        'jsonapi_requests_request_duration_seconds_bucket{method="GET",path="car/{id}",status="200",le="+Inf"} 1\n'
+        in text
+    )
+    assert 'jsonapi_requests_request_duration_seconds_count{method="GET",path="car/{id}",status="200"} 1\n' in text
+
+
+def test_escape():
+    assert metrics.format_labels({'path': 'a"b\\c\nd'}) == '{path="a\\"b\\\\c\\nd"}'
@@ -2,9 +2,11 @@ from unittest import mock
 
 import pytest
 
+from jsonapi_requests import cache
 from jsonapi_requests import data
 from jsonapi_requests import orm
 from jsonapi_requests import request_factory
+from jsonapi_requests import transport
 
 
 class TestApiModel:
@@ -340,6 +342,104 @@ class TestApiModel:
             }),
         )
 
+    def test_saving_updated_sends_only_changed_members(self):
+        mock_api = mock.MagicMock()
+        mock_api.endpoint.return_value.patch.return_value.status_code = 204
+        orm_api = orm.OrmApi(mock_api)
+
+        class Design(orm.ApiModel):
+            class Meta:
+                type = 'designs'
+                api = orm_api
+
+            name = orm.AttributeField('name')
+            status = orm.AttributeField('status')
+            parent = orm.RelationField('parent')
+            others = orm.RelationField('others')
+
+        design = Design.from_response_content(data.JsonApiResponse.from_data({'data': {
+            'id': '1',
+            'type': 'designs',
+            'attributes': {'name': 'doctor_x', 'status': 'draft'},
+            'relationships': {
+                'parent': {'data': {'type': 'designs', 'id': '2'}},
+                'others': {'data': [{'type': 'designs', 'id': '3'}]},
+            },
+        }}))
+        design.status = 'complete'
+        design.parent = Design.from_id('4')
+        assert design.is_changed
+        design.save()
+        mock_api.endpoint.return_value.patch.assert_called_once_with(
+            object=data.JsonApiObject.from_data({
+                'id': '1',
+                'type': 'designs',
+                'attributes': {'status': 'complete'},
+                'relationships': {'parent': {'data': {'type': 'designs', 'id': '4'}}},
+            }),
+        )
+        assert not design.is_changed
+        assert design.name == 'doctor_x'
+
+    def test_saving_unchanged_skips_request(self):
+        mock_api = mock.MagicMock()
+        orm_api = orm.OrmApi(mock_api)
+
+        class Design(orm.ApiModel):
+            class Meta:
+                type = 'designs'
+                api = orm_api
+
+            name = orm.AttributeField('name')
+
+        design = Design.from_response_content(data.JsonApiResponse.from_data({'data': {
+            'id': '1', 'type': 'designs', 'attributes': {'name': 'doctor_x'},
+        }}))
+        design.save()
+        assert not mock_api.endpoint.return_value.patch.called
+
+    def test_saving_object_created_from_raw_object_sends_all_members(self):
+        mock_api = mock.MagicMock()
+        mock_api.endpoint.return_value.patch.return_value.status_code = 204
+        orm_api = orm.OrmApi(mock_api)
+
+        class Design(orm.ApiModel):
+            class Meta:
+                type = 'designs'
+                api = orm_api
+
+            name = orm.AttributeField('name')
+            parent = orm.RelationField('parent')
+
+        raw_object = data.JsonApiObject.from_data({
+            'id': '1',
+            'type': 'designs',
+            'attributes': {'name': 'doctor_x'},
+            'relationships': {'parent': {'data': {'type': 'designs', 'id': '2'}}},
+        })
+        design = Design(raw_object=raw_object)
+        assert design.is_changed
+        design.save()
+        mock_api.endpoint.return_value.patch.assert_called_once_with(object=raw_object)
+        assert not design.is_changed
+
+    def test_changes_are_cleared_when_object_is_reloaded(self):
+        orm_api = orm.OrmApi(mock.MagicMock())
+
+        class Design(orm.ApiModel):
+            class Meta:
+                type = 'designs'
+                api = orm_api
+
+            name = orm.AttributeField('name')
+
+        response_content = data.JsonApiResponse.from_data({'data': {'id': '1', 'type': 'designs'}})
+        design = Design.from_response_content(response_content)
+        design.name = 'doctor_x'
+        assert design.is_changed
+        design.update_from_response_content(response_content)
+        assert not design.is_changed
+
     def test_getting_list(self):
         mock_api = mock.MagicMock()
         mock_api.endpoint.return_value.get.return_value.content.data = [mock.Mock(
@@ -463,3 +563,83 @@ class TestApiModel:
             name = orm.AttributeField(source='name')
 
         assert not Test.exists('123')
+
+
+class TestViewMode:
+    @pytest.fixture
+    def model(self):
+        memory_transport = transport.InMemoryTransport()
+        memory_transport.add('GET', 'http://testing/test/1/', {
+            'data': {
+                'type': 'test', 'id': '1',
+                'attributes': {'name': 'alice'},
+                'relationships': {'other': {'data': {'type': 'test', 'id': '2'}}},
+            },
+        }, headers={'Cache-Control': 'max-age=60'})
+        orm_api = orm.OrmApi.config({
+            'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport, 'CACHE': cache.MemoryBackend(),
+            'VIEW_MODE': True,
+        })
+
+        class Test(orm.ApiModel):
+            class Meta:
+                type = 'test'
+                api = orm_api
+
+            name = orm.AttributeField('name')
+            other = orm.RelationField('other')
+
+        return Test
+
+    def test_fields_are_read_from_payload(self, model):
+        test = model.from_id('1')
+        test.refresh()
+        assert isinstance(test.raw_object.attributes, data.DictionaryView)
+        assert test.name == 'alice'
+        assert test.other.id == '2'
+
+    def test_setting_fields_does_not_modify_cached_payload(self, model):
+        test = model.from_id('1')
+        test.refresh()
+        test.name = 'bob'
+        test.other = model.from_id('3')
+        cached = model.from_id('1')
+        cached.refresh()
+        assert cached.name == 'alice'
+        assert cached.other.id == '2'
+        assert test.raw_object.as_data() == {
+            'type': 'test', 'id': '1',
+            'attributes': {'name': 'bob'},
+            'relationships': {'other': {'data': {'type': 'test', 'id': '3'}}},
+        }
+
+
+def test_interning_keeps_relations_independent():
+    memory_transport = transport.InMemoryTransport()
+    memory_transport.add('GET', 'http://testing/car/', {
+        'data': [
+            {'type': 'car', 'id': str(id), 'relationships': {'driver': {'data': {'type': 'driver', 'id': '1'}}}}
+            for id in range(1, 3)
+        ],
+    })
+    orm_api = orm.OrmApi.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport, 'INTERNING': True})
+
+    class Driver(orm.ApiModel):
+        class Meta:
+            type = 'driver'
+            api = orm_api
+
+    class Car(orm.ApiModel):
+        class Meta:
+            type = 'car'
+            api = orm_api
+
+        driver = orm.RelationField('driver')
+
+    cars = Car.get_list()
+    assert cars[0].relationships['driver'].data is cars[1].relationships['driver'].data
+    with pytest.raises(AttributeError):
+        cars[0].relationships['driver'].data.id = '10'
+    cars[0].driver = Driver.from_id('10')
+    assert cars[0].relationships['driver'].data.id == '10'
+    assert cars[1].relationships['driver'].data.id == '1'
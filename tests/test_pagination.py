@@ -0,0 +1,167 @@
+import threading
+
+import pytest
+
+from jsonapi_requests import base
+from jsonapi_requests import orm
+from jsonapi_requests import request_factory
+from jsonapi_requests import transport
+from jsonapi_requests.orm import query_log
+
+
+@pytest.fixture
+def memory_transport():
+    memory_transport = transport.InMemoryTransport()
+    memory_transport.add('GET', 'http://testing/test/', {
+        'data': [{'type': 'test', 'id': '1'}],
+        'links': {'next': 'http://testing/test/?page[number]=2'},
+    }, params={'page[size]': 1})
+    memory_transport.add('GET', 'http://testing/test/', {
+        'data': [{'type': 'test', 'id': '2'}],
+        'links': {'next': {'href': 'http://testing/test/?page[number]=3'}},
+    }, params={'page[number]': 2})
+    memory_transport.add('GET', 'http://testing/test/', {
+        'data': [{'type': 'test', 'id': '3'}],
+        'links': {'next': None},
+    }, params={'page[number]': 3})
+    return memory_transport
+
+
+@pytest.mark.parametrize('prefetch', [0, 1, 3])
+def test_iter_pages(memory_transport, prefetch):
+    api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport})
+    pages = api.endpoint('test').iter_pages(prefetch=prefetch, params={'page[size]': 1})
+    assert [page.data[0].id for page in pages] == ['1', '2', '3']
+    assert len(memory_transport.history) == 3
+
+
+def test_iter_pages_prefetches_next_page(memory_transport):
+    api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport, 'PREFETCH_PAGES': 1})
+    pages = api.endpoint('test').iter_pages(params={'page[size]': 1})
+    next(pages)
+    for _ in range(100):
+        if len(memory_transport.history) == 2:
+            break
+        threading.Event().wait(0.01)
+    assert len(memory_transport.history) == 2
+    threading.Event().wait(0.2)
+    assert len(memory_transport.history) == 2
+    pages.close()
+
+
+def test_iter_pages_raises_error(memory_transport):
+    api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport})
+    pages = api.endpoint('missing').iter_pages()
+    with pytest.raises(request_factory.ApiClientError):
+        list(pages)
+
+
+def test_model_iter_all(memory_transport):
+    orm_api = orm.OrmApi.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport})
+
+    class Test(orm.ApiModel):
+        class Meta:
+            type = 'test'
+            api = orm_api
+
+    with query_log.QueryLog(action=None) as log:
+        assert [test.id for test in Test.iter_all(params={'page[size]': 1})] == ['1', '2', '3']
+    assert len(log) == 3
+
+
+class TestFetchAll:
+    @pytest.fixture
+    def offset_transport(self):
+        memory_transport = transport.InMemoryTransport()
+        for offset in range(0, 5, 2):
+            ids = [str(i) for i in range(offset, min(offset + 2, 5))]
+            memory_transport.add('GET', 'http://testing/test/', {
+                'data': [
+                    {'type': 'test', 'id': i, 'relationships': {'owner': {'data': {'type': 'owner', 'id': '1'}}}}
+                    for i in ids
+                ],
+                'included': [{'type': 'owner', 'id': '1', 'attributes': {'name': 'alice'}}],
+                'meta': {'total': 5},
+                'links': {'next': 'http://testing/test/?page[offset]={}&page[limit]=2'.format(offset + 2)},
+            }, params={'page[offset]': offset, 'page[limit]': 2})
+        memory_transport.add('GET', 'http://testing/test/', {
+            'data': [{'type': 'test', 'id': '0'}, {'type': 'test', 'id': '1'}],
+            'meta': {'total': 5},
+            'links': {'next': 'http://testing/test/?page[offset]=2&page[limit]=2'},
+        })
+        return memory_transport
+
+    def test_fetch_all_with_offset(self, offset_transport):
+        api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': offset_transport})
+        content = api.endpoint('test').fetch_all(params={'page[limit]': 2}, parallelism=2)
+        assert [item.id for item in content.data] == ['0', '1', '2', '3', '4']
+        assert len(content.included) == 1
+        assert len(offset_transport.history) == 3
+
+    def test_fetch_pages(self, offset_transport):
+        api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': offset_transport})
+        pages = api.endpoint('test').fetch_pages(params={'page[limit]': 2})
+        assert [[item.id for item in page.data] for page in pages] == [['0', '1'], ['2', '3'], ['4']]
+
+    def test_fetch_all_detects_pagination_from_next_link(self, offset_transport):
+        api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': offset_transport})
+        content = api.endpoint('test').fetch_all()
+        assert [item.id for item in content.data] == ['0', '1', '2', '3', '4']
+
+    def test_fetch_all_with_page_number(self):
+        memory_transport = transport.InMemoryTransport()
+        for number in range(1, 4):
+            memory_transport.add('GET', 'http://testing/test/', {
+                'data': [{'type': 'test', 'id': str(number)}],
+                'meta': {'page': {'total': 3}},
+                'links': {'next': 'http://testing/test/?page[number]={}&page[size]=1'.format(number + 1)},
+            }, params={'page[number]': number, 'page[size]': 1})
+        api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport})
+        content = api.endpoint('test').fetch_all(params={'page[number]': 1, 'page[size]': 1})
+        assert [item.id for item in content.data] == ['1', '2', '3']
+
+    def test_fetch_all_without_total_follows_links(self, memory_transport):
+        api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport})
+        content = api.endpoint('test').fetch_all(params={'page[size]': 1})
+        assert [item.id for item in content.data] == ['1', '2', '3']
+        assert len(memory_transport.history) == 3
+
+    def test_fetch_all_retries_failed_page(self, offset_transport):
+        api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': offset_transport, 'RETRIES': 1})
+        original_request = offset_transport.request
+        failures = []
+
+        def flaky_request(method, url, *, params=None, **options):
+            if params == {'page[offset]': 4, 'page[limit]': 2} and not failures:
+                failures.append(params)
+                raise transport.TransportError
+            return original_request(method, url, params=params, **options)
+
+        offset_transport.request = flaky_request
+        content = api.endpoint('test').fetch_all(params={'page[limit]': 2})
+        assert [item.id for item in content.data] == ['0', '1', '2', '3', '4']
+        assert len(failures) == 1
+
+    def test_model_fetch_all(self, offset_transport):
+        orm_api = orm.OrmApi.config({'API_ROOT': 'http://testing', 'TRANSPORT': offset_transport})
+
+        class Owner(orm.ApiModel):
+            class Meta:
+                type = 'owner'
+                api = orm_api
+
+            name = orm.AttributeField('name')
+
+        class Test(orm.ApiModel):
+            class Meta:
+                type = 'test'
+                api = orm_api
+
+            owner = orm.RelationField('owner')
+
+        with query_log.QueryLog(action=None) as log:
+            tests = Test.fetch_all(params={'page[limit]': 2})
+        assert len(log) == 3
+        assert [test.id for test in tests] == ['0', '1', '2', '3', '4']
+        assert tests[2].owner is tests[4].owner
+        assert tests[4].owner.name == 'alice'
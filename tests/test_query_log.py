@@ -0,0 +1,105 @@
+import warnings
+
+import pytest
+
+from jsonapi_requests import orm
+from jsonapi_requests import transport
+from jsonapi_requests.orm import query_log
+
+
+@pytest.fixture
+def models():
+    memory_transport = transport.InMemoryTransport()
+    memory_transport.add('GET', 'http://testing/car/', {
+        'data': [
+            {'type': 'car', 'id': str(id), 'relationships': {'driver': {'data': {'type': 'driver', 'id': str(id)}}}}
+            for id in range(1, 4)
+        ],
+    })
+    for id in range(1, 4):
+        memory_transport.add('GET', 'http://testing/driver/{}/'.format(id), {
+            'data': {'type': 'driver', 'id': str(id), 'attributes': {'name': 'driver {}'.format(id)}},
+        })
+    orm_api = orm.OrmApi.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport})
+
+    class Driver(orm.ApiModel):
+        class Meta:
+            type = 'driver'
+            api = orm_api
+
+        name = orm.AttributeField('name')
+
+    class Car(orm.ApiModel):
+        class Meta:
+            type = 'car'
+            api = orm_api
+
+        driver = orm.RelationField('driver')
+
+    return Car, Driver
+
+
+def test_queries_are_logged(models):
+    car_model, driver_model = models
+    with query_log.QueryLog(action=None) as log:
+        cars = car_model.get_list()
+        cars[0].driver.name
+        driver_model.from_id('2').refresh()
+    assert [(query.method, query.path, query.model) for query in log.queries] == [
+        ('GET', 'car', 'Car'),
+        ('GET', 'driver/1', 'Driver'),
+        ('GET', 'driver/2', 'Driver'),
+    ]
+    stub_refresh = log.queries[1]
+    assert stub_refresh.is_stub_refresh
+    assert stub_refresh.relation == query_log.Relation('Car', 'driver')
+    assert stub_refresh.stack[-1].filename == __file__
+    assert not log.queries[2].is_stub_refresh
+
+
+def test_n_plus_one_raises(models):
+    car_model, _ = models
+    with query_log.QueryLog():
+        cars = car_model.get_list()
+        cars[0].driver.name
+        with pytest.raises(query_log.NPlusOneError, match='Driver objects loaded one by one through Car.driver'):
+            cars[1].driver.name
+
+
+def test_n_plus_one_warns(models):
+    car_model, _ = models
+    with query_log.QueryLog(action='warn') as log:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            for car in car_model.get_list():
+                car.driver.name
+    assert len(caught) == 1
+    assert caught[0].category is query_log.QueryLogWarning
+    assert caught[0].filename == __file__
+    assert log.n_plus_one == {('Driver', query_log.Relation('Car', 'driver')): 3}
+
+
+def test_budget(models):
+    car_model, driver_model = models
+    with query_log.QueryLog(budget=2, n_plus_one_threshold=None):
+        car_model.get_list()
+        driver_model.from_id('1').refresh()
+        with pytest.raises(query_log.QueryBudgetExceededError):
+            driver_model.from_id('2').refresh()
+
+
+def test_nested_logs(models):
+    car_model, driver_model = models
+    with query_log.QueryLog(action=None) as outer_log:
+        car_model.get_list()
+        with query_log.QueryLog(action=None) as inner_log:
+            driver_model.from_id('1').refresh()
+    assert len(outer_log) == 2
+    assert len(inner_log) == 1
+
+
+def test_nothing_is_logged_outside_of_scope(models):
+    car_model, _ = models
+    for car in car_model.get_list():
+        car.driver.name
+    assert query_log.current_log.get() is None
@@ -1,3 +1,5 @@
+import json
+
 from unittest import mock
 
 import pytest
@@ -13,16 +15,10 @@ def api_configuration():
     return configuration.Factory({'API_ROOT': 'testing', 'RETRIES': 2}).create()
 
 
-@pytest.fixture
-def request_mock():
-    with mock.patch('requests.request') as mocked:
-        yield mocked
-
-
 @pytest.fixture
 def valid_response():
     response = mock.Mock(status_code=200)
-    response.json.return_value = {}
+    response.content = json.dumps({}).encode()
     return response
 
 
@@ -42,3 +38,71 @@ def test_reraises(api_configuration, request_mock, valid_response):
     request_mock.side_effect = [requests.Timeout, requests.Timeout, valid_response]
     with pytest.raises(request_factory.ApiConnectionError):
         request_factory.ApiRequestFactory(api_configuration).get('endpoint')
+
+
+def test_reuses_session_between_requests(api_configuration, request_mock, valid_response):
+    request_mock.return_value = valid_response
+    factory = request_factory.ApiRequestFactory(api_configuration)
+    session = factory.transport.session
+    factory.get('endpoint')
+    factory.get('endpoint')
+    assert factory.transport.session is session
+    assert request_mock.call_count == 2
+
+
+def test_configures_connection_pool():
+    config = configuration.Factory({'API_ROOT': 'testing', 'POOL_CONNECTIONS': 3, 'POOL_MAXSIZE': 7}).create()
+    factory = request_factory.ApiRequestFactory(config)
+    adapter = factory.transport.session.get_adapter('https://example.com')
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 7
+
+
+def test_disabled_keep_alive(request_mock, valid_response):
+    request_mock.return_value = valid_response
+    config = configuration.Factory({'API_ROOT': 'testing', 'KEEP_ALIVE': False}).create()
+    request_factory.ApiRequestFactory(config).get('endpoint')
+    args, kwargs = request_mock.call_args
+    assert kwargs['headers']['Connection'] == 'close'
+
+
+def test_closes_session_on_exit(api_configuration):
+    with mock.patch('requests.Session.close') as close_mock:
+        with request_factory.ApiRequestFactory(api_configuration):
+            pass
+    close_mock.assert_called_once_with()
+
+
+def test_preconnect():
+    config = configuration.Factory({'API_ROOT': 'http://testing', 'PRECONNECT': 2}).create()
+    with mock.patch('requests.Session.request') as request_mock:
+        request_mock.side_effect = requests.ConnectionError
+        request_factory.ApiRequestFactory(config)
+    assert request_mock.call_count == 2
+    request_mock.assert_called_with('HEAD', 'http://testing/', headers=mock.ANY, verify=True, timeout=1)
+
+
+def test_gather_keeps_request_order(api_configuration):
+    def fake_request(method, url, **kwargs):
+        if url.endswith('/2/'):
+            raise requests.ConnectionError
+        response = mock.Mock(status_code=200)
+        response.content = json.dumps({'data': {'type': 'test', 'id': url.rstrip('/').rsplit('/', 1)[-1]}}).encode()
+        return response
+
+    with mock.patch('requests.Session.request', side_effect=fake_request) as request_mock:
+        with request_factory.ApiRequestFactory(api_configuration) as factory:
+            results = factory.gather(request_factory.Call('test/{}'.format(i), 'GET', {}) for i in range(1, 4))
+    assert results[0].data.id == '1'
+    assert isinstance(results[1], request_factory.ApiConnectionError)
+    assert results[2].data.id == '3'
+    assert request_mock.call_count == 4
+
+
+def test_response_content_is_parsed_once():
+    response = request_factory.ApiResponse(200, {'data': {'type': 'test', 'id': '1'}})
+    with mock.patch.object(data.JsonApiResponse, 'from_data', wraps=data.JsonApiResponse.from_data) as from_data:
+        assert response.content is response.content
+        assert response.data is response.content.data
+    assert from_data.call_count == 1
+    assert response.copy().content is not response.content
@@ -0,0 +1,123 @@
+import time
+
+from unittest import mock
+
+import pytest
+
+from jsonapi_requests import request_factory
+from jsonapi_requests import resilience
+from jsonapi_requests import transport
+from tests.helpers import make_factory
+from tests.helpers import make_response
+
+
+def test_parse_retry_after():
+    assert resilience.parse_retry_after({'Retry-After': '5'}) == 5
+    assert resilience.parse_retry_after({'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}) == 0
+    assert resilience.parse_retry_after({'Retry-After': 'soon'}) is None
+    assert resilience.parse_retry_after({}) is None
+    assert resilience.parse_retry_after(None) is None
+
+
+def test_retries_immediately_by_default(request_mock, sleep_mock):
+    request_mock.side_effect = [make_response(500), make_response(200)]
+    make_factory().get('test')
+    assert request_mock.call_count == 2
+    assert all(call.args[0] == 0 for call in sleep_mock.call_args_list)
+
+
+def test_exponential_backoff(request_mock, sleep_mock):
+    request_mock.side_effect = [make_response(500), make_response(500), make_response(200)]
+    make_factory(RETRY_BACKOFF=0.5, RETRY_BACKOFF_MAX=2).get('test')
+    assert sleep_mock.call_count == 2
+    assert all(0 <= call.args[0] <= 2 for call in sleep_mock.call_args_list)
+
+
+def test_retries_too_many_requests_after_delay(request_mock, sleep_mock):
+    request_mock.side_effect = [make_response(429, headers={'Retry-After': '3'}), make_response(200)]
+    make_factory().get('test')
+    sleep_mock.assert_called_once_with(3)
+
+
+def test_does_not_retry_too_many_requests_without_retry_after(request_mock):
+    request_mock.return_value = make_response(429)
+    with pytest.raises(request_factory.ApiClientError):
+        make_factory().get('test')
+    assert request_mock.call_count == 1
+
+
+def test_does_not_wait_longer_than_max_backoff(request_mock, sleep_mock):
+    request_mock.return_value = make_response(503, headers={'Retry-After': '60'})
+    with pytest.raises(request_factory.ApiInternalServerError):
+        make_factory(RETRY_BACKOFF_MAX=10).get('test')
+    assert request_mock.call_count == 1
+    assert sleep_mock.call_count == 0
+
+
+def test_retry_budget(request_mock):
+    request_mock.return_value = make_response(500)
+    factory = make_factory(RETRY_BUDGET=0.5, RETRY_BUDGET_MIN_RETRIES=1, RETRIES=3)
+    for _ in range(3):
+        with pytest.raises(request_factory.ApiInternalServerError):
+            factory.get('test')
+    assert factory.retry_budget.requests == 3
+    assert factory.retry_budget.retries == 3
+    assert request_mock.call_count == 6
+
+
+class TestCircuitBreaker:
+    def test_opens_after_failures(self, request_mock):
+        request_mock.return_value = make_response(500)
+        factory = make_factory(CIRCUIT_BREAKER_THRESHOLD=2, RETRIES=1)
+        for _ in range(2):
+            with pytest.raises(request_factory.ApiInternalServerError):
+                factory.get('test')
+        with pytest.raises(request_factory.ApiCircuitOpenError):
+            factory.get('test')
+        assert request_mock.call_count == 2
+        assert factory.circuit_breakers.get('testing').state == resilience.CircuitBreaker.OPEN
+
+    def test_client_errors_do_not_open_circuit(self, request_mock):
+        request_mock.return_value = make_response(404)
+        factory = make_factory(CIRCUIT_BREAKER_THRESHOLD=1)
+        for _ in range(2):
+            with pytest.raises(request_factory.ApiClientError):
+                factory.get('test')
+        assert factory.circuit_breakers.get('testing').state == resilience.CircuitBreaker.CLOSED
+
+    def test_missed_deadline_does_not_open_circuit(self):
+        class SlowTransport(transport.InMemoryTransport):
+            def request(self, method, url, *, timeout=None, **options):
+                if timeout is not None and timeout < 0.3:
+                    time.sleep(timeout)
+                    raise transport.TransportError
+                return super().request(method, url, timeout=timeout, **options)
+
+        slow_transport = SlowTransport()
+        slow_transport.add('GET', 'http://testing/test/', {})
+        factory = make_factory(CIRCUIT_BREAKER_THRESHOLD=2, RETRIES=1, TRANSPORT=slow_transport)
+        for _ in range(2):
+            with pytest.raises(request_factory.ApiDeadlineExceededError):
+                factory.get('test', deadline=0.05)
+        assert factory.circuit_breakers.get('testing').state == resilience.CircuitBreaker.CLOSED
+        assert factory.get('test').status_code == 200
+
+    def test_half_open_allows_single_trial(self):
+        circuit_breaker = resilience.CircuitBreaker(failure_threshold=1, reset_timeout=10)
+        with mock.patch('time.monotonic', return_value=100):
+            circuit_breaker.record_failure()
+            assert not circuit_breaker.allow_request()
+        with mock.patch('time.monotonic', return_value=110):
+            assert circuit_breaker.state == resilience.CircuitBreaker.HALF_OPEN
+            assert circuit_breaker.allow_request()
+            assert not circuit_breaker.allow_request()
+            circuit_breaker.record_success()
+            assert circuit_breaker.state == resilience.CircuitBreaker.CLOSED
+
+    def test_failed_trial_opens_circuit_again(self):
+        circuit_breaker = resilience.CircuitBreaker(failure_threshold=5, reset_timeout=10)
+        circuit_breaker.opened_at = 0
+        with mock.patch('time.monotonic', return_value=10):
+            assert circuit_breaker.allow_request()
+            circuit_breaker.record_failure()
+            assert circuit_breaker.state == resilience.CircuitBreaker.OPEN
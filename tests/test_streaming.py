@@ -0,0 +1,133 @@
+import json
+
+import pytest
+import requests
+
+from jsonapi_requests import data
+from jsonapi_requests import orm
+from jsonapi_requests import request_factory
+from jsonapi_requests import streaming
+from jsonapi_requests import transport
+from tests.test_data import example_response
+
+
+def chunked(payload, chunk_size):
+    content = json.dumps(payload, indent=2).encode()
+    return [content[start:start + chunk_size] for start in range(0, len(content), chunk_size)]
+
+
+class TestStreamingJsonApiResponse:
+    @pytest.mark.parametrize('chunk_size', [1, 7, 1024])
+    def test_parses_example(self, chunk_size):
+        response = streaming.StreamingJsonApiResponse(200, chunked(example_response, chunk_size))
+        objects = list(response)
+        parsed = data.JsonApiResponse.from_data(example_response)
+        assert objects == list(parsed.data)
+        assert response.included == parsed.included
+        assert response.links == parsed.links
+
+    def test_parses_single_object(self):
+        payload = {'meta': {'count': 10}, 'data': {'type': 'test', 'id': '1', 'attributes': {'name': 'zażółć'}}}
+        response = streaming.StreamingJsonApiResponse(200, chunked(payload, 1))
+        assert list(response) == [data.JsonApiObject(type='test', id='1', attributes={'name': 'zażółć'})]
+        assert response.meta == {'count': 10}
+
+    def test_parses_numbers_split_between_chunks(self):
+        response = streaming.StreamingJsonApiResponse(200, [b'{"meta": 12', b'34, "data": [', b']}'])
+        assert list(response) == []
+        assert response.meta == 1234
+
+    def test_empty_body(self):
+        assert list(streaming.StreamingJsonApiResponse(204, [])) == []
+
+    def test_invalid_document(self):
+        with pytest.raises(ValueError):
+            list(streaming.StreamingJsonApiResponse(200, [b'{"data": [{"type": "test"} {}]}']))
+
+    def test_can_be_consumed_once(self):
+        response = streaming.StreamingJsonApiResponse(200, [b'{}'])
+        list(response)
+        with pytest.raises(streaming.StreamConsumedError):
+            list(response)
+
+
+@pytest.fixture
+def memory_transport():
+    return transport.InMemoryTransport()
+
+
+def test_endpoint_stream(memory_transport):
+    memory_transport.add('GET', 'http://testing/test/', {'data': [{'type': 'test', 'id': str(i)} for i in range(3)]})
+    orm_api = orm.OrmApi.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport})
+    response = orm_api.endpoint('test').stream(params={'page[size]': 3})
+    assert [item.id for item in response] == ['0', '1', '2']
+    assert memory_transport.history[0][3]['stream'] is True
+
+
+def test_endpoint_stream_raises_errors(memory_transport):
+    orm_api = orm.OrmApi.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport})
+    with pytest.raises(request_factory.ApiClientError):
+        orm_api.endpoint('test').stream()
+
+
+class BrokenResponse(transport.TransportResponse):
+    def iter_content(self, chunk_size=1):
+        yield self.content[:10]
+        raise requests.exceptions.ChunkedEncodingError
+
+
+class BrokenTransport(transport.RequestsTransport):
+    # noinspection PyMissingConstructor
+    def __init__(self):
+        pass
+
+    def request(self, method, url, **options):
+        return BrokenResponse(200, b'{"data": [{"type": "test", "id": "1"}]}')
+
+
+def test_endpoint_stream_raises_invalid_response_error_for_truncated_body(memory_transport):
+    memory_transport.add('GET', 'http://testing/test/', {'data': [{'type': 'test', 'id': '1'}]})
+    status_code, content, headers = memory_transport.fixtures['GET', 'http://testing/test/', ()]
+    memory_transport.fixtures['GET', 'http://testing/test/', ()] = (status_code, content[:-5], headers)
+    api = orm.OrmApi.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport})
+    with pytest.raises(request_factory.ApiInvalidResponseError):
+        list(api.endpoint('test').stream())
+
+
+def test_endpoint_stream_raises_connection_error_for_broken_body():
+    api = orm.OrmApi.config({'API_ROOT': 'http://testing', 'TRANSPORT': BrokenTransport()})
+    with pytest.raises(request_factory.ApiConnectionError):
+        list(api.endpoint('test').stream())
+
+
+@pytest.mark.parametrize('included_first', [True, False])
+def test_model_stream_list(memory_transport, included_first):
+    included = [{'type': 'person', 'id': '3', 'attributes': {'name': 'Kowalski'}}]
+    cars = [
+        {'type': 'car', 'id': '1', 'relationships': {'driver': {'data': {'type': 'person', 'id': '3'}}}},
+        {'type': 'car', 'id': '2', 'relationships': {'driver': {'data': {'type': 'person', 'id': '3'}}}},
+    ]
+    if included_first:
+        document = {'included': included, 'data': cars}
+    else:
+        document = {'data': cars, 'included': included}
+    memory_transport.add('GET', 'http://testing/car/', document)
+    orm_api = orm.OrmApi.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport})
+
+    class Person(orm.ApiModel):
+        class Meta:
+            type = 'person'
+            api = orm_api
+
+        name = orm.AttributeField('name')
+
+    class Car(orm.ApiModel):
+        class Meta:
+            type = 'car'
+            api = orm_api
+
+        driver = orm.RelationField('driver')
+
+    cars = Car.stream_list(params={'include': 'driver'})
+    assert [(car.id, car.driver.name) for car in cars] == [('1', 'Kowalski'), ('2', 'Kowalski')]
+    assert len(memory_transport.history) == 1
@@ -0,0 +1,83 @@
+import pytest
+
+from jsonapi_requests import base
+from jsonapi_requests import orm
+from jsonapi_requests import request_factory
+from jsonapi_requests import transport
+
+
+def test_in_memory_transport_serves_fixture():
+    memory_transport = transport.InMemoryTransport()
+    memory_transport.add('GET', 'http://testing/test/1/', {'data': {'type': 'test', 'id': '1'}})
+    api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport})
+    response = api.endpoint('test/1').get()
+    assert response.status_code == 200
+    assert response.data.id == '1'
+
+
+def test_in_memory_transport_matches_params():
+    memory_transport = transport.InMemoryTransport()
+    memory_transport.add('GET', 'http://testing/test/', {'data': []})
+    memory_transport.add('GET', 'http://testing/test/', {'data': [{'type': 'test', 'id': '2'}]}, params={'page': 2})
+    api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport})
+    assert len(api.endpoint('test').get().data) == 0
+    assert [item.id for item in api.endpoint('test').get(params={'page': 2}).data] == ['2']
+    assert [item.id for item in api.endpoint('test/?page=2').get().data] == ['2']
+    assert len(memory_transport.history) == 3
+
+
+def test_in_memory_transport_returns_not_found():
+    api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': transport.InMemoryTransport()})
+    with pytest.raises(request_factory.ApiClientError) as exception_info:
+        api.endpoint('test').get()
+    assert exception_info.value.status_code == 404
+
+
+def test_orm_with_in_memory_transport():
+    memory_transport = transport.InMemoryTransport()
+    memory_transport.add('GET', 'http://testing/car/2/', {
+        'data': {
+            'type': 'car', 'id': '2',
+            'relationships': {'driver': {'data': {'type': 'person', 'id': '3'}}},
+        },
+        'included': [{'type': 'person', 'id': '3', 'attributes': {'name': 'Kowalski'}}],
+    })
+    orm_api = orm.OrmApi.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport})
+
+    class Person(orm.ApiModel):
+        class Meta:
+            type = 'person'
+            api = orm_api
+
+        name = orm.AttributeField('name')
+
+    class Car(orm.ApiModel):
+        class Meta:
+            type = 'car'
+            api = orm_api
+
+        driver = orm.RelationField('driver')
+
+    assert Car.from_id('2').driver.name == 'Kowalski'
+    assert len(memory_transport.history) == 1
+
+
+def test_endpoint_get_many():
+    memory_transport = transport.InMemoryTransport()
+    for page in range(1, 4):
+        memory_transport.add(
+            'GET', 'http://testing/test/', {'data': [{'type': 'test', 'id': str(page)}]}, params={'page': page})
+    api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport, 'MAX_WORKERS': 2})
+    responses = api.endpoint('test').get_many([{'page': page} for page in range(1, 5)])
+    assert [response.data[0].id for response in responses[:3]] == ['1', '2', '3']
+    assert isinstance(responses[3], request_factory.ApiClientError)
+
+
+def test_api_gather():
+    memory_transport = transport.InMemoryTransport()
+    memory_transport.add('GET', 'http://testing/test/1/', {'data': {'type': 'test', 'id': '1'}})
+    memory_transport.add('GET', 'http://testing/other/2/', {'data': {'type': 'other', 'id': '2'}})
+    api = base.Api.config({'API_ROOT': 'http://testing', 'TRANSPORT': memory_transport})
+    responses = api.gather(['test/1', 'other/2'], headers={'X-Test': 'test'})
+    assert [response.data.type for response in responses] == ['test', 'other']
+    assert all(options['headers'] == {'X-Test': 'test'} for _, _, _, options in memory_transport.history)